@@ -38,19 +38,12 @@ class GrassmannInterpolation:
         self.tangent_points = GrassmannOperations.log_map(grassmann_points=manifold_data,
                                                           reference_point=self.mean)
 
-        if self.interpolation_method is Surrogate:
-            self.surrogates = [[]]
-            nargs = len(self.tangent_points)
-            n_rows = self.tangent_points[0].shape[0]
-            n_cols = self.tangent_points[0].shape[1]
-            for j in range(n_rows):
-                for k in range(n_cols):
-                    val_data = [[self.tangent_points[i][j, k]] for i in range(nargs)]
-                    # if all the elements of val_data are the same.
-                    val_data = np.array(val_data)
-                    self.surrogates[j][k] = copy.copy(self.interpolation_method)
-                    self.surrogates[j][k].fit(coordinates, val_data)
-
+        if isinstance(self.interpolation_method, Surrogate):
+            # A single surrogate is fitted to all entries of the tangent matrices, such that surrogates with multiple
+            # outputs (e.g. :class:`.GaussianProcessRegression`) share their hyperparameters and factorization.
+            val_data = np.array([tangent_point.flatten() for tangent_point in self.tangent_points])
+            self.surrogate = copy.copy(self.interpolation_method)
+            self.surrogate.fit(coordinates, val_data)
         else:
             self.coordinates = coordinates
 
@@ -60,10 +53,7 @@ class GrassmannInterpolation:
         :return: Interpolated point on the Grassmann manifold.
         """
 
-        shape_ref = np.shape(self.tangent_points[0])
-        interp_point = np.zeros(shape_ref)
-        n_rows = self.tangent_points[0].shape[0]
-        n_cols = self.tangent_points[0].shape[1]
+        interp_point = np.zeros(np.shape(self.tangent_points[0]))
 
         nargs = len(self.tangent_points)
         shape_ref = np.shape(self.tangent_points[0])
@@ -71,11 +61,9 @@ class GrassmannInterpolation:
             if np.shape(self.tangent_points[i]) != shape_ref:
                 raise TypeError("UQpy: Input matrices have different shape.")
 
-        if self.interpolation_method is Surrogate:
-            for j in range(n_rows):
-                for k in range(n_cols):
-                    y = self.surrogates[j][k].predict(point, return_std=False)
-                    interp_point[j, k] = y
+        if isinstance(self.interpolation_method, Surrogate):
+            y = self.surrogate.predict(np.atleast_2d(point), return_std=False)
+            interp_point = np.reshape(y, shape_ref)
         elif self.interpolation_method is callable:
             interp_point = self.interpolation_method(self.coordinates, self.tangent_points, point)
         else:
@@ -2,3 +2,4 @@ from UQpy.reliability.SubsetSimulation import SubsetSimulation
 from UQpy.reliability.taylor_series import *
 
 from . import TaylorSeries
+from UQpy.reliability.directional import *
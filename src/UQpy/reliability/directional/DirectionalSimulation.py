@@ -0,0 +1,120 @@
+from typing import Union, Optional
+
+import numpy as np
+import scipy.stats as stats
+from beartype import beartype
+
+from UQpy.run_model.RunModel import RunModel
+from UQpy.distributions import *
+from UQpy.transformations import Nataf
+from UQpy.reliability.directional.baseclass.DirectionalReliability import DirectionalReliability
+from UQpy.utilities.ValidationTypes import PositiveInteger, PositiveFloat, RandomStateType, NumpyFloatArray
+from UQpy.utilities.Utilities import process_random_state
+
+
+class DirectionalSimulation(DirectionalReliability):
+
+    @beartype
+    def __init__(
+        self,
+        distributions: Union[Distribution, list[Distribution]],
+        runmodel_object: RunModel,
+        nsamples: Optional[PositiveInteger] = None,
+        corr_x: Union[None, np.ndarray] = None,
+        corr_z: Union[None, np.ndarray] = None,
+        initial_radius: Optional[PositiveFloat] = None,
+        max_radius: Optional[PositiveFloat] = None,
+        tolerance: PositiveFloat = 1.0e-3,
+        max_iterations: PositiveInteger = 20,
+        random_state: RandomStateType = None,
+    ):
+        """
+        Estimate the probability of failure using Directional Simulation.
+
+        Directions :math:`\\mathbf{a}_i` are sampled uniformly on the unit hypersphere of the uncorrelated standard
+        normal space **U** and the distance :math:`r_i` of the limit state from the origin is found along each
+        direction. The conditional probability of failure of each direction is :math:`1 - F_{\\chi^2_n}(r_i^2)`. The
+        root searches of all directions are performed simultaneously, such that each iteration requires a single call
+        of the :meth:`.RunModel.run` method. The origin of **U** must lie in the safe domain.
+
+        :param distributions: Marginal probability distributions of each random variable. Must be an object of
+         type :class:`.DistributionContinuous1D` or :class:`.JointIndependent`.
+        :param runmodel_object: The computational model. It should be of type :class:`.RunModel`.
+        :param nsamples: Number of directions. If provided, the :meth:`run` method is automatically called.
+        :param corr_x: The correlation matrix (:math:`\\mathbf{C_X}`) of the random vector **X**.
+        :param corr_z: The correlation matrix (:math:`\\mathbf{C_Z}`) of the standard normal random vector **Z**.
+        :param initial_radius: Starting radius of the root search. Default: :math:`\\sqrt{n}`
+        :param max_radius: The root search along each direction is restricted to :math:`[0, r_{max}]`.
+         Default: :math:`\\sqrt{n} + 8`
+        :param tolerance: Convergence tolerance of the secant root search. Default: :math:`10^{-3}`
+        :param max_iterations: Maximum number of iterations (i.e. batched model calls) of the root search.
+         Default: :math:`20`
+        :param random_state: Random seed used to initialize the pseudo-random number generator. If an :any:`int` is
+         provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise, the
+         object itself can be passed directly.
+        """
+        super().__init__(Nataf(distributions=distributions, corr_z=corr_z, corr_x=corr_x), runmodel_object,
+                         tolerance=tolerance, max_iterations=max_iterations)
+        self.random_state = process_random_state(random_state)
+        self.initial_radius = np.sqrt(self.dimension) if initial_radius is None else float(initial_radius)
+        self.max_radius = np.sqrt(self.dimension) + 8.0 if max_radius is None else float(max_radius)
+
+        self.directions: NumpyFloatArray = None
+        """Sampled unit directions of shape ``(nsamples, n_dimensions)``."""
+        self.roots: NumpyFloatArray = None
+        """Distance :math:`r_i` of the limit state from the origin along each direction."""
+        self.direction_failure_probabilities: NumpyFloatArray = None
+        """Conditional probability of failure of each direction."""
+        self.failure_probability: float = None
+        """Probability of failure estimate."""
+        self.coefficient_of_variation: float = None
+        """Coefficient of variation of the probability of failure estimate."""
+        self._g_origin = None
+
+        if nsamples is not None:
+            self.run(nsamples=nsamples)
+
+    @beartype
+    def run(self, nsamples: PositiveInteger):
+        """
+        Perform the root searches along `nsamples` new directions. Each time the method is invoked the new directions
+        are appended to the existing ones and the probability of failure estimate is updated.
+
+        :param nsamples: Number of directions.
+        """
+        self.logger.info("UQpy: Running Directional Simulation with {0} directions...".format(nsamples))
+        if self._g_origin is None:
+            self._g_origin = self._evaluate(np.zeros((1, self.dimension)))[0]
+            if self._g_origin <= 0:
+                raise ValueError("UQpy: The origin of the standard normal space must lie in the safe domain.")
+
+        directions = self.random_state.normal(size=(nsamples, self.dimension))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        origins = np.zeros((nsamples, self.dimension))
+
+        roots, _, found = self._find_roots(origins, directions, np.zeros(nsamples),
+                                           np.full(nsamples, self._g_origin),
+                                           np.full(nsamples, self.initial_radius),
+                                           bounds=(0.0, self.max_radius))
+
+        direction_failure_probabilities = stats.chi2.sf(roots ** 2, df=self.dimension)
+        direction_failure_probabilities[~found] = 0.0
+
+        if self.directions is None:
+            self.directions = directions
+            self.roots = roots
+            self.direction_failure_probabilities = direction_failure_probabilities
+        else:
+            self.directions = np.vstack((self.directions, directions))
+            self.roots = np.hstack((self.roots, roots))
+            self.direction_failure_probabilities = np.hstack((self.direction_failure_probabilities,
+                                                              direction_failure_probabilities))
+
+        n_directions = self.direction_failure_probabilities.shape[0]
+        self.failure_probability = float(np.mean(self.direction_failure_probabilities))
+        if self.failure_probability > 0 and n_directions > 1:
+            std = np.std(self.direction_failure_probabilities, ddof=1) / np.sqrt(n_directions)
+            self.coefficient_of_variation = float(std / self.failure_probability)
+        else:
+            self.coefficient_of_variation = None
+        self.logger.info("UQpy: Directional Simulation complete!")
@@ -0,0 +1,157 @@
+from typing import Union, Optional
+
+import numpy as np
+import scipy.stats as stats
+from beartype import beartype
+
+from UQpy.run_model.RunModel import RunModel
+from UQpy.distributions import *
+from UQpy.transformations import Nataf
+from UQpy.reliability.taylor_series.FORM import FORM
+from UQpy.reliability.taylor_series.baseclass.TaylorSeries import TaylorSeries
+from UQpy.reliability.directional.baseclass.DirectionalReliability import DirectionalReliability
+from UQpy.utilities.ValidationTypes import PositiveInteger, PositiveFloat, RandomStateType, NumpyFloatArray
+from UQpy.utilities.Utilities import process_random_state
+
+
+class LineSampling(DirectionalReliability):
+
+    @beartype
+    def __init__(
+        self,
+        distributions: Union[Distribution, list[Distribution]],
+        runmodel_object: RunModel,
+        important_direction: Union[None, list, np.ndarray, FORM] = None,
+        nsamples: Optional[PositiveInteger] = None,
+        corr_x: Union[None, np.ndarray] = None,
+        corr_z: Union[None, np.ndarray] = None,
+        df_step: Union[int, float] = 0.01,
+        max_distance: PositiveFloat = 8.0,
+        tolerance: PositiveFloat = 1.0e-3,
+        max_iterations: PositiveInteger = 20,
+        random_state: RandomStateType = None,
+    ):
+        """
+        Estimate the probability of failure using Line Sampling.
+
+        Random points of the uncorrelated standard normal space **U** are projected onto the hyperplane orthogonal to
+        the important direction :math:`\\mathbf{e}` and a one-dimensional root search is performed along the line
+        parallel to :math:`\\mathbf{e}` through each projected point. The root searches of all lines are performed
+        simultaneously, such that each iteration requires a single call of the :meth:`.RunModel.run` method.
+
+        :param distributions: Marginal probability distributions of each random variable. Must be an object of
+         type :class:`.DistributionContinuous1D` or :class:`.JointIndependent`.
+        :param runmodel_object: The computational model. It should be of type :class:`.RunModel`.
+        :param important_direction: The important direction pointing towards the failure domain in the uncorrelated
+         standard normal space **U**. Either an array of shape ``(n_dimensions, )`` or a :class:`.FORM` object that has
+         already been executed, in which case the direction :math:`-\\boldsymbol{\\alpha}` of the last design point is
+         used. If :any:`None`, the direction is estimated from the gradient of the performance function at the origin
+         of **U**, computed with central finite differences in a single batched model call.
+        :param nsamples: Number of lines. If provided, the :meth:`run` method is automatically called.
+        :param corr_x: The correlation matrix (:math:`\\mathbf{C_X}`) of the random vector **X**.
+        :param corr_z: The correlation matrix (:math:`\\mathbf{C_Z}`) of the standard normal random vector **Z**.
+        :param df_step: Finite difference step in standard normal space, used if the important direction is estimated
+         from the gradient. Default: :math:`0.01`
+        :param max_distance: The root search along each line is restricted to :math:`[-c_{max}, c_{max}]`.
+         Default: :math:`8.0`
+        :param tolerance: Convergence tolerance of the secant root search. Default: :math:`10^{-3}`
+        :param max_iterations: Maximum number of iterations (i.e. batched model calls) of the root search.
+         Default: :math:`20`
+        :param random_state: Random seed used to initialize the pseudo-random number generator. If an :any:`int` is
+         provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise, the
+         object itself can be passed directly.
+        """
+        super().__init__(Nataf(distributions=distributions, corr_z=corr_z, corr_x=corr_x), runmodel_object,
+                         tolerance=tolerance, max_iterations=max_iterations)
+        self.random_state = process_random_state(random_state)
+        self.df_step = df_step
+        self.max_distance = float(max_distance)
+        self._initial_distance = 3.0
+
+        self.important_direction: NumpyFloatArray = None
+        """Unit vector of the important direction in the uncorrelated standard normal space **U**."""
+        self.samples_u: NumpyFloatArray = None
+        """Points of the lines on the hyperplane orthogonal to the important direction, of shape
+        ``(nsamples, n_dimensions)``."""
+        self.roots: NumpyFloatArray = None
+        """Distance :math:`c_i` of the limit state from the hyperplane along each line."""
+        self.line_failure_probabilities: NumpyFloatArray = None
+        """Conditional probability of failure :math:`\\Phi(-c_i)` of each line."""
+        self.failure_probability: float = None
+        """Probability of failure estimate."""
+        self.coefficient_of_variation: float = None
+        """Coefficient of variation of the probability of failure estimate."""
+
+        self._set_important_direction(important_direction)
+
+        if nsamples is not None:
+            self.run(nsamples=nsamples)
+
+    def _set_important_direction(self, important_direction):
+        if isinstance(important_direction, FORM):
+            if important_direction.alpha is None:
+                raise ValueError("UQpy: The FORM object must be executed before it is used in LineSampling.")
+            direction = -np.atleast_1d(important_direction.alpha)
+            self._initial_distance = float(important_direction.beta[-1])
+        elif important_direction is None:
+            gradient, qoi, _ = TaylorSeries._derivatives(point_u=np.zeros(self.dimension),
+                                                         runmodel_object=self.runmodel_object,
+                                                         nataf_object=self.nataf_object,
+                                                         df_step=self.df_step, order="first")
+            self.n_model_evaluations += 2 * self.dimension + 1
+            self.n_model_calls += 1
+            direction = -gradient
+            self._initial_distance = float(np.squeeze(qoi)) / np.linalg.norm(gradient)
+        else:
+            direction = np.atleast_1d(np.array(important_direction, dtype=float))
+
+        if direction.shape != (self.dimension,):
+            raise ValueError("UQpy: The important direction must have shape ({0},).".format(self.dimension))
+        if np.linalg.norm(direction) == 0:
+            raise ValueError("UQpy: The important direction must be a non-zero vector.")
+        self.important_direction = direction / np.linalg.norm(direction)
+        self._initial_distance = float(np.clip(self._initial_distance, -self.max_distance, self.max_distance))
+
+    @beartype
+    def run(self, nsamples: PositiveInteger):
+        """
+        Perform the root searches along `nsamples` new lines. Each time the method is invoked the new lines are
+        appended to the existing ones and the probability of failure estimate is updated.
+
+        :param nsamples: Number of lines.
+        """
+        self.logger.info("UQpy: Running Line Sampling with {0} lines...".format(nsamples))
+        e = self.important_direction
+        samples_u = self.random_state.normal(size=(nsamples, self.dimension))
+        samples_u -= np.outer(samples_u @ e, e)
+        directions = np.tile(e, (nsamples, 1))
+
+        c_a = np.zeros(nsamples)
+        g_a = self._evaluate(samples_u)
+        c_b = np.full(nsamples, self._initial_distance)
+        c_b[c_b == 0] = 1.0
+        roots, g_roots, found = self._find_roots(samples_u, directions, c_a, g_a, c_b,
+                                                 bounds=(-self.max_distance, self.max_distance))
+
+        line_failure_probabilities = stats.norm.cdf(-roots)
+        # Lines that do not cross the limit state within the search bounds are entirely safe or entirely failed.
+        line_failure_probabilities[~found] = (g_roots[~found] <= 0).astype(float)
+
+        if self.samples_u is None:
+            self.samples_u = samples_u
+            self.roots = roots
+            self.line_failure_probabilities = line_failure_probabilities
+        else:
+            self.samples_u = np.vstack((self.samples_u, samples_u))
+            self.roots = np.hstack((self.roots, roots))
+            self.line_failure_probabilities = np.hstack((self.line_failure_probabilities,
+                                                         line_failure_probabilities))
+
+        n_lines = self.line_failure_probabilities.shape[0]
+        self.failure_probability = float(np.mean(self.line_failure_probabilities))
+        if self.failure_probability > 0 and n_lines > 1:
+            std = np.std(self.line_failure_probabilities, ddof=1) / np.sqrt(n_lines)
+            self.coefficient_of_variation = float(std / self.failure_probability)
+        else:
+            self.coefficient_of_variation = None
+        self.logger.info("UQpy: Line Sampling complete!")
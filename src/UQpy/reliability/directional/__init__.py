@@ -0,0 +1,3 @@
+from UQpy.reliability.directional.LineSampling import LineSampling
+from UQpy.reliability.directional.DirectionalSimulation import DirectionalSimulation
+from UQpy.reliability.directional.baseclass.DirectionalReliability import DirectionalReliability
@@ -0,0 +1,117 @@
+import logging
+from abc import ABC
+
+import numpy as np
+
+from UQpy.transformations import *
+
+
+class DirectionalReliability(ABC):
+    """
+    Parent class of the reliability methods that estimate the probability of failure through one-dimensional root
+    searches of the performance function along lines in the uncorrelated standard normal space **U**.
+    """
+
+    # Largest absolute coordinate in U for which the Nataf transformation remains finite in double precision.
+    _max_coordinate = 8.0
+
+    def __init__(self, nataf_object: Nataf, runmodel_object, tolerance: float = 1.0e-3,
+                 max_iterations: int = 20):
+        self.nataf_object = nataf_object
+        self.runmodel_object = runmodel_object
+        self.dimension = nataf_object.n_dimensions
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.logger = logging.getLogger(__name__)
+
+        self.n_model_evaluations: int = 0
+        """Total number of model evaluations performed by the method."""
+        self.n_model_calls: int = 0
+        """Number of (batched) calls to the :meth:`.RunModel.run` method."""
+
+    def _u_to_x(self, samples_u: np.ndarray) -> np.ndarray:
+        samples_z = Correlate(np.atleast_2d(samples_u), self.nataf_object.corr_z).samples_z
+        self.nataf_object.run(samples_z=samples_z, jacobian=False)
+        return self.nataf_object.samples_x
+
+    def _evaluate(self, samples_u: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the performance function at all points of ``samples_u`` with a single call of the
+        :meth:`.RunModel.run` method.
+        """
+        samples_x = self._u_to_x(samples_u)
+        self.runmodel_object.run(samples=samples_x, append_samples=False)
+        self.n_model_evaluations += samples_x.shape[0]
+        self.n_model_calls += 1
+        qoi = np.array(self.runmodel_object.qoi_list, dtype=float)
+        return qoi.reshape(samples_x.shape[0], -1)[:, 0]
+
+    def _coordinate_bounds(self, origins: np.ndarray, directions: np.ndarray, bounds: tuple):
+        """
+        Restrict the search interval of each line such that all coordinates of the iterates remain within
+        :math:`[-u_{max}, u_{max}]`.
+        """
+        lower = np.full(origins.shape[0], float(bounds[0]))
+        upper = np.full(origins.shape[0], float(bounds[1]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            limit_1 = (-self._max_coordinate - origins) / directions
+            limit_2 = (self._max_coordinate - origins) / directions
+        moving = directions != 0
+        lower = np.maximum(lower, np.max(np.where(moving, np.minimum(limit_1, limit_2), -np.inf), axis=1))
+        upper = np.minimum(upper, np.min(np.where(moving, np.maximum(limit_1, limit_2), np.inf), axis=1))
+        return lower, upper
+
+    def _find_roots(self, origins: np.ndarray, directions: np.ndarray, c_a: np.ndarray, g_a: np.ndarray,
+                    c_b: np.ndarray, bounds: tuple):
+        """
+        Batched root search for :math:`G(\\mathbf{o}_i + c\\,\\mathbf{e}_i)=0`, :math:`i=1,...,N`.
+
+        Secant steps, clipped to ``bounds``, are taken until the limit state is bracketed along a line. From then on
+        the Illinois variant of the regula falsi method is used, which keeps the root bracketed. In each iteration the
+        performance function is evaluated at the new iterates of all lines that have not converged yet, using a single
+        call of the :meth:`.RunModel.run` method.
+
+        :return: The distance :math:`c_i` of the root along each line, the performance function at that distance
+         and a boolean array stating whether the limit state was found along each line. For lines along which no root
+         is found, :math:`c_i` is the last iterate of the search.
+        """
+        lower, upper = self._coordinate_bounds(origins, directions, bounds)
+        c_a, g_a = c_a.astype(float).copy(), g_a.astype(float).copy()
+        c_b = np.clip(c_b.astype(float), lower, upper)
+        g_b = self._evaluate(origins + c_b[:, None] * directions)
+        converged = g_b == 0
+
+        for iteration in range(self.max_iterations):
+            active = np.flatnonzero(~converged)
+            if active.size == 0:
+                break
+            bracketed = np.sign(g_a[active]) != np.sign(g_b[active])
+            slope = g_b[active] - g_a[active]
+            step = np.zeros(active.size)
+            nonzero = slope != 0
+            step[nonzero] = g_b[active][nonzero] * (c_b[active][nonzero] - c_a[active][nonzero]) / slope[nonzero]
+            c_new = np.clip(c_b[active] - step, lower[active], upper[active])
+
+            finished = np.abs(c_new - c_b[active]) < self.tolerance
+            converged[active[finished]] = True
+            active, c_new, bracketed = active[~finished], c_new[~finished], bracketed[~finished]
+            if active.size == 0:
+                break
+
+            g_new = self._evaluate(origins[active] + c_new[:, None] * directions[active])
+            converged[active[g_new == 0]] = True
+
+            # Illinois modification: keep the old end point of the bracket and halve its function value.
+            keep = bracketed & (np.sign(g_new) == np.sign(g_b[active]))
+            replace = ~keep
+            g_a[active[keep]] *= 0.5
+            c_a[active[replace]], g_a[active[replace]] = c_b[active[replace]], g_b[active[replace]]
+            c_b[active], g_b[active] = c_new, g_new
+            self.logger.info("UQpy: Root search iteration {0}, {1} active lines.".format(iteration, active.size))
+
+        found = (np.sign(g_a) != np.sign(g_b)) | (g_b == 0) | \
+                (converged & (c_b > lower) & (c_b < upper))
+        if not np.all(converged):
+            self.logger.warning("UQpy: The root search did not converge along {0} lines after {1} iterations."
+                                .format(np.sum(~converged), self.max_iterations))
+        return c_b, g_b, found
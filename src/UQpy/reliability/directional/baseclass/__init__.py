@@ -0,0 +1 @@
+from UQpy.reliability.directional.baseclass.DirectionalReliability import *
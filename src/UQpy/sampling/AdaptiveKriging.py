@@ -1,9 +1,11 @@
+import copy
 import logging
 from beartype import beartype
 from sklearn.gaussian_process import GaussianProcessRegressor
 
 from UQpy.run_model.RunModel import RunModel
 from UQpy.distributions.baseclass import Distribution
+from UQpy.sampling.MonteCarloSampling import MonteCarloSampling
 from UQpy.sampling.stratified_sampling.LatinHypercubeSampling import LatinHypercubeSampling
 from UQpy.sampling.adaptive_kriging_functions.baseclass.LearningFunction import (
     LearningFunction,
@@ -11,6 +13,7 @@ from UQpy.sampling.adaptive_kriging_functions.baseclass.LearningFunction import
 from UQpy.distributions import DistributionContinuous1D, JointIndependent
 from UQpy.sampling.stratified_sampling.latin_hypercube_criteria import Random
 from UQpy.surrogates.baseclass import Surrogate
+from UQpy.surrogates.gaussian_process.GaussianProcessRegression import GaussianProcessRegression
 from UQpy.utilities.ValidationTypes import *
 from UQpy.utilities.Utilities import process_random_state
 
@@ -32,6 +35,12 @@ class AdaptiveKriging:
             qoi_name: str = None,
             n_add: int = 1,
             random_state: RandomStateType = None,
+            fixed_population: bool = False,
+            update_threshold: Union[float, int] = 1.0e-3,
+            batch_acquisition: Union[None, str] = None,
+            liar_value: Union[None, float, int] = None,
+            max_iterations: Union[None, PositiveInteger] = None,
+            reoptimization_interval: Union[None, PositiveInteger] = 10,
     ):
         """
         Adaptively sample for construction of a kriging surrogate for different objectives including reliability,
@@ -57,6 +66,44 @@ class AdaptiveKriging:
         :param random_state: Random seed used to initialize the pseudo-random number generator. Default is :any:`None`.
          If an :any:`int` is provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise,
          the object itself can be passed directly.
+        :param fixed_population: If :any:`True`, the learning set of `learning_nsamples` points is drawn once with
+         :class:`.MonteCarloSampling` (AK-MCS) and kept for all iterations. Points of the learning set added to the
+         training set are tracked by index and masked out, and the surrogate predictions on the learning set are
+         cached between iterations. If :any:`False`, a new :class:`.LatinHypercubeSampling` learning set is drawn at
+         every iteration. Default: :any:`False`
+        :param update_threshold: Used only if `fixed_population` is :any:`True` and the surrogate is a
+         :class:`.GaussianProcessRegression` whose hyperparameters are unchanged by the refit. In that case, cached
+         predictions are recomputed only for candidates whose posterior correlation with at least one of the newly
+         added points exceeds `update_threshold`. All predictions are recomputed before the stopping criterion is
+         accepted. See `reoptimization_interval`.
+         Default: :math:`10^{-3}`
+        :param batch_acquisition: Strategy used to select the `n_add` points of each iteration one at a time. After
+         each selected point, the predictions are conditioned on a fantasized observation at that point, such that the
+         points of a batch are not clustered.
+
+         - "kriging_believer": The fantasized observation is the predicted mean at the point.
+         - "constant_liar": The fantasized observation is `liar_value`.
+
+         The conditioning is a rank-one update of the posterior for a :class:`.GaussianProcessRegression` surrogate,
+         which gives the predictions of the surrogate refitted with fixed hyperparameters, and a refit of a copy of the
+         surrogate otherwise.
+         Default: :any:`None`, i.e. the `n_add` best points of the learning function are selected at once.
+        :param liar_value: Fantasized observation of the "constant_liar" strategy.
+         Default: :any:`None`, i.e. the default of the learning function, such as the limit state :math:`g(x)=0` of
+         :class:`.UFunction` or the threshold of :class:`.ExpectedFeasibility`. A :class:`ValueError` is raised if the
+         learning function has no default.
+        :param max_iterations: Maximum number of learning iterations of each call of the :meth:`run` method. The
+         iterations in which the points selected by the learning function are evaluated at lower fidelities only,
+         without adding samples, are counted as well.
+         Default: :any:`None`, i.e. the iterations stop when `nsamples` samples are reached or when the stopping
+         criterion of the learning function is met.
+        :param reoptimization_interval: Used only if `fixed_population` is :any:`True` and the surrogate is a
+         :class:`.GaussianProcessRegression` with an optimizer. The hyperparameters are re-optimized once
+         `reoptimization_interval` points have been added since the last optimization, and are held fixed otherwise,
+         such that the factorization of the surrogate is extended and only the correlated cached predictions are
+         recomputed (see `update_threshold`). If :any:`None`, the `reoptimization_interval` and `likelihood_drift`
+         attributes of the surrogate decide.
+         Default: 10
         """
         # Initialize the internal variables of the class.
         self.runmodel_object = runmodel_object
@@ -69,11 +116,27 @@ class AdaptiveKriging:
 
         self.learning_function = learning_function
         self.learning_set = None
+        self.fixed_population = fixed_population
+        self.update_threshold = update_threshold
+        self.training_indices: list = []
+        """Indices of the learning set points added to the training set. Used only if `fixed_population` is
+        :any:`True`."""
+        self._candidates = None
+        self._mean, self._std = None, None
+        self._predicted_hyperparameters = None
+        self._fully_updated = True
         self.dist_object = distributions
         self.nsamples = nsamples
+        self.max_iterations = max_iterations
+        self.reoptimization_interval = reoptimization_interval
+        self._points_since_optimization = 0
 
         self.moments = None
         self.n_add = n_add
+        if batch_acquisition not in (None, "kriging_believer", "constant_liar"):
+            raise ValueError("UQpy: batch_acquisition must be None, 'kriging_believer' or 'constant_liar'.")
+        self.batch_acquisition = batch_acquisition
+        self.liar_value = liar_value
         self.indicator = False
         self.pf = []
         self.cov_pf = []
@@ -180,11 +243,22 @@ class AdaptiveKriging:
         self.surrogate.fit(self.samples, self.qoi)
         self.prediction_model = self.surrogate.predict
 
+        if self.fixed_population:
+            self._run_fixed_population()
+        else:
+            self._run_resampled_population()
+
+        self.logger.info("UQpy: Adaptive Kriging complete")
+
+    def _run_resampled_population(self):
         # ---------------------------------------------
         # Primary loop for learning and adding samples.
         # ---------------------------------------------
 
-        for i in range(self.samples.shape[0], self.nsamples):
+        i = self.samples.shape[0]
+        iterations = 0
+        while self.samples.shape[0] < self.nsamples and not self._iterations_exceeded(iterations):
+            iterations += 1
             # Initialize the population of samples at which to evaluate the learning function and from which to draw
             # in the sampling.
             random_criterion = Random()
@@ -198,41 +272,253 @@ class AdaptiveKriging:
             self.learning_set = lhs._samples.copy()
 
             # Find all of the points in the population that have not already been integrated into the training set
-            rest_pop = np.array([x for x in self.learning_set.tolist() if x not in self.samples.tolist()])
+            training_set = set(map(tuple, self.samples.tolist()))
+            rest_pop = self.learning_set[[tuple(x) not in training_set for x in self.learning_set.tolist()]]
 
             # Apply the learning function to identify the new point to run the model.
+            if self.batch_acquisition is None:
+                new_point, lf, ind = self._acquire(rest_pop)
+            else:
+                mean, std = self.learning_function.predict_in_chunks(self.surrogate, rest_pop)
+                new_point, lf, ind, _ = self._acquire_batch(rest_pop, mean, std)
 
-            # new_point, lf, ind = self.learning_function(self.krig_model, rest_pop, **kwargs)
-            new_point, lf, ind = self.learning_function.evaluate_function(
-                distributions=self.dist_object,
-                n_add=self.n_add,
-                surrogate=self.surrogate,
-                population=rest_pop,
-                qoi=self.qoi,
-                samples=self.samples,
-            )
-
-            # Add the new points to the training set and to the sample set.
-            self.samples = np.vstack([self.samples, np.atleast_2d(new_point)])
-
-            # Run the model at the new points
-            self.runmodel_object.run(samples=new_point, append_samples=True)
+            self._add_points(new_point)
 
-            # If the quantity of interest is a dictionary, convert it to a list
-            self._convert_qoi_tolist()
+            # Exit the loop, if error criteria is satisfied
+            if ind:
+                self.logger.info("UQpy: Learning stops at iteration: %(iteration)s" % {"iteration": i})
+                break
 
-            # Retrain the surrogate model
-            self.surrogate.fit(self.samples, self.qoi, optimizations_number=1)
-            self.prediction_model = self.surrogate.predict
+            self.logger.info("Iteration: %(iteration)s" % {"iteration": i})
+            i += 1
+
+    def _run_fixed_population(self):
+        if self.learning_set is None:
+            monte_carlo = MonteCarloSampling(distributions=self.dist_object, nsamples=self.learning_nsamples,
+                                             random_state=self.random_state)
+            self.learning_set = monte_carlo.samples
+            self._candidates = np.ones(self.learning_set.shape[0], dtype=bool)
+            self._mean = np.zeros(self.learning_set.shape[0])
+            self._std = np.zeros(self.learning_set.shape[0])
+        self._update_predictions(correlated=None)
+
+        i = self.samples.shape[0]
+        iterations = 0
+        while self.samples.shape[0] < self.nsamples and not self._iterations_exceeded(iterations):
+            iterations += 1
+            new_point, lf, ind, new_indices = self._evaluate_fixed_population()
+            if ind and not self._fully_updated:
+                # Predictions of some candidates are cached, confirm the stopping criterion with exact predictions.
+                self._update_predictions(correlated=None)
+                new_point, lf, ind, new_indices = self._evaluate_fixed_population()
+
+            self._candidates[new_indices] = False
+            self.training_indices.extend(new_indices.tolist())
+            correlated = self._correlated_candidates(new_indices)
+            self._add_points(new_point)
+            self._update_predictions(correlated=correlated)
 
-            # Exit the loop, if error criteria is satisfied
             if ind:
                 self.logger.info("UQpy: Learning stops at iteration: %(iteration)s" % {"iteration": i})
                 break
 
             self.logger.info("Iteration: %(iteration)s" % {"iteration": i})
+            i += 1
+
+    def _iterations_exceeded(self, iterations):
+        if self.max_iterations is None or iterations < self.max_iterations:
+            return False
+        self.logger.info("UQpy: Learning stops after the maximum number of iterations %(n)s."
+                         % {"n": self.max_iterations})
+        return True
+
+    def _evaluate_fixed_population(self):
+        candidates = np.flatnonzero(self._candidates)
+        population = self.learning_set[candidates]
+        if self.batch_acquisition is None:
+            new_point, lf, ind = self._acquire(population, self._mean[candidates], self._std[candidates])
+            rows = self._find_rows(population, new_point)
+        else:
+            new_point, lf, ind, rows = self._acquire_batch(population, self._mean[candidates],
+                                                           self._std[candidates])
+        return new_point, lf, ind, candidates[rows]
 
-        self.logger.info("UQpy: Adaptive Kriging complete")
+    def _acquire(self, population, mean=None, std=None, n_add=None):
+        """
+        Evaluate the learning function on `population`. If `mean` and `std` are provided, the learning function is
+        served these predictions instead of calling the surrogate.
+        """
+        n_add = min(self.n_add, self.nsamples - self.samples.shape[0]) if n_add is None else n_add
+        surrogate = self.surrogate if mean is None else _CachedPrediction(self.surrogate, population, mean, std)
+        new_point, lf, ind = self.learning_function.evaluate_function(
+            distributions=self.dist_object,
+            n_add=n_add,
+            surrogate=surrogate,
+            population=population,
+            qoi=self.qoi,
+            samples=self.samples,
+        )
+        return self._run_lower_fidelities(np.atleast_2d(new_point)), lf, ind
+
+    def _run_lower_fidelities(self, new_point):
+        # Points selected by a multi-fidelity learning function for the lower fidelities are evaluated by the
+        # surrogate, only the points of the highest fidelity are added to the samples.
+        fidelities = getattr(self.learning_function, "fidelities", None)
+        if fidelities is None or not hasattr(self.surrogate, "run"):
+            return new_point
+        highest = fidelities == self.surrogate.levels - 1
+        for fidelity in np.unique(fidelities[~highest]):
+            self.surrogate.run(new_point[fidelities == fidelity], fidelity=int(fidelity), optimizations_number=1)
+        return new_point[highest]
+
+    def _acquire_batch(self, population, mean, std):
+        """
+        Select a batch of points one at a time, conditioning the predictions on a fantasized observation at each
+        selected point (kriging believer or constant liar).
+        """
+        n_add = min(self.n_add, self.nsamples - self.samples.shape[0])
+        mean, variance = np.array(mean, dtype=float), np.array(std, dtype=float) ** 2
+        liar_value = self._liar_value()
+        available = np.ones(population.shape[0], dtype=bool)
+        rows, learning_function_values, fantasies = [], [], []
+        stopping_criteria_indicator = False
+        for q in range(n_add):
+            remaining = np.flatnonzero(available)
+            new_point, lf, ind = self._acquire(population[remaining], mean[remaining],
+                                               np.sqrt(variance[remaining]), n_add=1)
+            row = remaining[self._find_rows(population[remaining], new_point)[0]]
+            if q == 0:
+                stopping_criteria_indicator = ind
+            rows.append(row)
+            learning_function_values.append(np.reshape(lf, -1)[0])
+            available[row] = False
+            if q == n_add - 1:
+                break
+
+            lie = mean[row] if liar_value is None else liar_value
+            if isinstance(self.surrogate, GaussianProcessRegression):
+                mean, variance = self._condition(population, mean, variance, fantasies, row, lie)
+            else:
+                fantasy = copy.deepcopy(self.surrogate)
+                fantasies.append(lie)
+                fantasy.fit(np.vstack([self.samples, population[rows]]),
+                            np.hstack([np.reshape(self.qoi, -1), fantasies]))
+                mean, std = self.learning_function.predict_in_chunks(fantasy, population)
+                variance = std ** 2
+
+        rows = np.array(rows, dtype=int)
+        return population[rows], np.array(learning_function_values), stopping_criteria_indicator, rows
+
+    def _liar_value(self):
+        # Fantasized observation of the constant liar, None for the kriging believer
+        if self.batch_acquisition == "kriging_believer":
+            return None
+        liar_value = self.liar_value if self.liar_value is not None else self.learning_function.constant_liar(self.qoi)
+        if liar_value is None:
+            raise ValueError("UQpy: The liar_value must be provided for the constant_liar batch acquisition with the "
+                             "learning function %(name)s." % {"name": type(self.learning_function).__name__})
+        return liar_value
+
+    def _condition(self, population, mean, variance, fantasies, row, value):
+        """
+        Condition the predictions of the :class:`.GaussianProcessRegression` surrogate on the `population` on a
+        fantasized observation `value` at the point `row`, given the previous `fantasies` of the batch. The result
+        equals the predictions of the surrogate refitted with the fantasized observations and fixed hyperparameters:
+        the mean is updated with the posterior covariance of universal kriging and the variance, as returned by
+        :meth:`.GaussianProcessRegression.predict`, with the posterior covariance of known regression coefficients.
+        """
+        noise_variance = 0
+        if self.surrogate.noise:
+            noise_variance = self.surrogate.hyperparameters[-1] ** 2
+            if self.surrogate.normalize:
+                noise_variance = noise_variance * np.reshape(self.surrogate.value_std, -1)[0] ** 2
+        point = population[row:row + 1]
+        covariances = [self.surrogate.posterior_covariance(population, point)[:, 0],
+                       self.surrogate.posterior_covariance(population, point, regression_uncertainty=False)[:, 0]]
+        for previous_row, previous_covariances in fantasies:
+            for covariance, previous_covariance in zip(covariances, previous_covariances):
+                covariance -= previous_covariance * previous_covariance[row] / \
+                    (previous_covariance[previous_row] + noise_variance)
+        fantasies.append((row, covariances))
+        mean_covariance, variance_covariance = covariances
+        mean = mean + mean_covariance * (value - mean[row]) / (mean_covariance[row] + noise_variance)
+        variance = np.maximum(variance - variance_covariance ** 2 / (variance_covariance[row] + noise_variance), 0)
+        return mean, variance
+
+    @staticmethod
+    def _find_rows(population, points):
+        return np.array([np.flatnonzero(np.all(population == point, axis=1))[0] for point in np.atleast_2d(points)],
+                        dtype=int)
+
+    def _correlated_candidates(self, new_indices):
+        """
+        Identify the candidates whose prediction changes materially when the points `new_indices` of the learning set
+        are added to the training set with fixed hyperparameters, i.e. the candidates whose posterior correlation with
+        at least one of the new points exceeds `update_threshold`. Returns :any:`None` if this cannot be determined
+        for the surrogate at hand.
+        """
+        if not isinstance(self.surrogate, GaussianProcessRegression) or self.surrogate.normalize:
+            return None
+        candidates = np.flatnonzero(self._candidates)
+        covariance = self.surrogate.posterior_covariance(self.learning_set[candidates],
+                                                         self.learning_set[new_indices])
+        scale = np.outer(self._std[candidates], self._std[new_indices])
+        correlated = np.zeros(self.learning_set.shape[0], dtype=bool)
+        correlated[candidates] = np.any(np.abs(covariance) >= self.update_threshold * scale, axis=1)
+        return correlated
+
+    def _update_predictions(self, correlated):
+        """
+        Recompute the cached surrogate predictions on the candidates of the fixed learning set. If the hyperparameters
+        of the surrogate did not change during the refit, only the `correlated` candidates are updated.
+        """
+        update = self._candidates.copy()
+        hyperparameters = getattr(self.surrogate, "hyperparameters", None)
+        self._fully_updated = not (correlated is not None and hyperparameters is not None
+                                   and np.array_equal(hyperparameters, self._predicted_hyperparameters))
+        if not self._fully_updated:
+            update &= correlated
+
+        indices = np.flatnonzero(update)
+        if indices.size > 0:
+            self._mean[indices], self._std[indices] = self.learning_function.predict_in_chunks(
+                self.surrogate, self.learning_set[indices])
+        if hyperparameters is not None:
+            self._predicted_hyperparameters = np.array(hyperparameters, copy=True)
+        self.logger.info("UQpy: Updated the predictions of %(n)s candidates." % {"n": indices.size})
+
+    def _add_points(self, new_point):
+        if np.atleast_2d(new_point).shape[0] == 0:
+            # The selected points were evaluated at a lower fidelity and the surrogate was refitted
+            self.prediction_model = self.surrogate.predict
+            return
+        # Add the new points to the training set and to the sample set.
+        self.samples = np.vstack([self.samples, np.atleast_2d(new_point)])
+
+        # Run the model at the new points
+        self.runmodel_object.run(samples=new_point, append_samples=True)
+
+        # If the quantity of interest is a dictionary, convert it to a list
+        self._convert_qoi_tolist()
+
+        # Retrain the surrogate model, extending the existing factorization if the surrogate supports it
+        if hasattr(self.surrogate, "update"):
+            n_new = np.atleast_2d(new_point).shape[0]
+            self.surrogate.update(new_point, self.qoi[-n_new:], optimizations_number=1,
+                                  **self._reoptimization_options(n_new))
+        else:
+            self.surrogate.fit(self.samples, self.qoi, optimizations_number=1)
+        self.prediction_model = self.surrogate.predict
+
+    def _reoptimization_options(self, n_new):
+        if not (self.fixed_population and self.reoptimization_interval is not None
+                and isinstance(self.surrogate, GaussianProcessRegression)):
+            return {}
+        self._points_since_optimization += n_new
+        reoptimize = self._points_since_optimization >= self.reoptimization_interval
+        if reoptimize:
+            self._points_since_optimization = 0
+        return {"reoptimize": reoptimize}
 
     def _convert_qoi_tolist(self):
         self.qoi = [None] * len(self.runmodel_object.qoi_list)
@@ -241,3 +527,34 @@ class AdaptiveKriging:
                 self.qoi[j] = self.runmodel_object.qoi_list[j][self.qoi_name]
         else:
             self.qoi = self.runmodel_object.qoi_list
+
+
+class _CachedPrediction:
+    """
+    Wraps a surrogate such that predictions at the candidate points of a fixed learning set are served from the cache
+    kept by :class:`.AdaptiveKriging`. Rows of the population are requested by index with :meth:`predict_rows`, and
+    :meth:`predict` serves the cache for the whole population. Predictions at any other points are delegated to the
+    surrogate.
+    """
+
+    def __init__(self, surrogate, population, mean, std):
+        self._surrogate = surrogate
+        self._population = population
+        self._mean = mean
+        self._std = std
+
+    def predict_rows(self, rows, return_std=False):
+        mean = np.array(self._mean[rows], copy=True)
+        if return_std:
+            return mean, np.array(self._std[rows], copy=True)
+        return mean
+
+    def predict(self, points, return_std=False):
+        points = np.asarray(points)
+        if points.shape != self._population.shape or not (points is self._population
+                                                          or np.array_equal(points, self._population)):
+            return self._surrogate.predict(points, return_std)
+        return self.predict_rows(slice(None), return_std)
+
+    def __getattr__(self, name):
+        return getattr(self._surrogate, name)
@@ -0,0 +1,237 @@
+import logging
+
+from beartype import beartype
+
+from UQpy.run_model.RunModel import RunModel
+from UQpy.distributions.baseclass import Distribution
+from UQpy.sampling.MonteCarloSampling import MonteCarloSampling
+from UQpy.sampling.stratified_sampling.LatinHypercubeSampling import LatinHypercubeSampling
+from UQpy.sampling.stratified_sampling.latin_hypercube_criteria import Random
+from UQpy.surrogates.polynomial_chaos.PolynomialChaosExpansion import PolynomialChaosExpansion
+from UQpy.surrogates.polynomial_chaos.AdaptivePolynomialChaosExpansion import AdaptivePolynomialChaosExpansion
+from UQpy.surrogates.polynomial_chaos.regressions.LeastSquareRegression import LeastSquareRegression
+from UQpy.utilities.ValidationTypes import *
+from UQpy.utilities.Utilities import process_random_state
+
+
+class AdaptivePolynomialChaosDesign:
+    @beartype
+    def __init__(
+            self,
+            distributions: Union[Distribution, list[Distribution]],
+            runmodel_object: RunModel,
+            surrogate: PolynomialChaosExpansion,
+            samples: Numpy2DFloatArray = None,
+            nsamples: PositiveInteger = None,
+            learning_nsamples: PositiveInteger = 1000,
+            criterion: str = "d_optimal",
+            n_add: PositiveInteger = 1,
+            target_error: Union[float, int] = 1.0e-3,
+            qoi_name: str = None,
+            random_state: RandomStateType = None,
+    ):
+        """
+        Sequential experimental design for the construction of a Polynomial Chaos Expansion, which adds batches of
+        points selected from the basis of the current surrogate until the leave-one-out error reaches a target value.
+
+        At each iteration, a learning set of `learning_nsamples` points is drawn with :class:`.MonteCarloSampling` and
+        `n_add` points are selected from it according to the `criterion`. The model is evaluated at the selected points
+        with a single call of :meth:`.RunModel.run`. If the surrogate uses the :class:`.LeastSquareRegression` method
+        with a fixed basis, the inverse of the Gram matrix :math:`(\\Psi^T \\Psi)^{-1}` is updated with the
+        Woodbury identity and the coefficients and leave-one-out error are computed from it. Otherwise, the surrogate is
+        refitted with its :meth:`fit` method.
+
+        :param distributions: List of :class:`.Distribution` objects corresponding to each random variable.
+        :param runmodel_object: A :class:`.RunModel` object, which is used to evaluate the model.
+        :param surrogate: A :class:`.PolynomialChaosExpansion` object, whose polynomial basis is used to select the
+         points.
+        :param samples: The initial samples at which to evaluate the model.
+        :param nsamples: Total number of samples to be drawn (including the initial samples). If `nsamples` and
+         `samples` are provided when instantiating the class, the :meth:`run` method will automatically be called.
+        :param learning_nsamples: Number of samples of the learning set.
+        :param criterion: Criterion used to select the points from the learning set.
+
+         - "d_optimal": The points are selected greedily to maximize the determinant of the Gram matrix
+           :math:`\\Psi^T \\Psi`, i.e. each point maximizes its leverage :math:`\\psi(x)^T (\\Psi^T \\Psi)^{-1}
+           \\psi(x)` given the points selected before it.
+         - "coherence": The points are drawn from the learning set with probabilities proportional to
+           :math:`B^2(x) = \\max_k \\psi_k^2(x)`, which resamples the learning set to the coherence-optimal
+           density :cite:`CoherenceOptimal` of the basis.
+        :param n_add: Number of samples to be added per iteration.
+        :param target_error: The iterations stop when the leave-one-out error of the surrogate falls below this value.
+        :param qoi_name: Name of the quantity of interest. If the quantity of interest is a dictionary, this is used to
+         convert it to a list
+        :param random_state: Random seed used to initialize the pseudo-random number generator. Default is :any:`None`.
+         If an :any:`int` is provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise,
+         the object itself can be passed directly.
+        """
+        if criterion not in ("d_optimal", "coherence"):
+            raise ValueError("UQpy: criterion must be 'd_optimal' or 'coherence'.")
+        self.dist_object = distributions
+        self.runmodel_object = runmodel_object
+        self.surrogate = surrogate
+        self.learning_nsamples = learning_nsamples
+        self.criterion = criterion
+        self.n_add = n_add
+        self.target_error = target_error
+        self.qoi_name = qoi_name
+        self.nsamples = nsamples
+        self.random_state = process_random_state(random_state)
+        self.logger = logging.getLogger(__name__)
+
+        self.samples: Numpy2DFloatArray = None if samples is None else np.array(samples)
+        """contains the samples at which the model is evaluated."""
+        self.qoi = None
+        """Model evaluations at the samples."""
+        self.errors: list = []
+        """Leave-one-out errors of the surrogate after each iteration."""
+        self._gram_inverse = None
+        self._full_rank = False
+
+        if samples is not None:
+            self.logger.info("UQpy: Adaptive PCE design - Running the initial sample set using RunModel.")
+            if len(self.runmodel_object.qoi_list) == 0:
+                self.runmodel_object.run(samples=self.samples, append_samples=False)
+            if len(self.runmodel_object.qoi_list) != self.samples.shape[0]:
+                raise NotImplementedError("UQpy: There should be no model evaluation or Number of samples and model "
+                                          "evaluation in RunModel object should be same.")
+
+        if self.nsamples is not None and samples is not None:
+            self.run(nsamples=self.nsamples)
+
+    def run(self, nsamples: int, samples: np.ndarray = None, initial_nsamples: int = None):
+        """
+        Execute the sequential design iterations.
+
+        The :meth:`run` method has no returns, although it creates and/or appends the :py:attr:`samples` attribute and
+        fits the `surrogate` to all model evaluations.
+
+        :param nsamples: Total number of samples to be drawn (including the initial samples).
+        :param samples: Samples at which to evaluate the model, which are appended to the existing samples.
+        :param initial_nsamples: Number of initial samples, randomly generated using
+         :class:`.LatinHypercubeSampling` class, if no samples are available.
+        """
+        self.nsamples = nsamples
+        if samples is not None:
+            samples = np.atleast_2d(samples)
+            self.samples = samples if self.samples is None else np.vstack([self.samples, samples])
+            self.runmodel_object.run(samples=samples, append_samples=True)
+        elif self.samples is None:
+            if initial_nsamples is None:
+                raise NotImplementedError("UQpy: User should provide either 'samples' or 'initial_nsamples' value.")
+            self.logger.info("UQpy: Adaptive PCE design - Generating the initial sample set using Latin hypercube "
+                             "sampling.")
+            latin_hypercube_sampling = LatinHypercubeSampling(distributions=self.dist_object,
+                                                              nsamples=initial_nsamples, criterion=Random(),
+                                                              random_state=self.random_state)
+            self.samples = latin_hypercube_sampling._samples
+            self.runmodel_object.run(samples=self.samples)
+
+        self._convert_qoi_tolist()
+        self._fit()
+
+        i = self.samples.shape[0]
+        while self.samples.shape[0] < self.nsamples and self.errors[-1] > self.target_error:
+            monte_carlo = MonteCarloSampling(distributions=self.dist_object, nsamples=self.learning_nsamples,
+                                             random_state=self.random_state)
+            new_points = self._select(monte_carlo.samples, min(self.n_add, self.nsamples - self.samples.shape[0]))
+            self._add_points(new_points)
+            self.logger.info("Iteration: %(iteration)s" % {"iteration": i})
+            i += new_points.shape[0]
+
+        self.logger.info("UQpy: Adaptive PCE design complete with a leave-one-out error of %s", self.errors[-1])
+
+    def _select(self, population, n_add):
+        design_matrix = self.surrogate.polynomial_basis.evaluate_basis(population)
+        if self.criterion == "coherence":
+            probabilities = np.max(design_matrix ** 2, axis=1)
+            rows = self.random_state.choice(population.shape[0], n_add, replace=False,
+                                            p=probabilities / np.sum(probabilities))
+            return population[rows]
+
+        # Greedy maximization of the determinant, each selected point is a rank-one update of the Gram matrix
+        gram_inverse = self._selection_inverse()
+        leverages = np.sum((design_matrix @ gram_inverse) * design_matrix, axis=1)
+        available = np.ones(population.shape[0], dtype=bool)
+        rows = []
+        for _ in range(n_add):
+            row = np.flatnonzero(available)[np.argmax(leverages[available])]
+            rows.append(row)
+            available[row] = False
+            direction, scale = gram_inverse @ design_matrix[row], 1 + leverages[row]
+            leverages -= (design_matrix @ direction) ** 2 / scale
+            gram_inverse -= np.outer(direction, direction) / scale
+        return population[rows]
+
+    def _selection_inverse(self):
+        design_matrix = self.surrogate.design_matrix
+        if self._gram_inverse is not None and self._full_rank:
+            return self._gram_inverse.copy()
+        # The Gram matrix of a design with fewer points than polynomials is singular, the regularized inverse favours
+        # the points that extend the range of the design matrix
+        gram = design_matrix.T @ design_matrix
+        regularization = 1e-8 * max(np.trace(gram) / gram.shape[0], 1.0)
+        return np.linalg.inv(gram + regularization * np.eye(gram.shape[0]))
+
+    def _add_points(self, new_points):
+        self.samples = np.vstack([self.samples, new_points])
+        self.runmodel_object.run(samples=new_points, append_samples=True)
+        self._convert_qoi_tolist()
+        self._fit(new_points.shape[0])
+
+    def _updatable(self):
+        return isinstance(self.surrogate.regression_method, LeastSquareRegression) and \
+            not isinstance(self.surrogate, AdaptivePolynomialChaosExpansion)
+
+    def _fit(self, n_new=None):
+        y = np.array(self.qoi, dtype=float).reshape(self.samples.shape[0], -1)
+        if not self._updatable():
+            self.surrogate.fit(self.samples, y)
+            self._append_error(self.surrogate.leaveoneout_error())
+            return
+
+        surrogate = self.surrogate
+        if n_new is None or not self._full_rank:
+            surrogate.design_matrix = surrogate.polynomial_basis.evaluate_basis(self.samples)
+            gram = surrogate.design_matrix.T @ surrogate.design_matrix
+            self._full_rank = np.linalg.matrix_rank(gram) == gram.shape[0]
+            self._gram_inverse = np.linalg.pinv(gram)
+        else:
+            # Woodbury identity for the rows of the new points
+            new_rows = surrogate.polynomial_basis.evaluate_basis(self.samples[-n_new:])
+            surrogate.design_matrix = np.vstack([surrogate.design_matrix, new_rows])
+            product = new_rows @ self._gram_inverse
+            self._gram_inverse -= product.T @ np.linalg.solve(np.eye(n_new) + product @ new_rows.T, product)
+
+        surrogate.experimental_design_input, surrogate.experimental_design_output = self.samples, y
+        surrogate.gram_matrix = None
+        coefficients = self._gram_inverse @ (surrogate.design_matrix.T @ y)
+        # One step of iterative refinement recovers the accuracy of the least squares solution, which the normal
+        # equations lose for ill-conditioned design matrices
+        surrogate.coefficients = coefficients + self._gram_inverse @ (
+            surrogate.design_matrix.T @ (y - surrogate.design_matrix @ coefficients))
+        surrogate.bias, surrogate.outputs_number = None, y.shape[1]
+        self._append_error(self._leaveoneout_error(y))
+
+    def _append_error(self, error):
+        # The leave-one-out error is undefined as long as the surrogate interpolates the samples
+        error = np.max(error)
+        self.errors.append(float(np.inf if np.isnan(error) else error))
+
+    def _leaveoneout_error(self, y):
+        # Same estimator as PolynomialChaosExpansion.leaveoneout_error, with the updated inverse of the Gram matrix
+        design_matrix = self.surrogate.design_matrix
+        n_samples = y.shape[0]
+        h_diag = np.sum((design_matrix @ self._gram_inverse) * design_matrix, axis=1).reshape(-1, 1)
+        residuals = y - design_matrix @ self.surrogate.coefficients
+        eps_val = ((n_samples - 1) / n_samples * np.sum((residuals / (1 - h_diag)) ** 2, axis=0)) / (
+            np.sum((y - np.mean(y, axis=0)) ** 2, axis=0))
+        return np.round(eps_val, 7)
+
+    def _convert_qoi_tolist(self):
+        self.qoi = [None] * len(self.runmodel_object.qoi_list)
+        if type(self.runmodel_object.qoi_list[0]) is dict:
+            for j in range(len(self.runmodel_object.qoi_list)):
+                self.qoi[j] = self.runmodel_object.qoi_list[j][self.qoi_name]
+        else:
+            self.qoi = self.runmodel_object.qoi_list
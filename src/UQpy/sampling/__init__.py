@@ -3,6 +3,7 @@ from UQpy.sampling.adaptive_kriging_functions import *
 from UQpy.sampling.stratified_sampling import *
 
 from UQpy.sampling.AdaptiveKriging import AdaptiveKriging
+from UQpy.sampling.AdaptivePolynomialChaosDesign import AdaptivePolynomialChaosDesign
 from UQpy.sampling.ImportanceSampling import ImportanceSampling
 
 from UQpy.sampling.MonteCarloSampling import MonteCarloSampling
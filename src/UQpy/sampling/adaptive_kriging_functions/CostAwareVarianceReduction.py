@@ -0,0 +1,54 @@
+from typing import Union
+
+import numpy as np
+from beartype import beartype
+
+from UQpy.sampling.adaptive_kriging_functions.baseclass.LearningFunction import (
+    LearningFunction,
+)
+
+
+class CostAwareVarianceReduction(LearningFunction):
+
+    @beartype
+    def __init__(self, budget: Union[None, float, int] = None):
+        """
+        Cost-aware variance reduction learning function for a :class:`.MultiFidelityGaussianProcessRegression`
+        surrogate, which selects both the points and the fidelity at which to evaluate the model :cite:`MFGP3`.
+
+        Evaluating the models of fidelity :math:`0, \\dots, t` at a point :math:`x` removes the contributions of these
+        levels to the predictive variance of the highest fidelity at :math:`x`, at the cost
+        :math:`\\sum_{j \\leq t} c_j`. The points with the largest variance reduction per unit cost are selected, and
+        each of them is evaluated at the fidelity maximizing this ratio. All selected points are returned, and their
+        fidelity levels are stored in the `fidelities` attribute. :class:`.AdaptiveKriging` evaluates the points of
+        lower fidelity with the :meth:`.MultiFidelityGaussianProcessRegression.run` method of the surrogate and adds the
+        points of the highest fidelity to its samples. Batch acquisition is not supported with this learning
+        function.
+
+        Iterations in which all selected points are evaluated at lower fidelities do not add samples to
+        :class:`.AdaptiveKriging`, such that the number of iterations and the cost should be bounded with the
+        `budget` of the learning function or the `max_iterations` argument of :class:`.AdaptiveKriging`.
+
+        :param budget: The stopping criterion is met once the total cost of the model evaluations requested by the
+         learning function reaches this value. Default: :any:`None`, i.e. no budget.
+        """
+        self.budget = budget
+        self.fidelities = None
+        """Fidelity levels of the points selected by the last evaluation of the learning function."""
+        self.cost = 0
+        """Total cost of the model evaluations requested by the learning function."""
+
+    def evaluate_function(self, distributions, n_add, surrogate, population, qoi=None, samples=None):
+        # Variance reduction per unit cost of evaluating the models up to each fidelity level
+        reduction = np.cumsum(surrogate.variance_decomposition(population), axis=1) / np.cumsum(surrogate.costs)
+        levels = np.argmax(reduction, axis=1)
+        learning_function_values = reduction[np.arange(population.shape[0]), levels]
+
+        rows = self._select(learning_function_values, n_add, largest=True)
+        self.fidelities = levels[rows]
+
+        # The models of all fidelities up to the selected one are evaluated at each point
+        self.cost += float(np.sum(np.cumsum(surrogate.costs)[self.fidelities]))
+        stopping_criteria_indicator = self.budget is not None and self.cost >= self.budget
+        new_samples = population[rows, :]
+        return new_samples, learning_function_values[rows], stopping_criteria_indicator
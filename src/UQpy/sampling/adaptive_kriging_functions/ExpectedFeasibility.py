@@ -5,6 +5,7 @@ from beartype import beartype
 from UQpy.sampling.adaptive_kriging_functions.baseclass.LearningFunction import (
     LearningFunction,
 )
+from UQpy.utilities.ValidationTypes import PositiveInteger
 import scipy.stats as stats
 
 
@@ -16,6 +17,8 @@ class ExpectedFeasibility(LearningFunction):
         eff_a: Union[float, int] = 0,
         eff_epsilon: Union[float, int] = 2,
         eff_stop: Union[float, int] = 0.001,
+        chunk_size: Union[None, PositiveInteger] = None,
+        n_threads: PositiveInteger = 1,
     ):
         """
         Expected Feasibility Function (EFF) for reliability analysis, see :cite:`AKMCS4` for a detailed explanation.
@@ -23,32 +26,39 @@ class ExpectedFeasibility(LearningFunction):
         :param eff_a: Reliability threshold.
         :param eff_epsilon: EGRA method epsilon
         :param eff_stop: Stopping threshold
+        :param chunk_size: Number of population points passed to the surrogate at once. If :any:`None`, the whole
+         population is evaluated at once.
+        :param n_threads: Number of threads used to evaluate the chunks concurrently.
         """
         self.eff_a = eff_a
         self.eff_epsilon = eff_epsilon
         self.eff_stop = eff_stop
+        self.chunk_size = chunk_size
+        self.n_threads = n_threads
+
+    def constant_liar(self, qoi):
+        return self.eff_a
 
     def evaluate_function(self, distributions, n_add, surrogate, population, qoi=None, samples=None):
 
-        g, sig = surrogate.predict(population, True)
-
-        # Remove the inconsistency in the shape of 'g' and 'sig' array
-        g = g.reshape([population.shape[0], 1])
-        sig = sig.reshape([population.shape[0], 1])
-        # reliability threshold: a_ = 0
-        # EGRA method: epsilon = 2*sigma(x)
-        a_, ep = self.eff_a, self.eff_epsilon * sig
-        t1 = (a_ - g) / sig
-        t2 = (a_ - ep - g) / sig
-        t3 = (a_ + ep - g) / sig
-        eff = (g - a_) * (
-            2 * stats.norm.cdf(t1) - stats.norm.cdf(t2) - stats.norm.cdf(t3)
-        )
-        eff += -sig * (2 * stats.norm.pdf(t1) - stats.norm.pdf(t2) - stats.norm.pdf(t3))
-        eff += ep * (stats.norm.cdf(t3) - stats.norm.cdf(t2))
-        rows = eff[:, 0].argsort()[-n_add:]
-
-        stopping_criteria_indicator = max(eff[:, 0]) <= self.eff_stop
+        def scores(g, sig, points):
+            # reliability threshold: a_ = 0
+            # EGRA method: epsilon = 2*sigma(x)
+            a_, ep = self.eff_a, self.eff_epsilon * sig
+            t1 = (a_ - g) / sig
+            t2 = (a_ - ep - g) / sig
+            t3 = (a_ + ep - g) / sig
+            eff = (g - a_) * (
+                2 * stats.norm.cdf(t1) - stats.norm.cdf(t2) - stats.norm.cdf(t3)
+            )
+            eff += -sig * (2 * stats.norm.pdf(t1) - stats.norm.pdf(t2) - stats.norm.pdf(t3))
+            eff += ep * (stats.norm.cdf(t3) - stats.norm.cdf(t2))
+            return eff, eff[:, 0]
+
+        rows, eff, max_eff = self._evaluate_in_chunks(surrogate, population, n_add, scores, largest=True,
+                                                      criterion=max)
+
+        stopping_criteria_indicator = max_eff <= self.eff_stop
         new_samples = population[rows, :]
-        learning_function_values = eff[rows, :]
+        learning_function_values = eff
         return new_samples, learning_function_values, stopping_criteria_indicator
@@ -3,34 +3,42 @@ from beartype import beartype
 from UQpy.sampling.adaptive_kriging_functions.baseclass.LearningFunction import (
     LearningFunction,
 )
+from UQpy.utilities.ValidationTypes import PositiveInteger
 import scipy.stats as stats
-import numpy as np
 
 
 class ExpectedImprovement(LearningFunction):
 
     @beartype
-    def __init__(self, eif_stop: Union[float, int] = 0.01):
+    def __init__(self, eif_stop: Union[float, int] = 0.01, chunk_size: Union[None, PositiveInteger] = None,
+                 n_threads: PositiveInteger = 1):
         """
         Expected Improvement Function (EIF) for Efficient Global Optimization (EFO). See :cite:`AKMCS2` for a detailed
         explanation.
 
         :param eif_stop: Stopping threshold
+        :param chunk_size: Number of population points passed to the surrogate at once. If :any:`None`, the whole
+         population is evaluated at once.
+        :param n_threads: Number of threads used to evaluate the chunks concurrently.
         """
         self.eif_stop = eif_stop
+        self.chunk_size = chunk_size
+        self.n_threads = n_threads
+
+    def constant_liar(self, qoi):
+        return min(qoi)
 
     def evaluate_function(self, distributions, n_add, surrogate, population, qoi=None, samples=None):
-        g, sig = surrogate.predict(population, True)
+        fm = min(qoi)
 
-        # Remove the inconsistency in the shape of 'g' and 'sig' array
-        g = g.reshape([population.shape[0], 1])
-        sig = sig.reshape([population.shape[0], 1])
+        def scores(g, sig, points):
+            eif = (fm - g) * stats.norm.cdf((fm - g) / sig) + sig * stats.norm.pdf((fm - g) / sig)
+            return eif, eif[:, 0]
 
-        fm = min(qoi)
-        eif = (fm - g) * stats.norm.cdf((fm - g) / sig) + sig * stats.norm.pdf((fm - g) / sig)
-        rows = eif[:, 0].argsort()[(np.size(g) - n_add) :]
+        rows, eif, max_eif = self._evaluate_in_chunks(surrogate, population, n_add, scores, largest=True,
+                                                      criterion=max)
 
-        stopping_criteria_indicator = max(eif[:, 0]) / abs(fm) <= self.eif_stop
+        stopping_criteria_indicator = max_eif / abs(fm) <= self.eif_stop
         new_samples = population[rows, :]
-        learning_function_values = eif[rows, :]
+        learning_function_values = eif
         return new_samples, learning_function_values, stopping_criteria_indicator
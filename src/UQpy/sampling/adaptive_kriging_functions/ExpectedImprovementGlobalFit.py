@@ -1,40 +1,51 @@
+from typing import Union
+
+from beartype import beartype
+
 from UQpy.sampling.adaptive_kriging_functions.baseclass.LearningFunction import (
     LearningFunction,
 )
+from UQpy.utilities.ValidationTypes import PositiveInteger
 import numpy as np
 from sklearn.neighbors import NearestNeighbors
 
 
 class ExpectedImprovementGlobalFit(LearningFunction):
-    """
-    Expected Improvement for Global Fit (EIGF) learning function. See :cite:`AKMCS5` for a detailed explanation.
-    """
+
+    @beartype
+    def __init__(self, chunk_size: Union[None, PositiveInteger] = None, n_threads: PositiveInteger = 1):
+        """
+        Expected Improvement for Global Fit (EIGF) learning function. See :cite:`AKMCS5` for a detailed explanation.
+
+        :param chunk_size: Number of population points passed to the surrogate at once. If :any:`None`, the whole
+         population is evaluated at once.
+        :param n_threads: Number of threads used to evaluate the chunks concurrently.
+        """
+        self.chunk_size = chunk_size
+        self.n_threads = n_threads
 
     def evaluate_function(
         self, distributions, n_add, surrogate, population, qoi=None, samples=None
     ):
-        g, sig = surrogate.predict(population, True)
-
-        # Remove the inconsistency in the shape of 'g' and 'sig' array
-        g = g.reshape([population.shape[0], 1])
-        sig = sig.reshape([population.shape[0], 1])
-
         # Evaluation of the learning function
         # First, find the nearest neighbor in the training set for each point in the population.
-
         knn = NearestNeighbors(n_neighbors=1)
         knn.fit(np.atleast_2d(samples))
-        neighbors = knn.kneighbors(np.atleast_2d(population), return_distance=False)
 
-        # noinspection PyTypeChecker
-        qoi_array = np.array([qoi[x] for x in np.squeeze(neighbors)])
+        def scores(g, sig, points):
+            neighbors = knn.kneighbors(np.atleast_2d(points), return_distance=False)
+
+            # noinspection PyTypeChecker
+            qoi_array = np.array([qoi[x] for x in neighbors[:, 0]]).reshape(points.shape[0], -1)
+
+            # Compute the learning function at every point in the population.
+            u = np.square(g - qoi_array) + np.square(sig)
+            return u, u[:, 0]
 
-        # Compute the learning function at every point in the population.
-        u = np.square(g - qoi_array) + np.square(sig)
-        rows = u[:, 0].argsort()[(np.size(g) - n_add) :]
+        rows, u, _ = self._evaluate_in_chunks(surrogate, population, n_add, scores, largest=True, criterion=max)
 
         stopping_criteria_indicator = False
         new_samples = population[rows, :]
-        learning_function_evaluations = u[rows, :]
+        learning_function_evaluations = u
 
         return new_samples, learning_function_evaluations, stopping_criteria_indicator
@@ -1,33 +1,44 @@
+from typing import Union
+
 from beartype import beartype
 
 from UQpy.sampling.adaptive_kriging_functions.baseclass.LearningFunction import (
     LearningFunction,
 )
+from UQpy.utilities.ValidationTypes import PositiveInteger
 
 
 class UFunction(LearningFunction):
 
     @beartype
-    def __init__(self, u_stop: int = 2):
+    def __init__(self, u_stop: int = 2, chunk_size: Union[None, PositiveInteger] = None,
+                 n_threads: PositiveInteger = 1):
         """
         U-function for reliability analysis. See :cite:`AKMCS1` for a detailed explanation.
 
         :param u_stop: U-Function stopping parameter
+        :param chunk_size: Number of population points passed to the surrogate at once. If :any:`None`, the whole
+         population is evaluated at once.
+        :param n_threads: Number of threads used to evaluate the chunks concurrently.
         """
         self.u_stop = u_stop
+        self.chunk_size = chunk_size
+        self.n_threads = n_threads
 
-    def evaluate_function(self, distributions, n_add, surrogate, population, qoi=None, samples=None):
+    def constant_liar(self, qoi):
+        # The limit state g(x) = 0 separates the safe and failure domains
+        return 0
 
-        g, sig = surrogate.predict(population, True)
+    def evaluate_function(self, distributions, n_add, surrogate, population, qoi=None, samples=None):
 
-        # Remove the inconsistency in the shape of 'g' and 'sig' array
-        g = g.reshape([population.shape[0], 1])
-        sig = sig.reshape([population.shape[0], 1])
+        def scores(g, sig, points):
+            u = abs(g) / sig
+            return u, u[:, 0]
 
-        u = abs(g) / sig
-        rows = u[:, 0].argsort()[:n_add]
+        rows, u, min_u = self._evaluate_in_chunks(surrogate, population, n_add, scores, largest=False,
+                                                  criterion=min)
 
-        stopping_criteria_indicator = min(u[:, 0]) >= self.u_stop
+        stopping_criteria_indicator = min_u >= self.u_stop
         new_samples = population[rows, :]
-        learning_function_values = u[rows, 0]
+        learning_function_values = u[:, 0]
         return new_samples, learning_function_values, stopping_criteria_indicator
@@ -1,43 +1,53 @@
+from typing import Union
+
 from beartype import beartype
 
 from UQpy.sampling.adaptive_kriging_functions.baseclass.LearningFunction import (
     LearningFunction,
 )
+from UQpy.utilities.ValidationTypes import PositiveInteger
 import numpy as np
 
 
 class WeightedUFunction(LearningFunction):
 
     @beartype
-    def __init__(self, weighted_u_stop: int):
+    def __init__(self, weighted_u_stop: int, chunk_size: Union[None, PositiveInteger] = None,
+                 n_threads: PositiveInteger = 1):
         """
         Probability Weighted U-function for reliability analysis. See :cite:`AKMCS3` for a detailed explanation.
 
         :param weighted_u_stop: Stopping parameter required for the WeightedU learning function
+        :param chunk_size: Number of population points passed to the surrogate at once. If :any:`None`, the whole
+         population is evaluated at once.
+        :param n_threads: Number of threads used to evaluate the chunks concurrently.
         """
         self.weighted_u_stop = weighted_u_stop
+        self.chunk_size = chunk_size
+        self.n_threads = n_threads
 
-    def evaluate_function(self, distributions, n_add, surrogate, population, qoi=None, samples=None):
-        g, sig = surrogate.predict(population, True)
-
-        # Remove the inconsistency in the shape of 'g' and 'sig' array
-        g = g.reshape([population.shape[0], 1])
-        sig = sig.reshape([population.shape[0], 1])
+    def constant_liar(self, qoi):
+        # The limit state g(x) = 0 separates the safe and failure domains
+        return 0
 
-        u = abs(g) / sig
-        p1 = np.ones([population.shape[0], population.shape[1]])
+    def evaluate_function(self, distributions, n_add, surrogate, population, qoi=None, samples=None):
         p2 = np.ones([samples.shape[0], population.shape[1]])
-
         for j in range(samples.shape[1]):
-            p1[:, j] = distributions[j].pdf(np.atleast_2d(population[:, j]).T)
             p2[:, j] = distributions[j].pdf(np.atleast_2d(samples[:, j]).T)
-
-        p1 = p1.prod(1).reshape(u.size, 1)
         max_p = max(p2.prod(1))
-        u_ = u * ((max_p - p1) / max_p)
-        rows = u_[:, 0].argsort()[:n_add]
 
-        stopping_criteria_indicator = min(u[:, 0]) >= self.weighted_u_stop
+        def scores(g, sig, points):
+            u = abs(g) / sig
+            p1 = np.ones([points.shape[0], points.shape[1]])
+            for j in range(points.shape[1]):
+                p1[:, j] = distributions[j].pdf(np.atleast_2d(points[:, j]).T)
+            p1 = p1.prod(1).reshape(u.size, 1)
+            return u * ((max_p - p1) / max_p), u[:, 0]
+
+        rows, u_, min_u = self._evaluate_in_chunks(surrogate, population, n_add, scores, largest=False,
+                                                   criterion=min)
+
+        stopping_criteria_indicator = min_u >= self.weighted_u_stop
         new_samples = population[rows, :]
-        learning_function_values = u_[rows, :]
+        learning_function_values = u_
         return new_samples, learning_function_values, stopping_criteria_indicator
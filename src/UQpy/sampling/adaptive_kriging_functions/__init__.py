@@ -1,3 +1,4 @@
+from UQpy.sampling.adaptive_kriging_functions.CostAwareVarianceReduction import *
 from UQpy.sampling.adaptive_kriging_functions.ExpectedFeasibility import *
 from UQpy.sampling.adaptive_kriging_functions.ExpectedImprovement import *
 from UQpy.sampling.adaptive_kriging_functions.ExpectedImprovementGlobalFit import *
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 
 class LearningFunction(ABC):
@@ -14,3 +17,99 @@ class LearningFunction(ABC):
         Abstract method that needs to be overriden by the user to create new Adaptive Kriging Learning functions.
         """
         pass
+
+    def constant_liar(self, qoi):
+        """
+        Default fantasized observation of the "constant_liar" batch acquisition of :class:`.AdaptiveKriging`, e.g. the
+        threshold of a reliability learning function. Learning functions without a meaningful default return
+        :any:`None`, in which case the `liar_value` must be provided to :class:`.AdaptiveKriging`.
+
+        :param qoi: Model evaluations at the training samples.
+        """
+        return None
+
+    def _evaluate_in_chunks(self, surrogate, population, n_add, scores, largest, criterion):
+        """
+        Stream `population` through the surrogate in chunks of `chunk_size` points, optionally in a pool of
+        `n_threads` threads, keeping only the best `n_add` points of each chunk and a reduction of the stopping
+        criterion. Memory is therefore bounded by the chunk size rather than the population size.
+
+        :param surrogate: Surrogate model with a :meth:`predict` method.
+        :param population: Points at which the learning function is evaluated.
+        :param n_add: Number of points to select.
+        :param scores: Callable ``scores(g, sig, points)`` returning the learning function values and the values
+         entering the stopping criterion, as arrays of shape ``(len(points), 1)``.
+        :param largest: If :any:`True` the points with the largest learning function values are selected,
+         otherwise the points with the smallest values.
+        :param criterion: Reduction applied to the stopping criterion values (e.g. :func:`numpy.min`).
+        :return: Indices of the selected points in ascending order of the learning function for the smallest
+         values, or in the order of :func:`numpy.argsort` for the largest values, the learning function values of the
+         selected points and the reduced stopping criterion value.
+        """
+        n_points = population.shape[0]
+        chunk_size = getattr(self, "chunk_size", None) or n_points
+        n_threads = getattr(self, "n_threads", 1)
+
+        def evaluate_chunk(start):
+            points = population if chunk_size >= n_points else population[start:start + chunk_size]
+            g, sig = self._predict_rows(surrogate, points, slice(start, start + points.shape[0]))
+            # Remove the inconsistency in the shape of 'g' and 'sig' array
+            g = g.reshape([points.shape[0], 1])
+            sig = sig.reshape([points.shape[0], 1])
+            values, criterion_values = scores(g, sig, points)
+            rows = self._select(values[:, 0], n_add, largest)
+            return start + rows, values[rows, :], criterion(criterion_values)
+
+        starts = range(0, n_points, chunk_size)
+        if n_threads > 1 and len(starts) > 1:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                results = list(executor.map(evaluate_chunk, starts))
+        else:
+            results = [evaluate_chunk(start) for start in starts]
+
+        if len(results) == 1:
+            return results[0]
+        rows = np.concatenate([result[0] for result in results])
+        values = np.concatenate([result[1] for result in results])
+        best = self._select(values[:, 0], n_add, largest)
+        return rows[best], values[best, :], criterion([result[2] for result in results])
+
+    def predict_in_chunks(self, surrogate, points):
+        """
+        Predict the mean and standard deviation of `surrogate` at `points` in chunks of `chunk_size` points,
+        optionally in a pool of `n_threads` threads, as the learning function evaluates the population.
+
+        :param surrogate: Surrogate model with a :meth:`predict` method.
+        :param points: Points at which to predict.
+        :return: Predicted mean and standard deviation, as 1-D arrays.
+        """
+        n_points = points.shape[0]
+        chunk_size = getattr(self, "chunk_size", None) or max(n_points, 1)
+        n_threads = getattr(self, "n_threads", 1)
+
+        def predict_chunk(start):
+            chunk = points if chunk_size >= n_points else points[start:start + chunk_size]
+            mean, std = surrogate.predict(chunk, True)
+            return np.reshape(mean, -1), np.reshape(std, -1)
+
+        starts = range(0, n_points, chunk_size)
+        if n_threads > 1 and len(starts) > 1:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                results = list(executor.map(predict_chunk, starts))
+        else:
+            results = [predict_chunk(start) for start in starts]
+        if len(results) == 0:
+            return np.zeros(0), np.zeros(0)
+        return np.concatenate([result[0] for result in results]), np.concatenate([result[1] for result in results])
+
+    @staticmethod
+    def _predict_rows(surrogate, points, rows):
+        # Surrogates serving cached predictions on the population (fixed population of AdaptiveKriging) are queried
+        # by the rows of the chunk, other surrogates predict at the points of the chunk
+        if hasattr(surrogate, "predict_rows"):
+            return surrogate.predict_rows(rows, True)
+        return surrogate.predict(points, True)
+
+    @staticmethod
+    def _select(values, n_add, largest):
+        return values.argsort()[max(np.size(values) - n_add, 0):] if largest else values.argsort()[:n_add]
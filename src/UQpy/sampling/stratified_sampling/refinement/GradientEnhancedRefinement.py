@@ -5,7 +5,7 @@ from UQpy.surrogates.baseclass import Surrogate
 from UQpy.utilities.ValidationTypes import *
 from UQpy.run_model.RunModel import RunModel
 from UQpy.sampling.stratified_sampling.refinement.baseclass.Refinement import *
-from UQpy.utilities.Utilities import gradient
+from UQpy.utilities.Utilities import gradient, fit_or_update
 from UQpy.sampling.stratified_sampling.strata.VoronoiStrata import VoronoiStrata
 from UQpy.sampling.stratified_sampling.strata.baseclass.Strata import Strata
 
@@ -121,7 +121,7 @@ class GradientEnhancedRefinement(Refinement):
             First-order gradient evaluated at the points 'xt' using central difference.
         """
         if self.surrogate is not None:
-            self.surrogate.fit(prediction_points, values)
+            fit_or_update(self.surrogate, prediction_points, values)
             self.surrogate.optimizations_number = 1
             prediction_function = self.surrogate.predict
         else:
@@ -1,3 +1,4 @@
+import itertools
 from typing import Annotated
 
 import numpy as np
@@ -21,6 +22,9 @@ class PceSensitivity:
         """PCE estimates for the first order Sobol indices"""
         self.total_order_indices = None
         """PCE estimates for the total order Sobol indices"""
+        self.second_order_indices = None
+        """PCE estimates for the second order Sobol indices, of shape `(num_second_order_terms, n_outputs)`, where the
+        pairs of inputs are ordered as in :func:`itertools.combinations`"""
         self.generalized_first_order_indices = None
         """PCE estimates of generalized first order Sobol indices, which characterize
         the sensitivity of a vector-valued quantity of interest on the random
@@ -29,89 +33,129 @@ class PceSensitivity:
         """PCE estimates of generalized total order Sobol indices, which characterize
         the sensitivity of a vector-valued quantity of interest on the random
         inputs."""
+        self._multi_index_set = None
+        self._active = None
+        self._orders = None
 
-    def run(self):
+    def run(self, outputs=None, estimate_second_order: bool = False):
         """
         This method calculates and saves as attributes first and total order as well as generalized sensitivity indices.
-        """
-        self.calculate_first_order_indices()
-        self.calculate_total_order_indices()
-        self.calculate_generalized_first_order_indices()
-        self.calculate_generalized_total_order_indices()
+        The generalized indices are only computed for more than one input.
+
+        The partial variances of all requested indices are computed with a single product of the masks of the
+        multi-indices and the squared coefficients of the requested outputs.
 
-    def calculate_first_order_indices(self) -> np.ndarray:
+        :param outputs: Indices of the outputs for which the sensitivity indices are computed, e.g. a list of integers,
+         a boolean mask or a slice. The coefficients of the other outputs are not accessed. Default: :any:`None`, i.e.
+         all outputs.
+        :param estimate_second_order: If True, the second order Sobol indices are also computed.
+        """
+        inputs_number = self.pce_object.inputs_number
+        masks = [self._first_order_masks(), self._total_order_masks()]
+        if estimate_second_order:
+            masks.append(self._second_order_masks())
+        variances, partial_variances = self._partial_variances(np.vstack(masks), outputs)
+        self.first_order_indices = partial_variances[:inputs_number] / variances
+        self.total_order_indices = partial_variances[inputs_number:2 * inputs_number] / variances
+        if estimate_second_order:
+            self.second_order_indices = partial_variances[2 * inputs_number:] / variances
+        if inputs_number > 1:
+            self.generalized_first_order_indices = self._generalize(partial_variances[:inputs_number], variances)
+            self.generalized_total_order_indices = self._generalize(
+                partial_variances[inputs_number:2 * inputs_number], variances)
+
+    def calculate_first_order_indices(self, outputs=None) -> np.ndarray:
         """
         PCE estimates for the first order Sobol indices.
 
+        :param outputs: Indices of the outputs for which the sensitivity indices are computed. Default: :any:`None`,
+         i.e. all outputs.
         :return: First order Sobol indices.
         """
-        outputs_number = np.shape(self.pce_object.coefficients)[1]
-        variance = self.pce_object.get_moments()[1]
-        inputs_number = self.pce_object.inputs_number
-        multi_index_set = self.pce_object.multi_index_set
+        variances, partial_variances = self._partial_variances(self._first_order_masks(), outputs)
+        self.first_order_indices = partial_variances / variances
+        return self.first_order_indices
 
-        first_order_indices = np.zeros([inputs_number, outputs_number])
-        # take all multi-indices except 0-index
-        idx_no_0 = np.delete(multi_index_set, 0, axis=0)
-        for nn in range(inputs_number):
-            # remove nn-th column
-            idx_no_0_nn = np.delete(idx_no_0, nn, axis=1)
-            # we want the rows with all indices (except nn) equal to zero
-            sum_idx_rows = np.sum(idx_no_0_nn, axis=1)
-            zero_rows = np.asarray(np.where(sum_idx_rows == 0)).flatten() + 1
-            variance_contribution = np.sum(self.pce_object.coefficients[zero_rows, :] ** 2, axis=0)
-            first_order_indices[nn, :] = variance_contribution / variance
-        self.first_order_indices = first_order_indices
-        return first_order_indices
-
-    def calculate_total_order_indices(self) -> np.ndarray:
+    def calculate_total_order_indices(self, outputs=None) -> np.ndarray:
         """
         PCE estimates for the total order Sobol indices.
 
+        :param outputs: Indices of the outputs for which the sensitivity indices are computed. Default: :any:`None`,
+         i.e. all outputs.
         :return: Total order Sobol indices.
         """
-        outputs_number = np.shape(self.pce_object.coefficients)[1]
-        variance = self.pce_object.get_moments()[1]
-        inputs_number = self.pce_object.inputs_number
-        multi_index_set = self.pce_object.multi_index_set
+        variances, partial_variances = self._partial_variances(self._total_order_masks(), outputs)
+        self.total_order_indices = partial_variances / variances
+        return self.total_order_indices
 
-        total_order_indices = np.zeros([inputs_number, outputs_number])
-        for nn in range(inputs_number):
-            # we want all multi-indices where the nn-th index is NOT zero
-            idx_column_nn = np.array(multi_index_set)[:, nn]
-            nn_rows = np.asarray(np.where(idx_column_nn != 0)).flatten()
-            variance_contribution = np.sum(self.pce_object.coefficients[nn_rows, :] ** 2, axis=0)
-            total_order_indices[nn, :] = variance_contribution / variance
-        self.total_order_indices = total_order_indices
-        return total_order_indices
+    def calculate_second_order_indices(self, outputs=None) -> np.ndarray:
+        """
+        PCE estimates for the second order Sobol indices, from the coefficients of the polynomials that depend on
+        exactly two inputs.
+
+        :param outputs: Indices of the outputs for which the sensitivity indices are computed. Default: :any:`None`,
+         i.e. all outputs.
+        :return: Second order Sobol indices, of shape `(num_second_order_terms, n_outputs)`.
+        """
+        variances, partial_variances = self._partial_variances(self._second_order_masks(), outputs)
+        self.second_order_indices = partial_variances / variances
+        return self.second_order_indices
 
-    def calculate_generalized_first_order_indices(self) -> np.ndarray:
+    def calculate_interaction_indices(self, order: int, outputs=None):
+        """
+        PCE estimates for the Sobol indices of the interactions of a given order, i.e. of the sets of `order` inputs
+        whose joint effect is represented by polynomials of the basis. Sets of inputs without polynomials in the basis
+        have vanishing indices and are omitted, such that the number of terms is bounded by the size of the basis.
+
+        :param order: Interaction order, i.e. number of inputs of each set.
+        :param outputs: Indices of the outputs for which the sensitivity indices are computed. Default: :any:`None`,
+         i.e. all outputs.
+        :return: Sets of inputs of shape `(num_terms, order)` and the corresponding Sobol indices of shape
+         `(num_terms, n_outputs)`.
+        """
+        active, orders = self._masks()
+        rows = np.flatnonzero(orders == order)
+        squared_coefficients = self._squared_coefficients(outputs)
+        variances = np.sum(squared_coefficients[orders > 0], axis=0)
+        if len(rows) == 0:
+            return np.zeros((0, order), dtype=int), np.zeros((0, squared_coefficients.shape[1]))
+        # The polynomials of each set of inputs are sorted contiguously and their squared coefficients are summed
+        terms, inverse = np.unique(active[rows], axis=0, return_inverse=True)
+        permutation = np.argsort(inverse, kind="stable")
+        starts = np.searchsorted(inverse[permutation], np.arange(len(terms)))
+        partial_variances = np.add.reduceat(squared_coefficients[rows[permutation]], starts, axis=0)
+        # Sets of inputs in the order of itertools.combinations
+        terms = np.nonzero(terms)[1].reshape(-1, order)
+        sorting = np.lexsort(terms.T[::-1])
+        return terms[sorting], partial_variances[sorting] / variances
+
+    def calculate_generalized_first_order_indices(self, outputs=None) -> np.ndarray:
         """
         PCE estimates of generalized first order Sobol indices, which characterize
         the sensitivity of a vector-valued quantity of interest on the random
         inputs.
 
+        :param outputs: Indices of the outputs of the vector-valued quantity of interest. Default: :any:`None`, i.e.
+         all outputs.
         :return: Generalized first order Sobol indices.
         """
         inputs_number = self.pce_object.inputs_number
         if inputs_number == 1:
             raise ValueError('Not applicable for scalar model outputs.')
 
-        variance = self.pce_object.get_moments()[1]
-        first_order_indices = self.calculate_first_order_indices()
-        variance_contributions = first_order_indices * variance
-        total_variance = np.sum(variance)
-        total_variance_contribution_per_input = np.sum(variance_contributions, axis=1)
-        generalized_first_order_indices = total_variance_contribution_per_input / total_variance
-        self.generalized_first_order_indices = generalized_first_order_indices
-        return generalized_first_order_indices
+        variances, partial_variances = self._partial_variances(self._first_order_masks(), outputs)
+        self.first_order_indices = partial_variances / variances
+        self.generalized_first_order_indices = self._generalize(partial_variances, variances)
+        return self.generalized_first_order_indices
 
-    def calculate_generalized_total_order_indices(self):
+    def calculate_generalized_total_order_indices(self, outputs=None) -> np.ndarray:
         """
         PCE estimates of generalized total order Sobol indices, which characterize
         the sensitivity of a vector-valued quantity of interest on the random
         inputs.
 
+        :param outputs: Indices of the outputs of the vector-valued quantity of interest. Default: :any:`None`, i.e.
+         all outputs.
         :return: Generalized total order Sobol indices.
         """
         inputs_number = self.pce_object.inputs_number
@@ -119,11 +163,48 @@ class PceSensitivity:
         if inputs_number == 1:
             raise ValueError('Not applicable for scalar model outputs.')
 
-        variance = self.pce_object.get_moments()[1]
-        total_order_indices = self.calculate_total_order_indices()
-        variance_contributions = total_order_indices * variance
-        total_variance = np.sum(variance)
-        total_variance_contribution_per_input = np.sum(variance_contributions, axis=1)
-        generalized_total_order_indices = total_variance_contribution_per_input / total_variance
-        self.generalized_total_order_indices = generalized_total_order_indices
-        return generalized_total_order_indices
+        variances, partial_variances = self._partial_variances(self._total_order_masks(), outputs)
+        self.total_order_indices = partial_variances / variances
+        self.generalized_total_order_indices = self._generalize(partial_variances, variances)
+        return self.generalized_total_order_indices
+
+    @staticmethod
+    def _generalize(partial_variances, variances):
+        return np.sum(partial_variances, axis=1) / np.sum(variances)
+
+    def _masks(self):
+        # Boolean masks of the inputs on which each polynomial depends and interaction orders of the polynomials,
+        # built once per multi-index set
+        multi_index_set = self.pce_object.multi_index_set
+        if self._multi_index_set is not multi_index_set:
+            self._active = np.asarray(multi_index_set) != 0
+            self._orders = np.sum(self._active, axis=1)
+            self._multi_index_set = multi_index_set
+        return self._active, self._orders
+
+    def _first_order_masks(self):
+        active, orders = self._masks()
+        return (active & (orders == 1)[:, None]).T
+
+    def _total_order_masks(self):
+        return self._masks()[0].T
+
+    def _second_order_masks(self):
+        active, orders = self._masks()
+        pairs = np.array(list(itertools.combinations(range(active.shape[1]), 2)), dtype=int).reshape(-1, 2)
+        return (active[:, pairs[:, 0]] & active[:, pairs[:, 1]] & (orders == 2)[:, None]).T
+
+    def _squared_coefficients(self, outputs):
+        coefficients = self.pce_object.coefficients
+        coefficients = coefficients.reshape(coefficients.shape[0], -1)
+        if outputs is not None:
+            coefficients = coefficients[:, outputs]
+        return coefficients ** 2
+
+    def _partial_variances(self, masks, outputs):
+        # Partial variances of all masks and variances of the requested outputs, from one product with the squared
+        # coefficients
+        squared_coefficients = self._squared_coefficients(outputs)
+        nonconstant = self._masks()[1] > 0
+        products = np.vstack([masks, nonconstant]).astype(squared_coefficients.dtype) @ squared_coefficients
+        return products[-1], products[:-1]
@@ -1,7 +1,18 @@
+import importlib
+import json
+import logging
+import struct
+import zipfile
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class Surrogate(ABC):
+
+    format_version = 1
+    """Version of the file format written by :meth:`save`."""
+
     @abstractmethod
     def fit(self, samples, values):
         pass
@@ -9,3 +20,114 @@ class Surrogate(ABC):
     @abstractmethod
     def predict(self, points, return_std=False):
         pass
+
+    def save(self, path):
+        """
+        Save a fitted surrogate model without pickling it.
+
+        Only the arrays required by :meth:`predict` (e.g. multi-index set and coefficients, or Cholesky factor,
+        hyperparameters and normalization constants) are written to an uncompressed ``.npz`` file, together with a
+        versioned JSON description of the components of the surrogate (kernel, regression model, distributions).
+        Training data that is not required for prediction, optimizers and loggers are not saved.
+
+        :param path: Path of the file. The extension ``.npz`` is appended if it is missing.
+        """
+        arrays, metadata = self._export()
+        metadata = dict(metadata, surrogate=_qualified_name(self), format_version=Surrogate.format_version)
+        arrays = {name: np.asarray(array) for name, array in arrays.items() if array is not None}
+        np.savez(path, metadata=np.array(json.dumps(metadata)), **arrays)
+
+    @staticmethod
+    def load(path, mmap_mode: str = "r"):
+        """
+        Load a surrogate model saved with :meth:`save`.
+
+        The returned object is a lean instance of the saved class, meant for :meth:`predict`: it is created without
+        running the constructor and does not hold the training values. Surrogates whose settings are all saved, such as
+        the regression method of a :class:`.PolynomialChaosExpansion`, can also be fitted again to new data.
+
+        :param path: Path of the ``.npz`` file.
+        :param mmap_mode: If "r", the arrays are memory-mapped read-only from the file instead of being read into
+         memory. If :any:`None`, the arrays are read into memory.
+         Default: "r"
+        :return: The surrogate model.
+        """
+        arrays = _read_arrays(path, mmap_mode)
+        metadata = json.loads(str(arrays.pop("metadata")))
+        if metadata["format_version"] > Surrogate.format_version:
+            raise ValueError("UQpy: The file was written by a newer version of the surrogate format ({0} > {1})."
+                             .format(metadata["format_version"], Surrogate.format_version))
+        surrogate_class = _import_class(metadata["surrogate"])
+        surrogate = surrogate_class.__new__(surrogate_class)
+        surrogate.logger = logging.getLogger(surrogate_class.__module__)
+        surrogate._import(arrays, metadata)
+        return surrogate
+
+    def _export(self):
+        """
+        Return the arrays and the JSON-serializable metadata required to predict with the surrogate.
+        """
+        raise NotImplementedError("UQpy: Saving is not supported for {0}.".format(type(self).__name__))
+
+    def _import(self, arrays, metadata):
+        """
+        Restore the attributes required by :meth:`predict` from the output of :meth:`_export`.
+        """
+        raise NotImplementedError("UQpy: Loading is not supported for {0}.".format(type(self).__name__))
+
+    @staticmethod
+    def _describe(component):
+        # Class and scalar attributes of a stateless component, e.g. a kernel or a regression model
+        if component is None:
+            return None
+        attributes = {name: value for name, value in vars(component).items()
+                      if isinstance(value, (bool, int, float, str, type(None)))}
+        return {"class": _qualified_name(component), "attributes": attributes}
+
+    @staticmethod
+    def _restore(description):
+        # Components described by constructor parameters (e.g. distributions) are constructed, other components are
+        # restored from their attributes
+        if description is None:
+            return None
+        component_class = _import_class(description["class"])
+        if "parameters" in description:
+            return component_class(**description["parameters"])
+        component = component_class.__new__(component_class)
+        component.__dict__.update(description["attributes"])
+        return component
+
+
+def _qualified_name(obj):
+    return type(obj).__module__ + "." + type(obj).__qualname__
+
+
+def _import_class(name):
+    module, _, class_name = name.rpartition(".")
+    if not module.startswith("UQpy."):
+        raise ValueError("UQpy: Only UQpy classes can be loaded, got {0}.".format(name))
+    return getattr(importlib.import_module(module), class_name)
+
+
+def _read_arrays(path, mmap_mode):
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as file:
+        for info in archive.infolist():
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if mmap_mode is not None and info.compress_type == zipfile.ZIP_STORED:
+                # Data of a stored member: local file header of 30 bytes, file name, extra field, .npy header
+                file.seek(info.header_offset + 26)
+                name_length, extra_length = struct.unpack("<HH", file.read(4))
+                file.seek(info.header_offset + 30 + name_length + extra_length)
+                version = np.lib.format.read_magic(file)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+                if len(shape) > 0 and np.prod(shape) > 0 and not dtype.hasobject:
+                    arrays[name] = np.memmap(path, dtype=dtype, mode=mmap_mode, offset=file.tell(), shape=shape,
+                                             order="F" if fortran_order else "C")
+                    continue
+            with archive.open(info) as member:
+                arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+    return arrays
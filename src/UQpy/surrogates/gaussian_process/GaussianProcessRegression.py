@@ -1,13 +1,16 @@
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union
+
 import numpy as np
-from scipy.linalg import cholesky, cho_solve
+from scipy.linalg import cholesky, cho_solve, solve_triangular
 
 from beartype import beartype
 
 
 from UQpy.utilities.Utilities import process_random_state
 from UQpy.surrogates.baseclass.Surrogate import Surrogate
-from UQpy.utilities.ValidationTypes import RandomStateType
+from UQpy.utilities.ValidationTypes import RandomStateType, PositiveInteger, PositiveFloat
 from UQpy.surrogates.gaussian_process.kernels.baseclass.Kernel import Kernel
 from UQpy.surrogates.gaussian_process.constraints.baseclass.Constraints import ConstraintsGPR
 from UQpy.surrogates.gaussian_process.regression_models.baseclass.Regression import Regression
@@ -27,6 +30,10 @@ class GaussianProcessRegression(Surrogate):
             normalize: bool = False,
             noise: bool = False,
             random_state: RandomStateType = None,
+            reoptimization_interval: Union[None, PositiveInteger] = 1,
+            likelihood_drift: Union[None, PositiveFloat] = None,
+            ntasks: PositiveInteger = 1,
+            optimization_objective: str = "likelihood",
     ):
         """
         GaussianProcessRegressor an Gaussian process regression-based surrogate model to predict the model output at
@@ -58,7 +65,24 @@ class GaussianProcessRegression(Surrogate):
         :param random_state: Random seed used to initialize the pseudo-random number generator. If an integer is
          provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise, the
          object itself can be passed directly.
+        :param reoptimization_interval: Number of training points added with the :meth:`update` method after which the
+         hyperparameters are re-optimized with a complete :meth:`fit`. If :any:`None`, the hyperparameters are only
+         re-optimized if the `likelihood_drift` criterion is met.
+         Default: 1, i.e. every call of :meth:`update` is equivalent to a :meth:`fit` using all training points.
+        :param likelihood_drift: The hyperparameters are re-optimized by the :meth:`update` method if the negative
+         log-likelihood per training point, evaluated with fixed hyperparameters, changes by more than this value
+         compared to its value after the last optimization.
+         Default: None
+        :param ntasks: Number of processes used to run the `optimizations_number` MLE optimizations in parallel.
+         Parallel execution is not available together with `optimize_constraints`.
+         Default: 1
+        :param optimization_objective: Objective minimized to estimate the hyperparameters. Options: "likelihood" (the
+         negative log-likelihood) and "leave_one_out" (the negative leave-one-out log predictive probability, computed
+         in closed form).
+         Default: "likelihood"
         """
+        if optimization_objective not in ["likelihood", "leave_one_out"]:
+            raise ValueError("UQpy: optimization_objective must be either 'likelihood' or 'leave_one_out'.")
         self.regression_model = regression_model
         self.kernel = kernel
         self.hyperparameters = np.array(hyperparameters)
@@ -70,6 +94,10 @@ class GaussianProcessRegression(Surrogate):
         self.noise = noise
         self.logger = logging.getLogger(__name__)
         self.random_state = random_state
+        self.reoptimization_interval = reoptimization_interval
+        self.likelihood_drift = likelihood_drift
+        self.ntasks = ntasks
+        self.optimization_objective = optimization_objective
 
         # Variables are used outside the __init__
         self.samples = None
@@ -89,6 +117,10 @@ class GaussianProcessRegression(Surrogate):
         self.F, self.K = None, None
         self.cc, self.alpha_ = None, None
         self.mu = 0
+        self._points_since_optimization = 0
+        self._reference_likelihood = None
+        self._fitted_hyperparameters = None
+        self._cached_posterior = None
 
         if bounds is None:
             if isinstance(self.optimizer, type(None)) or isinstance(self.optimizer._bounds, type(None)):
@@ -122,7 +154,10 @@ class GaussianProcessRegression(Surrogate):
         starting point.
 
         :param samples: `ndarray` containing the training points.
-        :param values: `ndarray` containing the model evaluations at the training points.
+        :param values: `ndarray` containing the model evaluations at the training points. If `values` has shape
+         ``(nsamples, output_dim)`` with `output_dim` > 1, the outputs share the kernel and its hyperparameters: the
+         hyperparameters are estimated once from the log-likelihood summed over all outputs and the correlation matrix
+         is factorized once, such that all outputs are predicted with a single matrix product.
         :param optimizations_number: number of optimization iterations
         :param hyperparameters: List or array of initial values for the kernel hyperparameters/scale parameters.
 
@@ -136,6 +171,8 @@ class GaussianProcessRegression(Surrogate):
         if hyperparameters is not None:
             self.hyperparameters = np.array(hyperparameters)
         self.samples = np.array(samples)
+        # Invalidate the factorization of the previous training set
+        self.cc, self.alpha_, self._cached_posterior = None, None, None
 
         # Number of samples and dimensions of samples and values
         nsamples, input_dim = self.samples.shape
@@ -156,6 +193,8 @@ class GaussianProcessRegression(Surrogate):
         if self.normalize:
             self.sample_mean, self.sample_std = np.mean(self.samples, 0), np.std(self.samples, 0)
             self.value_mean, self.value_std = np.mean(self.values, 0), np.std(self.values, 0)
+            # Constant outputs (e.g. fixed entries of field outputs) are only centered
+            self.value_std[self.value_std == 0] = 1
             s_ = (self.samples - self.sample_mean) / self.sample_std
             y_ = (self.values - self.value_mean) / self.value_std
         else:
@@ -167,8 +206,6 @@ class GaussianProcessRegression(Surrogate):
 
         # Maximum Likelihood Estimation : Solving optimization problem to calculate hyperparameters
         if self.optimizer is not None:
-            # To ensure that cholesky of covariance matrix is computed again during optimization
-            self.alpha_ = None
             lb = [np.log10(xy[0]) for xy in self.bounds]
             ub = [np.log10(xy[1]) for xy in self.bounds]
 
@@ -186,16 +223,26 @@ class GaussianProcessRegression(Surrogate):
             minimizer = np.zeros([self.optimizations_number, len(self.bounds)])
             fun_value = np.zeros([self.optimizations_number, 1])
 
-            for i__ in range(self.optimizations_number):
-                p_ = self.optimizer.optimize(function=GaussianProcessRegression.log_likelihood,
-                                             initial_guess=starting_point[i__, :],
-                                             args=(self.kernel, s_, y_, self.noise, self.F),
-                                             jac=self.jac)
+            objective = GaussianProcessRegression.log_likelihood
+            if self.optimization_objective == "leave_one_out":
+                objective = GaussianProcessRegression.leave_one_out_objective
+            # Analytic gradients of the log-likelihood are used if both the kernel and the optimizer support them
+            self.jac = self.optimization_objective == "likelihood" and self.kernel.supports_derivatives() and \
+                getattr(self.optimizer, "supports_jacobian", lambda: False)()
+            function = GaussianProcessRegression.log_likelihood_and_gradient if self.jac else objective
+            arguments = [(self.optimizer, function, starting_point[i__, :], (self.kernel, s_, y_, self.noise, self.F),
+                          self.jac) for i__ in range(self.optimizations_number)]
+
+            if self.ntasks > 1 and self.optimizations_number > 1 and self.optimize_constraints is None:
+                with ProcessPoolExecutor(max_workers=self.ntasks) as executor:
+                    results = list(executor.map(_optimize, *zip(*arguments)))
+            else:
+                results = [_optimize(*argument) for argument in arguments]
 
+            for i__, p_ in enumerate(results):
                 if isinstance(p_, np.ndarray):
                     minimizer[i__, :] = p_
-                    fun_value[i__, 0] = GaussianProcessRegression.log_likelihood(p_, self.kernel, s_, y_,
-                                                                                 self.noise, self.F)
+                    fun_value[i__, 0] = objective(p_, self.kernel, s_, y_, self.noise, self.F)
                 else:
                     minimizer[i__, :] = p_.x
                     fun_value[i__, 0] = p_.fun
@@ -207,108 +254,334 @@ class GaussianProcessRegression(Surrogate):
             self.hyperparameters = 10**minimizer[t, :]
 
         # Updated Correlation matrix corresponding to MLE estimates of hyperparameters
-        if self.noise:
-            self.K = self.kernel.c(x=s_, s=s_, params=self.hyperparameters[:-1]) + \
-                     np.eye(nsamples)*(self.hyperparameters[-1])**2
+        self.K, self.cc, self.alpha_, self.beta, self.mu = self._factorize(s_, y_, self.hyperparameters)
+        self._fitted_hyperparameters = np.array(self.hyperparameters, copy=True)
+
+        self._points_since_optimization = 0
+        self._reference_likelihood = self._likelihood_per_point(y_)
+        self.logger.info("UQpy: gpr fit complete.")
+
+    def update(self, new_samples, new_values, optimizations_number=None, reoptimize: Union[None, bool] = None):
+        """
+        Add training points to a fitted surrogate model.
+
+        The Cholesky decomposition of the correlation matrix is extended with a block update, while the hyperparameters
+        (and the normalization constants, if `normalize` is :any:`True`) are held fixed. This reduces the cost of adding
+        :math:`q` points to :math:`n` training points from :math:`O((n+q)^3)` to :math:`O(n^2q)`. The hyperparameters
+        are re-optimized with a complete :meth:`fit` according to the `reoptimization_interval` and `likelihood_drift`
+        attributes.
+
+        :param new_samples: `ndarray` containing the new training points.
+        :param new_values: `ndarray` containing the model evaluations at the new training points.
+        :param optimizations_number: number of optimization iterations, used if the hyperparameters are re-optimized.
+        :param reoptimize: If :any:`True`, the hyperparameters are re-optimized with a complete :meth:`fit`. If
+         :any:`False`, they are held fixed regardless of the `reoptimization_interval` and `likelihood_drift`
+         attributes. Default: :any:`None`, i.e. these attributes decide.
+        """
+        if self.cc is None:
+            raise RuntimeError("UQpy: The surrogate must be fitted before it can be updated.")
+        new_samples = np.atleast_2d(new_samples)
+        n_new = new_samples.shape[0]
+        if n_new == 0:
+            return
+        new_values = np.array(new_values).reshape(n_new, self.values.shape[1])
+        samples = np.vstack([self.samples, new_samples])
+        values = np.vstack([self.values, new_values])
+
+        self._points_since_optimization += n_new
+        interval_reached = self.reoptimization_interval is not None and \
+            self._points_since_optimization >= self.reoptimization_interval
+        if self.optimizer is not None and (reoptimize or (reoptimize is None and interval_reached)):
+            self.fit(samples, values, optimizations_number=optimizations_number)
+            return
+
+        self.logger.info("UQpy: Running gpr.update")
+        if self.normalize:
+            s_old = (self.samples - self.sample_mean) / self.sample_std
+            s_new = (new_samples - self.sample_mean) / self.sample_std
+            y_ = (values - self.value_mean) / self.value_std
         else:
-            self.K = self.kernel.c(x=s_, s=s_, params=self.hyperparameters)
+            s_old, s_new, y_ = self.samples, new_samples, values
 
-        self.cc = cholesky(self.K + 1e-10 * np.eye(nsamples), lower=True)
-        self.alpha_ = cho_solve((self.cc, True), y_)
+        kernelparameters, noise_variance = self.hyperparameters, 0
+        if self.noise:
+            kernelparameters, noise_variance = self.hyperparameters[:-1], self.hyperparameters[-1] ** 2
+
+        # Block Cholesky decomposition: [[K11, K12], [K21, K22]] = [[L11, 0], [L21, L22]] @ [[L11, 0], [L21, L22]].T
+        k_12 = self.kernel.c(x=s_old, s=s_new, params=kernelparameters)
+        k_22 = self.kernel.c(x=s_new, s=s_new, params=kernelparameters) + np.eye(n_new) * noise_variance
+        l_21 = solve_triangular(self.cc, k_12, lower=True).T
+        try:
+            l_22 = cholesky(k_22 + 1e-10 * np.eye(n_new) - l_21 @ l_21.T, lower=True)
+        except np.linalg.LinAlgError:
+            self.logger.warning("UQpy: Block update of the Cholesky decomposition failed, refitting the surrogate.")
+            self.fit(samples, values, optimizations_number=optimizations_number)
+            return
+
+        self.samples, self.values = samples, values
+        self._cached_posterior = None
+        self.K = np.block([[self.K, k_12], [k_12.T, k_22]])
+        self.cc = np.block([[self.cc, np.zeros((self.cc.shape[0], n_new))], [l_21, l_22]])
 
+        if self.regression_model is not None:
+            self.F = np.vstack([self.F, self.regression_model.r(s_new)])
+            f_dash = solve_triangular(self.cc, self.F, lower=True)
+            y_dash = solve_triangular(self.cc, y_, lower=True)
+            q_, g_ = np.linalg.qr(f_dash)
+            if np.linalg.matrix_rank(g_) != min(np.size(self.F, 0), np.size(self.F, 1)):
+                raise NotImplementedError("Chosen regression functions are not sufficiently linearly independent")
+            self.beta = np.linalg.solve(g_, np.matmul(np.transpose(q_), y_dash))
+            self.mu = np.einsum("ij,jk->ik", self.F, self.beta)
+        self.alpha_ = cho_solve((self.cc, True), y_ - self.mu)
+
+        if self.optimizer is not None and self.likelihood_drift is not None and reoptimize is not False:
+            drift = abs(self._likelihood_per_point(y_) - self._reference_likelihood)
+            if drift > self.likelihood_drift:
+                self.logger.info("UQpy: Log-likelihood drift %(drift)s, re-optimizing the hyperparameters."
+                                 % {"drift": drift})
+                self.fit(self.samples, self.values, optimizations_number=optimizations_number)
+                return
+        self.logger.info("UQpy: gpr update complete.")
+
+    def _likelihood_per_point(self, y_):
+        # Negative log-likelihood per training point, evaluated with the current factorization.
+        m, n_outputs = y_.shape
+        term1 = np.sum((y_ - self.mu) * self.alpha_)
+        term2 = 2 * np.sum(np.log(np.abs(np.diag(self.cc))))
+        return 0.5 * (term1 + n_outputs * (term2 + m * np.log(2 * np.pi))) / m
+
+    def _factorize(self, s_, y_, hyperparameters):
+        # Cholesky decomposition of the correlation matrix and weights of the posterior mean for given hyperparameters
+        nsamples = s_.shape[0]
+        if self.noise:
+            k = self.kernel.c(x=s_, s=s_, params=hyperparameters[:-1]) + \
+                np.eye(nsamples) * (hyperparameters[-1]) ** 2
+        else:
+            k = self.kernel.c(x=s_, s=s_, params=hyperparameters)
+        cc = cholesky(k + 1e-10 * np.eye(nsamples), lower=True)
+
+        beta, mu = None, 0
         if self.regression_model is not None:
             # Compute the regression coefficient (solving this linear equation: F * beta = Y)
             # Eq: 3.8, DACE
-            f_dash = np.linalg.solve(self.cc, self.F)
-            y_dash = np.linalg.solve(self.cc, y_)
+            f_dash = np.linalg.solve(cc, self.F)
+            y_dash = np.linalg.solve(cc, y_)
             q_, g_ = np.linalg.qr(f_dash)  # Eq: 3.11, DACE
             # Check if F is a full rank matrix
             if np.linalg.matrix_rank(g_) != min(np.size(self.F, 0), np.size(self.F, 1)):
                 raise NotImplementedError("Chosen regression functions are not sufficiently linearly independent")
             # Design parameters (beta: regression coefficient)
-            self.beta = np.linalg.solve(g_, np.matmul(np.transpose(q_), y_dash))
-            self.mu = np.einsum("ij,jk->ik", self.F, self.beta)
-            self.alpha_ = cho_solve((self.cc, True), y_ - self.mu)
-
-        self.logger.info("UQpy: gpr fit complete.")
-
-    def predict(self, points, return_std: bool = False, hyperparameters: list = None):
+            beta = np.linalg.solve(g_, np.matmul(np.transpose(q_), y_dash))
+            mu = np.einsum("ij,jk->ik", self.F, beta)
+        alpha_ = cho_solve((cc, True), y_ - mu)
+        return k, cc, alpha_, beta, mu
+
+    def _posterior(self, hyperparameters, s_):
+        # Factorization of the last fit, or of the last hyperparameters requested by predict (e.g. by the constraints
+        # of the MLE problem). It is recomputed only if the hyperparameters change.
+        if self.cc is not None and np.array_equal(hyperparameters, self._fitted_hyperparameters):
+            return self.cc, self.alpha_, self.beta
+        if self._cached_posterior is None or not np.array_equal(hyperparameters, self._cached_posterior[0]):
+            if self.values is None:
+                raise RuntimeError("UQpy: The training values are required to predict with new hyperparameters.")
+            y_ = (self.values - self.value_mean) / self.value_std if self.normalize else self.values
+            _, cc, alpha_, beta, _ = self._factorize(s_, y_, hyperparameters)
+            self._cached_posterior = (np.array(hyperparameters, copy=True), cc, alpha_, beta)
+        return self._cached_posterior[1:]
+
+    def predict(self, points, return_std: bool = False, hyperparameters: list = None, dtype=np.float64,
+                regression_values=None):
         """
         Predict the model response at new points.
 
         This method evaluates the regression and correlation model at new sample points. Then, it predicts the function
-        value and standard deviation.
+        value and standard deviation. The Cholesky decomposition computed by :meth:`fit` is reused, unless different
+        `hyperparameters` are provided, in which case the decomposition is computed once and cached for subsequent
+        calls with the same hyperparameters.
 
         :param points: Points at which to predict the model response.
         :param return_std: Indicator to estimate standard deviation.
         :param hyperparameters: Hyperparameters for correlation model.
+        :param dtype: Floating point type of the predictions. If it is :class:`numpy.float32`, the cross-covariance
+         matrix between the new points and the training points is evaluated and multiplied by the weights of the
+         posterior mean in single precision, which requires a kernel whose :meth:`c` method accepts a `dtype`
+         argument. The regression model and the standard deviation, which is the square root of a difference of nearly
+         equal terms close to the training points, are still computed in double precision.
+         Default: :class:`numpy.float64`
+        :param regression_values: Regression functions evaluated at the new points, as an array of shape
+         ``(npoints, nfunctions)``, used instead of evaluating the regression model. This allows regression models
+         whose evaluation is expensive, such as the levels of a :class:`.MultiFidelityGaussianProcessRegression`, to
+         be evaluated by the caller.
+         Default: :any:`None`
         :return: Predicted values at the new points, Standard deviation of predicted values at the new points
         """
+        dtype = np.dtype(dtype)
         x_ = np.atleast_2d(points)
         if self.normalize:
             x_ = (x_ - self.sample_mean) / self.sample_std
             s_ = (self.samples - self.sample_mean) / self.sample_std
-            y_ = (self.values - self.value_mean) / self.value_std
         else:
             s_ = self.samples
-            y_ = self.values
 
         if hyperparameters is None:
             hyperparameters = self.hyperparameters
+        hyperparameters = np.array(hyperparameters)
 
-        noise_std = 0
-        kernelparameters = hyperparameters
-        if self.noise:
-            kernelparameters = hyperparameters[:-1]
-            noise_std = hyperparameters[-1]
-
-        if hyperparameters is not None:
-            # This is used for MLE constraints, if constraints call 'predict' method.
-            K = self.kernel.c(x=s_, s=s_, params=kernelparameters) + \
-                np.eye(self.samples.shape[0]) * (noise_std ** 2)
-            cc = np.linalg.cholesky(K + 1e-10 * np.eye(self.samples.shape[0]))
-            mu = 0
-            if self.regression_model is not None:
-                f_dash = np.linalg.solve(cc, self.F)
-                y_dash = np.linalg.solve(cc, y_)
-                q_, g_ = np.linalg.qr(f_dash)  # Eq: 3.11, DACE
-                # Check if F is a full rank matrix
-                if np.linalg.matrix_rank(g_) != min(np.size(self.F, 0), np.size(self.F, 1)):
-                    raise NotImplementedError("Chosen regression functions are not sufficiently linearly independent")
-                # Design parameters (beta: regression coefficient)
-                beta = np.linalg.solve(g_, np.matmul(np.transpose(q_), y_dash))
-                mu = np.einsum("ij,jk->ik", self.F, beta)
-            alpha_ = cho_solve((cc, True), y_-mu)
-        else:
-            cc, alpha_ = self.cc, self.alpha_
+        kernelparameters = hyperparameters[:-1] if self.noise else hyperparameters
+        cc, alpha_, beta = self._posterior(hyperparameters, s_)
 
         mu1 = 0
         if self.regression_model is not None:
-            fx = self.regression_model.r(x_)
-            if self.beta is None:
-                mu1 = np.einsum("ij,jk->ik", fx, beta)
-            else:
-                mu1 = np.einsum("ij,jk->ik", fx, self.beta)
+            fx = self.regression_model.r(x_) if regression_values is None else \
+                np.reshape(regression_values, (x_.shape[0], -1))
+            mu1 = np.einsum("ij,jk->ik", fx, beta)
 
-        k = self.kernel.c(x=x_, s=s_, params=kernelparameters)
-        y = mu1 + k @ alpha_
+        if dtype == np.float64:
+            k = self.kernel.c(x=x_, s=s_, params=kernelparameters)
+        else:
+            k = self.kernel.c(x=x_, s=s_, params=kernelparameters, dtype=dtype)
+        y = mu1 + k @ alpha_.astype(dtype, copy=False)
         if self.normalize:
             y = self.value_mean + y * self.value_std
-        if x_.shape[1] == 1:
+        n_outputs = y.shape[1]
+        if x_.shape[1] == 1 and n_outputs == 1:
             y = y.flatten()
+        y = y.astype(dtype, copy=False)
 
         if return_std:
-            k1 = self.kernel.c(x=x_, s=x_, params=kernelparameters)
-            var = (k1 - k @ cho_solve((cc, True), k.T)).diagonal()
+            # Only the diagonal of the posterior covariance is required: k(x, x) - ||L^{-1} k(s, x)||^2. It is shared
+            # by all outputs, up to the normalization constants.
+            v = solve_triangular(cc, k.T.astype(np.float64, copy=False), lower=True)
+            var = self.kernel.diagonal(x_, kernelparameters) - np.einsum("ij,ij->j", v, v)
+            if dtype != np.float64:
+                # The rounding of the cross-covariance may turn the variance negative close to the training points
+                var = np.maximum(var, 0)
             mse = np.sqrt(var)
-            if self.normalize:
+            if n_outputs > 1:
+                mse = np.outer(mse, self.value_std if self.normalize else np.ones(n_outputs))
+            elif self.normalize:
                 mse = self.value_std * mse
-            if x_.shape[1] == 1:
+            if x_.shape[1] == 1 and n_outputs == 1:
                 mse = mse.flatten()
-            return y, mse
+            return y, mse.astype(dtype, copy=False)
         else:
             return y
 
+    def _export(self):
+        arrays = {"samples": self.samples, "cc": self.cc, "alpha": self.alpha_, "beta": self.beta,
+                  "hyperparameters": self._fitted_hyperparameters, "sample_mean": self.sample_mean,
+                  "sample_std": self.sample_std, "value_mean": self.value_mean, "value_std": self.value_std}
+        metadata = {"kernel": self._describe(self.kernel), "regression_model": self._describe(self.regression_model),
+                    "noise": self.noise, "normalize": self.normalize}
+        return arrays, metadata
+
+    def _import(self, arrays, metadata):
+        self.kernel = self._restore(metadata["kernel"])
+        self.regression_model = self._restore(metadata["regression_model"])
+        self.noise, self.normalize = metadata["noise"], metadata["normalize"]
+        self.samples, self.values, self.F = arrays["samples"], None, None
+        self.cc, self.alpha_, self.beta = arrays["cc"], arrays["alpha"], arrays.get("beta")
+        self.hyperparameters = np.array(arrays["hyperparameters"])
+        self._fitted_hyperparameters, self._cached_posterior = self.hyperparameters, None
+        self.sample_mean, self.sample_std = arrays.get("sample_mean"), arrays.get("sample_std")
+        self.value_mean, self.value_std = arrays.get("value_mean"), arrays.get("value_std")
+        self.optimizer, self.optimize_constraints = None, None
+
+    def leave_one_out(self):
+        """
+        Leave-one-out cross-validation of the fitted surrogate, computed in closed form from the Cholesky decomposition
+        of the correlation matrix instead of refitting the surrogate :math:`n` times. If a regression model is used, the
+        regression coefficients are re-estimated for each left-out point. The hyperparameters are held fixed.
+
+        :return: The leave-one-out predictive means and variances at the training points, both of shape
+         ``(nsamples, output_dim)``, and the :math:`Q^2` score of each output.
+        """
+        return self._cross_validate(folds=None)
+
+    def cross_validation(self, folds_number: int, random_state: RandomStateType = None):
+        """
+        K-fold cross-validation of the fitted surrogate, computed in closed form from the Cholesky decomposition of the
+        correlation matrix. The training points are randomly partitioned into `folds_number` folds and each fold is
+        predicted from the remaining points, with fixed hyperparameters.
+
+        :param folds_number: Number of folds.
+        :param random_state: Random seed used to partition the training points. If :any:`None`, the `random_state`
+         of the surrogate is used.
+        :return: The cross-validation predictive means and variances at the training points, both of shape
+         ``(nsamples, output_dim)``, and the :math:`Q^2` score of each output.
+        """
+        random_state = self.random_state if random_state is None else process_random_state(random_state)
+        folds = np.array_split(random_state.permutation(self.samples.shape[0]), folds_number)
+        return self._cross_validate(folds=folds)
+
+    def _cross_validate(self, folds):
+        if self.cc is None:
+            raise RuntimeError("UQpy: The surrogate must be fitted before it is cross-validated.")
+        residuals, variances = GaussianProcessRegression._held_out_residuals(
+            self.cc, self.alpha_, self.F if self.regression_model is not None else None, folds)
+        variances = np.repeat(variances[:, None], self.values.shape[1], axis=1)
+        if self.normalize:
+            residuals, variances = residuals * self.value_std, variances * self.value_std ** 2
+        q2 = 1 - np.sum(residuals ** 2, axis=0) / np.sum((self.values - np.mean(self.values, axis=0)) ** 2, axis=0)
+        return self.values - residuals, variances, q2
+
+    @staticmethod
+    def _held_out_residuals(cc, alpha, fx_, folds=None):
+        # Residuals y_I - E[y_I | y_-I] = (P_II)^-1 (P y)_I and variances diag((P_II)^-1) of held-out sets I, with
+        # P = K^-1 - K^-1 F (F^T K^-1 F)^-1 F^T K^-1, such that P y = alpha.
+        c_inv = cho_solve((cc, True), np.eye(cc.shape[0]))
+        g_ = f_inv = None
+        if fx_ is not None:
+            g_ = c_inv @ fx_
+            f_inv = np.linalg.inv(fx_.T @ g_)
+        if folds is None:
+            p_diag = np.diag(c_inv).copy()
+            if g_ is not None:
+                p_diag -= np.einsum("ij,ij->i", g_ @ f_inv, g_)
+            return alpha / p_diag[:, None], 1 / p_diag
+        residuals, variances = np.zeros_like(alpha), np.zeros(alpha.shape[0])
+        for fold in folds:
+            p_ii = c_inv[np.ix_(fold, fold)]
+            if g_ is not None:
+                p_ii = p_ii - g_[fold] @ f_inv @ g_[fold].T
+            p_inv = np.linalg.inv(p_ii)
+            residuals[fold] = p_inv @ alpha[fold]
+            variances[fold] = np.diag(p_inv)
+        return residuals, variances
+
+    def posterior_covariance(self, points_x, points_s, regression_uncertainty: bool = True):
+        """
+        Posterior covariance between the Gaussian process at two sets of points, based on the current fit and
+        hyperparameters.
+
+        :param points_x: Array of shape ``(m, dimension)``.
+        :param points_s: Array of shape ``(q, dimension)``.
+        :param regression_uncertainty: If :any:`True` and a regression model is used, the covariance accounts for the
+         uncertainty in the estimated regression coefficients (universal kriging). Otherwise, the regression
+         coefficients are considered known, as in the standard deviation returned by :meth:`predict`.
+        :return: Posterior covariance matrix of shape ``(m, q)``.
+        """
+        x_, s_ = np.atleast_2d(points_x), np.atleast_2d(points_s)
+        samples = self.samples
+        if self.normalize:
+            x_ = (x_ - self.sample_mean) / self.sample_std
+            s_ = (s_ - self.sample_mean) / self.sample_std
+            samples = (self.samples - self.sample_mean) / self.sample_std
+        kernelparameters = self.hyperparameters[:-1] if self.noise else self.hyperparameters
+
+        k_xs = self.kernel.c(x=x_, s=s_, params=kernelparameters)
+        k_x = self.kernel.c(x=x_, s=samples, params=kernelparameters)
+        k_s = self.kernel.c(x=s_, s=samples, params=kernelparameters)
+        covariance = k_xs - k_x @ cho_solve((self.cc, True), k_s.T)
+        if self.regression_model is not None and regression_uncertainty:
+            f_inv = cho_solve((self.cc, True), self.F)
+            u_x = k_x @ f_inv - self.regression_model.r(x_)
+            u_s = k_s @ f_inv - self.regression_model.r(s_)
+            covariance += u_x @ np.linalg.solve(self.F.T @ f_inv, u_s.T)
+        if self.normalize:
+            covariance = covariance * self.value_std ** 2
+        return covariance
+
     @staticmethod
     def log_likelihood(p0, k_, s, y, ind_noise, fx_):
         """
@@ -343,7 +616,99 @@ class GaussianProcessRegression(Surrogate):
             beta = np.linalg.solve(g_, np.matmul(np.transpose(q_), y_dash))
             mu = np.einsum("ij,jk->ik", fx_, beta)
 
-        term1 = (y-mu).T @ (cho_solve((cc, True), y-mu))
+        # The outputs share the correlation matrix and are independent given the hyperparameters, so the
+        # log-likelihood is summed over the columns of y.
+        term1 = np.sum((y - mu) * cho_solve((cc, True), y - mu))
         term2 = 2 * np.sum(np.log(np.abs(np.diag(cc))))
 
-        return 0.5 * (term1 + term2 + m * np.log(2 * np.pi))[0, 0]
+        return 0.5 * (term1 + y.shape[1] * (term2 + m * np.log(2 * np.pi)))
+
+    @staticmethod
+    def log_likelihood_and_gradient(p0, k_, s, y, ind_noise, fx_):
+        """
+        Negative log-likelihood and its analytic gradient with respect to the log-transformed hyperparameters. The
+        kernel must implement :meth:`.Kernel.c_with_derivatives`.
+
+        :param p0: An 1-D numpy array of hyperparameters, that are identified through MLE. The last two elements are
+                   process variance and data noise, rest of the elements are length scale along each input dimension.
+        :param k_: Kernel
+        :param s: Input training data
+        :param y: Output training data
+        :param ind_noise: Boolean flag to indicate the noisy output
+        :param fx_: Basis function evaluated at training points
+        :return: The negative log-likelihood and its gradient.
+        """
+        m = s.shape[0]
+        params = 10 ** p0
+        kernel_params = params[:-1] if ind_noise else params
+        k_s, g_ = k_.c_with_derivatives(s, kernel_params)
+        k__ = k_s + np.eye(m) * params[-1] ** 2 if ind_noise else k_s
+        try:
+            cc = cholesky(k__ + 1e-10 * np.eye(m), lower=True)
+        except np.linalg.LinAlgError:
+            # Numerically singular covariance: reject the step of the optimizer
+            return np.inf, np.zeros(p0.shape[0])
+
+        mu = 0
+        if fx_ is not None:
+            f_dash = np.linalg.solve(cc, fx_)
+            y_dash = np.linalg.solve(cc, y)
+            q_, g_r = np.linalg.qr(f_dash)  # Eq: 3.11, DACE
+            # Check if F is a full rank matrix
+            if np.linalg.matrix_rank(g_r) != min(np.size(fx_, 0), np.size(fx_, 1)):
+                raise NotImplementedError("Chosen regression functions are not sufficiently linearly independent")
+            # Design parameters (beta: regression coefficient)
+            beta = np.linalg.solve(g_r, np.matmul(np.transpose(q_), y_dash))
+            mu = np.einsum("ij,jk->ik", fx_, beta)
+
+        n_outputs = y.shape[1]
+        alpha = cho_solve((cc, True), y - mu)
+        term1 = np.sum((y - mu) * alpha)
+        term2 = 2 * np.sum(np.log(np.abs(np.diag(cc))))
+        value = 0.5 * (term1 + n_outputs * (term2 + m * np.log(2 * np.pi)))
+
+        # dL/dp = 0.5 * sum(W * dK/dp), with W = q K^-1 - alpha alpha^T for q outputs. The regression coefficients do
+        # not contribute, since they minimize the quadratic term.
+        w = n_outputs * cho_solve((cc, True), np.eye(m)) - alpha @ alpha.T
+        a = w * g_
+        scaled = s / kernel_params[:-1]
+        gradient = [np.einsum("ji,j->i", scaled ** 2, a.sum(axis=1)) - np.einsum("ji,ji->i", scaled, a @ scaled),
+                    [np.sum(w * k_s)]]
+        if ind_noise:
+            gradient.append([np.trace(w) * params[-1] ** 2])
+        return value, np.log(10) * np.concatenate(gradient)
+
+    @staticmethod
+    def leave_one_out_objective(p0, k_, s, y, ind_noise, fx_):
+        """
+        Negative leave-one-out log predictive probability of the training data, computed in closed form.
+
+        :param p0: An 1-D numpy array of hyperparameters, that are identified through MLE. The last two elements are
+                   process variance and data noise, rest of the elements are length scale along each input dimension.
+        :param k_: Kernel
+        :param s: Input training data
+        :param y: Output training data
+        :param ind_noise: Boolean flag to indicate the noisy output
+        :param fx_: Basis function evaluated at training points
+        :return:
+        """
+        m = s.shape[0]
+        if ind_noise:
+            k__ = k_.c(x=s, s=s, params=10 ** p0[:-1]) + np.eye(m) * (10 ** p0[-1]) ** 2
+        else:
+            k__ = k_.c(x=s, s=s, params=10 ** p0)
+        cc = cholesky(k__ + 1e-10 * np.eye(m), lower=True)
+
+        mu = 0
+        if fx_ is not None:
+            f_dash = solve_triangular(cc, fx_, lower=True)
+            y_dash = solve_triangular(cc, y, lower=True)
+            beta = np.linalg.lstsq(f_dash, y_dash, rcond=None)[0]
+            mu = fx_ @ beta
+        alpha = cho_solve((cc, True), y - mu)
+        residuals, variances = GaussianProcessRegression._held_out_residuals(cc, alpha, fx_)
+        return 0.5 * np.sum(np.log(variances)[:, None] + residuals ** 2 / variances[:, None] + np.log(2 * np.pi))
+
+
+def _optimize(optimizer, function, initial_guess, args, jac):
+    return optimizer.optimize(function=function, initial_guess=initial_guess, args=args, jac=jac)
@@ -0,0 +1,408 @@
+import logging
+from typing import Union
+
+import numpy as np
+from beartype import beartype
+from scipy.linalg import cholesky, cho_solve, solve_triangular
+
+from UQpy.utilities.Utilities import process_random_state
+from UQpy.surrogates.baseclass.Surrogate import Surrogate
+from UQpy.utilities.ValidationTypes import RandomStateType, PositiveInteger, PositiveFloat
+from UQpy.surrogates.gaussian_process.GaussianProcessRegression import GaussianProcessRegression
+from UQpy.surrogates.gaussian_process.kernels.baseclass.Kernel import Kernel
+from UQpy.surrogates.gaussian_process.regression_models.baseclass.Regression import Regression
+
+
+class GradientEnhancedGaussianProcessRegression(Surrogate):
+    @beartype
+    def __init__(
+            self,
+            kernel: Kernel,
+            hyperparameters: list,
+            regression_model: Union[None, Regression] = None,
+            optimizer=None,
+            bounds=None,
+            optimizations_number: int = 1,
+            noise: bool = False,
+            normalize: bool = False,
+            solver: str = "cholesky",
+            tolerance: PositiveFloat = 1e-8,
+            max_iterations: Union[None, PositiveInteger] = None,
+            random_state: RandomStateType = None,
+    ):
+        """
+        Gradient-enhanced Gaussian process regression surrogate model (kriging with derivative observations). The
+        Gaussian process is conditioned jointly on the model values and on the gradients of the model at the training
+        points, such that each model evaluation provides :math:`d+1` observations.
+
+        :param kernel: `kernel` specifies and evaluates the kernel. The kernel must implement
+         :meth:`.Kernel.c_with_input_derivatives`.
+         Built-in options: RBF, Matern (nu=2.5 or infinity)
+        :param hyperparameters: List or array of initial values for the kernel hyperparameters/scale parameters. This
+         input attribute defines the starting point for the maximum likelihood estimation of the hyperparameters. Its
+         length should be equal to the input dimension plus one (d+1), or plus two (d+2) if `noise` is :any:`True`.
+        :param regression_model: A class object, which computes the basis function at a sample point. The derivatives of
+         the basis functions, which define the trend of the gradients, are computed with central finite differences. If
+         regression_model is None, a zero-mean process is used.
+         Default: None
+        :param optimizer: A class object of 'MinimizeOptimizer' or 'FminCobyla' from UQpy.utilities module. If optimizer
+         is not defined, the hyperparameters provided as input are used.
+         Default: None.
+        :param bounds: Bounds of the hyperparameters, used to draw random starting points of the optimization.
+         Default: [10**-3, 10**3] for each hyperparameter and [10**-10, 10**-1] for the noise standard deviation.
+        :param optimizations_number: Number of times the optimization problem is solved with a random starting point.
+         Default: 1.
+        :param noise: Boolean flag used in case of noisy training data. The same noise standard deviation is assumed for
+         the values and the gradients.
+         Default: False
+        :param normalize: Boolean flag used in case data normalization is required.
+        :param solver: Method used to solve the linear systems with the :math:`n(d+1) \\times n(d+1)` covariance
+         matrix. Options: "cholesky" (the covariance matrix is assembled block-wise and factorized) and
+         "conjugate_gradient" (the covariance matrix is never assembled: its products with vectors are computed from
+         :math:`n \\times n` matrices in :math:`O(n^2 d)` operations and the systems are solved with the Jacobi
+         preconditioned conjugate gradient method). With "conjugate_gradient" the hyperparameters are estimated from
+         the likelihood of the model values only.
+         Default: "cholesky"
+        :param tolerance: Relative tolerance of the conjugate gradient method.
+         Default: 1e-8
+        :param max_iterations: Maximum number of iterations of the conjugate gradient method. If :any:`None`, the size
+         of the linear system is used.
+        :param random_state: Random seed used to initialize the pseudo-random number generator. If an integer is
+         provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise, the
+         object itself can be passed directly.
+        """
+        if solver not in ["cholesky", "conjugate_gradient"]:
+            raise ValueError("UQpy: solver must be either 'cholesky' or 'conjugate_gradient'.")
+        if not kernel.supports_input_derivatives():
+            raise ValueError("UQpy: The kernel must implement the derivatives with respect to the inputs.")
+        self.kernel = kernel
+        self.hyperparameters = np.array(hyperparameters)
+        self.regression_model = regression_model
+        self.optimizer = optimizer
+        self.bounds = bounds
+        self.optimizations_number = optimizations_number
+        self.noise = noise
+        self.normalize = normalize
+        self.solver = solver
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.logger = logging.getLogger(__name__)
+        self.random_state = process_random_state(random_state)
+
+        self.samples = None
+        self.values = None
+        self.gradients = None
+        self.beta = None
+        """Regression coefficients."""
+        self.alpha_ = None
+        """Weights of the posterior mean, of shape ``(n(d+1), 1)``, ordered as the values followed by the derivatives
+        with respect to each input dimension."""
+        self.sample_mean, self.sample_std = None, None
+        self.value_mean, self.value_std = None, None
+        self.F = None
+        self.cc = None
+
+        if bounds is None:
+            if self.optimizer is None or getattr(self.optimizer, "_bounds", None) is None:
+                self.bounds = [[10 ** -3, 10 ** 3]] * self.hyperparameters.shape[0]
+                if self.noise:
+                    self.bounds[-1] = [10 ** -10, 10 ** -1]
+            else:
+                self.bounds = self.optimizer._bounds
+
+    def fit(self, samples, values, gradients, optimizations_number=None, hyperparameters=None):
+        """
+        Fit the surrogate model using the training samples, the corresponding model values and the gradients of the
+        model at the training samples.
+
+        :param samples: `ndarray` of shape ``(nsamples, d)`` containing the training points.
+        :param values: `ndarray` containing the model evaluations at the training points.
+        :param gradients: `ndarray` of shape ``(nsamples, d)`` containing the gradients of the model at the training
+         points.
+        :param optimizations_number: number of optimization iterations
+        :param hyperparameters: List or array of initial values for the kernel hyperparameters.
+        """
+        self.logger.info("UQpy: Running gradient-enhanced gpr.fit")
+        if optimizations_number is not None:
+            self.optimizations_number = optimizations_number
+        if hyperparameters is not None:
+            self.hyperparameters = np.array(hyperparameters)
+        self.samples = np.array(samples)
+        nsamples, input_dim = self.samples.shape
+        if self.hyperparameters.shape[0] != input_dim + 1 + self.noise:
+            raise RuntimeError("UQpy: The length/shape of attribute 'hyperparameter' and input dimension are not "
+                               "consistent.")
+        self.values = np.array(values).reshape(nsamples, 1)
+        self.gradients = np.array(gradients).reshape(nsamples, input_dim)
+
+        if self.normalize:
+            self.sample_mean, self.sample_std = np.mean(self.samples, 0), np.std(self.samples, 0)
+            self.value_mean, self.value_std = np.mean(self.values, 0), np.std(self.values, 0)
+            s_ = (self.samples - self.sample_mean) / self.sample_std
+            y_ = (self.values - self.value_mean) / self.value_std
+            g_ = self.gradients * self.sample_std / self.value_std
+        else:
+            s_, y_, g_ = self.samples, self.values, self.gradients
+        # Observations ordered as the values followed by the derivatives with respect to each input dimension
+        y_aug = np.concatenate([y_[:, 0], g_.T.flatten()])[:, None]
+        f_values = None
+        if self.regression_model is not None:
+            f_values = self.regression_model.r(s_)
+            self.F = np.vstack([f_values, self._regression_derivatives(s_)])
+
+        if self.optimizer is not None:
+            lb = [np.log10(xy[0]) for xy in self.bounds]
+            ub = [np.log10(xy[1]) for xy in self.bounds]
+            starting_point = self.random_state.uniform(low=lb, high=ub,
+                                                       size=(self.optimizations_number, len(self.bounds)))
+            starting_point[0, :] = np.log10(self.hyperparameters)
+            self.optimizer.update_bounds(bounds=[[l_, u_] for l_, u_ in zip(lb, ub)])
+
+            if self.solver == "cholesky":
+                function, args = self._objective, (s_, y_aug, self.F)
+            else:
+                function, args = GaussianProcessRegression.log_likelihood, (self.kernel, s_, y_, self.noise, f_values)
+            minimizer = np.zeros([self.optimizations_number, len(self.bounds)])
+            fun_value = np.zeros(self.optimizations_number)
+            for i__ in range(self.optimizations_number):
+                p_ = self.optimizer.optimize(function=function, initial_guess=starting_point[i__, :], args=args)
+                minimizer[i__, :] = p_ if isinstance(p_, np.ndarray) else p_.x
+                try:
+                    fun_value[i__] = function(minimizer[i__, :], *args)
+                except np.linalg.LinAlgError:
+                    fun_value[i__] = np.inf
+            if np.min(fun_value) == np.inf:
+                raise NotImplementedError("Maximum likelihood estimator failed: Choose different starting point or "
+                                          "increase nopt")
+            self.hyperparameters = 10 ** minimizer[np.argmin(fun_value), :]
+
+        if self.solver == "cholesky":
+            _, self.cc, self.alpha_, self.beta = self._factorize(s_, y_aug, self.F, self.hyperparameters)
+        else:
+            self.alpha_, self.beta = self._solve_iteratively(s_, y_aug, self.F)
+        self.logger.info("UQpy: gradient-enhanced gpr fit complete.")
+
+    def predict(self, points, return_std: bool = False):
+        """
+        Predict the model response at new points.
+
+        :param points: Points at which to predict the model response.
+        :param return_std: Indicator to estimate standard deviation.
+        :return: Predicted values at the new points, Standard deviation of predicted values at the new points
+        """
+        x_ = np.atleast_2d(points)
+        if self.normalize:
+            x_ = (x_ - self.sample_mean) / self.sample_std
+            s_ = (self.samples - self.sample_mean) / self.sample_std
+        else:
+            s_ = self.samples
+        kernelparameters = self.hyperparameters[:-1] if self.noise else self.hyperparameters
+
+        if self.solver == "cholesky":
+            k = self._cross_covariance(x_, s_, kernelparameters)
+            y = k @ self.alpha_
+        else:
+            y = self._cross_product(x_, s_, kernelparameters, self.alpha_)
+        if self.regression_model is not None:
+            y = y + self.regression_model.r(x_) @ self.beta
+        if self.normalize:
+            y = self.value_mean + y * self.value_std
+        if x_.shape[1] == 1:
+            y = y.flatten()
+
+        if return_std:
+            if self.solver == "cholesky":
+                v = solve_triangular(self.cc, k.T, lower=True)
+                reduction = np.einsum("ij,ij->j", v, v)
+            else:
+                reduction = np.zeros(x_.shape[0])
+                operator, preconditioner = self._operator(s_, kernelparameters)
+                for start in range(0, x_.shape[0], 100):
+                    k = self._cross_covariance(x_[start:start + 100], s_, kernelparameters)
+                    reduction[start:start + 100] = np.einsum("ij,ji->i", k, self._conjugate_gradient(
+                        operator, preconditioner, k.T))
+            var = self.kernel.diagonal(x_, kernelparameters) - reduction
+            mse = np.sqrt(np.maximum(var, 0))
+            if self.normalize:
+                mse = self.value_std * mse
+            if x_.shape[1] == 1:
+                mse = mse.flatten()
+            return y, mse
+        return y
+
+    def _export(self):
+        arrays = {"samples": self.samples, "cc": self.cc, "alpha": self.alpha_, "beta": self.beta,
+                  "hyperparameters": self.hyperparameters, "sample_mean": self.sample_mean,
+                  "sample_std": self.sample_std, "value_mean": self.value_mean, "value_std": self.value_std}
+        metadata = {"kernel": self._describe(self.kernel), "regression_model": self._describe(self.regression_model),
+                    "noise": self.noise, "normalize": self.normalize, "solver": self.solver,
+                    "tolerance": self.tolerance, "max_iterations": self.max_iterations}
+        return arrays, metadata
+
+    def _import(self, arrays, metadata):
+        self.kernel = self._restore(metadata["kernel"])
+        self.regression_model = self._restore(metadata["regression_model"])
+        for name in ["noise", "normalize", "solver", "tolerance", "max_iterations"]:
+            setattr(self, name, metadata[name])
+        self.samples, self.values, self.gradients = arrays["samples"], None, None
+        self.cc, self.alpha_, self.beta = arrays.get("cc"), arrays["alpha"], arrays.get("beta")
+        self.hyperparameters = np.array(arrays["hyperparameters"])
+        self.sample_mean, self.sample_std = arrays.get("sample_mean"), arrays.get("sample_std")
+        self.value_mean, self.value_std = arrays.get("value_mean"), arrays.get("value_std")
+        self.optimizer = None
+
+    def _regression_derivatives(self, s_):
+        # Derivatives of the basis functions with respect to each input dimension, with central finite differences
+        step = 1e-6 * np.maximum(1, np.abs(s_))
+        derivatives = []
+        for i in range(s_.shape[1]):
+            shift = np.zeros_like(s_)
+            shift[:, i] = step[:, i]
+            derivatives.append((self.regression_model.r(s_ + shift) - self.regression_model.r(s_ - shift)) /
+                               (2 * step[:, i:i + 1]))
+        return np.vstack(derivatives)
+
+    def _objective(self, p0, s_, y_aug, f_):
+        try:
+            return self._factorize(s_, y_aug, f_, 10 ** p0)[0]
+        except np.linalg.LinAlgError:
+            return np.inf
+
+    def _factorize(self, s_, y_aug, f_, hyperparameters):
+        """
+        Assemble the covariance matrix of the values and gradients block-wise, and return the negative log-likelihood,
+        its Cholesky factor, the weights of the posterior mean and the regression coefficients.
+        """
+        kernelparameters = hyperparameters[:-1] if self.noise else hyperparameters
+        n_total = y_aug.shape[0]
+        k_aug = self._covariance(s_, kernelparameters)
+        jitter = 1e-10 * np.max(np.diag(k_aug))
+        if self.noise:
+            jitter += hyperparameters[-1] ** 2
+        k_aug[np.diag_indices(n_total)] += jitter
+        cc = cholesky(k_aug, lower=True, overwrite_a=True)
+
+        beta, mu = None, 0
+        if f_ is not None:
+            f_dash = solve_triangular(cc, f_, lower=True)
+            y_dash = solve_triangular(cc, y_aug, lower=True)
+            beta = np.linalg.lstsq(f_dash, y_dash, rcond=None)[0]
+            mu = f_ @ beta
+        alpha_ = cho_solve((cc, True), y_aug - mu)
+        value = 0.5 * (np.sum((y_aug - mu) * alpha_) + 2 * np.sum(np.log(np.diag(cc))) + n_total * np.log(2 * np.pi))
+        return value, cc, alpha_, beta
+
+    def _covariance(self, s_, kernelparameters):
+        # Covariance matrix of the values and gradients, assembled from n x n blocks without larger temporaries
+        n, d = s_.shape
+        k, g, h = self.kernel.c_with_input_derivatives(s_, s_, kernelparameters)
+        inverse_squared_scales = 1 / kernelparameters[:-1] ** 2
+        k_aug = np.empty((n * (d + 1), n * (d + 1)))
+        k_aug[:n, :n] = k
+        for i in range(d):
+            d_i = (s_[:, i:i + 1] - s_[:, i]) * inverse_squared_scales[i]
+            block = g * d_i
+            k_aug[:n, (i + 1) * n:(i + 2) * n] = block
+            k_aug[(i + 1) * n:(i + 2) * n, :n] = -block
+            for j in range(i, d):
+                d_j = (s_[:, j:j + 1] - s_[:, j]) * inverse_squared_scales[j]
+                block = -h * d_i * d_j
+                if i == j:
+                    block += g * inverse_squared_scales[i]
+                k_aug[(i + 1) * n:(i + 2) * n, (j + 1) * n:(j + 2) * n] = block
+                k_aug[(j + 1) * n:(j + 2) * n, (i + 1) * n:(i + 2) * n] = block.T
+        return k_aug
+
+    def _cross_covariance(self, x_, s_, kernelparameters):
+        # Covariance between the values at 'x_' and the values and gradients at the training points
+        k, g, _ = self.kernel.c_with_input_derivatives(x_, s_, kernelparameters)
+        inverse_squared_scales = 1 / kernelparameters[:-1] ** 2
+        blocks = [k] + [g * (x_[:, i:i + 1] - s_[:, i]) * inverse_squared_scales[i] for i in range(s_.shape[1])]
+        return np.hstack(blocks)
+
+    def _cross_product(self, x_, s_, kernelparameters, v):
+        """
+        Product of the covariance between the values at 'x_' and the values and gradients at 's_' with the columns of
+        'v', computed in :math:`O(n_x n_s d)` operations without assembling the covariance.
+        """
+        n, d = s_.shape
+        k, g, _ = self.kernel.c_with_input_derivatives(x_, s_, kernelparameters)
+        inverse_squared_scales = 1 / kernelparameters[:-1] ** 2
+        result = np.zeros((x_.shape[0], v.shape[1]))
+        for r in range(v.shape[1]):
+            v_0, v_grad = v[:n, r], v[n:, r].reshape(d, n).T
+            # W_ab = sum_j (x_aj - s_bj) v_bj / l_j^2
+            scaled = v_grad * inverse_squared_scales
+            w = x_ @ scaled.T - np.sum(s_ * scaled, axis=1)
+            result[:, r] = k @ v_0 + np.sum(g * w, axis=1)
+        return result
+
+    def _operator(self, s_, kernelparameters):
+        """
+        Matrix-free products with the covariance matrix of the values and gradients at the training points, and the
+        inverse of its diagonal. Only the :math:`n \\times n` matrices :math:`K`, :math:`G` and :math:`H` are stored.
+        """
+        n, d = s_.shape
+        k, g, h = self.kernel.c_with_input_derivatives(s_, s_, kernelparameters)
+        inverse_squared_scales = 1 / kernelparameters[:-1] ** 2
+        diagonal = np.concatenate([np.diag(k)] + [np.diag(g) * scale for scale in inverse_squared_scales])
+        jitter = 1e-10 * np.max(diagonal)
+        if self.noise:
+            jitter += self.hyperparameters[-1] ** 2
+        weighted_samples = s_ * inverse_squared_scales
+
+        def gradient_sum(m, z):
+            # sum_b m_ab (s_ai - s_bi) z_b / l_i^2, for all a and i
+            return (s_ * (m @ z)[:, None] - m @ (z[:, None] * s_)) * inverse_squared_scales
+
+        def operator(v):
+            result = np.empty_like(v)
+            for r in range(v.shape[1]):
+                v_0, v_grad = v[:n, r], v[n:, r].reshape(d, n).T
+                scaled = v_grad * inverse_squared_scales
+                w = s_ @ scaled.T - np.sum(s_ * scaled, axis=1)
+                result[:n, r] = k @ v_0 + np.sum(g * w, axis=1)
+                u_grad = -gradient_sum(g, v_0) + inverse_squared_scales * (g @ v_grad)
+                hw = h * w
+                u_grad -= s_ * np.sum(hw, axis=1)[:, None] * inverse_squared_scales - (hw @ weighted_samples)
+                result[n:, r] = u_grad.T.flatten()
+            return result + jitter * v
+
+        return operator, 1 / (diagonal[:, None] + jitter)
+
+    def _conjugate_gradient(self, operator, preconditioner, b):
+        # Jacobi preconditioned conjugate gradient method, applied to all columns of 'b' simultaneously
+        x = np.zeros_like(b)
+        r = b.copy()
+        z = preconditioner * r
+        p = z.copy()
+        rz = np.sum(r * z, axis=0)
+        b_norm = np.maximum(np.linalg.norm(b, axis=0), np.finfo(float).tiny)
+        max_iterations = self.max_iterations or b.shape[0]
+        for iteration in range(max_iterations):
+            if np.all(np.linalg.norm(r, axis=0) <= self.tolerance * b_norm):
+                break
+            a_p = operator(p)
+            step = rz / np.sum(p * a_p, axis=0)
+            x += step * p
+            r -= step * a_p
+            z = preconditioner * r
+            rz_new = np.sum(r * z, axis=0)
+            p = z + (rz_new / rz) * p
+            rz = rz_new
+        else:
+            self.logger.warning("UQpy: The conjugate gradient method did not converge after %(n)s iterations."
+                                % {"n": max_iterations})
+        return x
+
+    def _solve_iteratively(self, s_, y_aug, f_):
+        kernelparameters = self.hyperparameters[:-1] if self.noise else self.hyperparameters
+        operator, preconditioner = self._operator(s_, kernelparameters)
+        beta, mu = None, 0
+        if f_ is not None:
+            solution = self._conjugate_gradient(operator, preconditioner, np.hstack([y_aug, f_]))
+            k_inv_y, k_inv_f = solution[:, :1], solution[:, 1:]
+            beta = np.linalg.solve(f_.T @ k_inv_f, f_.T @ k_inv_y)
+            mu = f_ @ beta
+        alpha_ = self._conjugate_gradient(operator, preconditioner, y_aug - mu)
+        return alpha_, beta
@@ -0,0 +1,250 @@
+import copy
+import logging
+from typing import Union
+
+import numpy as np
+from beartype import beartype
+
+from UQpy.run_model.RunModel import RunModel
+from UQpy.surrogates.baseclass.Surrogate import Surrogate
+from UQpy.surrogates.gaussian_process.GaussianProcessRegression import GaussianProcessRegression
+from UQpy.surrogates.gaussian_process.regression_models.baseclass.Regression import Regression
+
+
+class MultiFidelityGaussianProcessRegression(Surrogate):
+    @beartype
+    def __init__(
+            self,
+            surrogates: list[GaussianProcessRegression],
+            runmodel_objects: Union[None, list[RunModel]] = None,
+            costs: Union[None, list[Union[float, int]]] = None,
+    ):
+        """
+        Autoregressive multi-fidelity Gaussian process regression (co-kriging) of a scalar model output, using training
+        sets of two or more models of increasing fidelity and cost.
+
+        The model of fidelity :math:`t` is represented as :math:`f_t(x) = \\rho_t f_{t-1}(x) + \\delta_t(x)`, where
+        :math:`\\delta_t` is a Gaussian process independent of :math:`f_{t-1}`. Each level is a
+        :class:`.GaussianProcessRegression` object, with its own kernel, regression model and optimizer. The prediction
+        of the previous level is added as a regression function of the next level, such that the scaling factor
+        :math:`\\rho_t` is estimated together with the regression coefficients.
+
+        :param surrogates: List of :class:`.GaussianProcessRegression` objects, ordered from the lowest to the highest
+         fidelity. The surrogates are copied, and the regression models of the copies of all levels but the first are
+         wrapped to include the prediction of the previous level. If the surrogate of a level other than the first
+         normalizes the data, it must have a regression model with a constant term.
+        :param runmodel_objects: List of :class:`.RunModel` objects of the models of each fidelity, in the same order as
+         `surrogates`. They are required to evaluate the models with :meth:`run` and to complete the training sets of
+         the lower fidelities at the samples of the higher fidelities, such that the designs are nested.
+         Default: :any:`None`
+        :param costs: Cost of a single evaluation of the model of each fidelity.
+         Default: :any:`None`, i.e. all models have unit cost.
+        """
+        self.levels = len(surrogates)
+        if self.levels < 2:
+            raise ValueError("UQpy: At least two fidelity levels are required.")
+        if runmodel_objects is not None and len(runmodel_objects) != self.levels:
+            raise ValueError("UQpy: A RunModel object must be provided for each fidelity level.")
+        if costs is not None and len(costs) != self.levels:
+            raise ValueError("UQpy: A cost must be provided for each fidelity level.")
+        for t, surrogate in enumerate(surrogates[1:], start=1):
+            if surrogate.normalize and surrogate.regression_model is None:
+                raise ValueError("UQpy: The surrogate of fidelity level {0} normalizes the data and requires a "
+                                 "regression model.".format(t))
+        self.surrogates: list = [copy.deepcopy(surrogate) for surrogate in surrogates]
+        """Surrogate models of the fidelity levels, copied from the `surrogates` argument."""
+        for t, surrogate in enumerate(self.surrogates[1:], start=1):
+            surrogate.regression_model = _AutoregressiveRegression(self, t, surrogate.regression_model)
+        self.runmodel_objects = runmodel_objects
+        self.costs = np.ones(self.levels) if costs is None else np.array(costs, dtype=float)
+        self.logger = logging.getLogger(__name__)
+
+        self.samples: list = [None] * self.levels
+        """Training points of each fidelity level."""
+        self.values: list = [None] * self.levels
+        """Model evaluations at the training points of each fidelity level."""
+        self.rho = None
+        """Scaling factors :math:`\\rho_t` of the fidelity levels :math:`t \\geq 1`."""
+
+    def fit(self, samples, values, optimizations_number=None):
+        """
+        Fit the surrogate models of all fidelity levels, from the lowest to the highest fidelity.
+
+        :param samples: List containing the training points of each fidelity level, or `ndarray` containing the
+         training points of the highest fidelity only. In the latter case, the training sets of the lower fidelities
+         from the previous fit are kept.
+        :param values: List containing the model evaluations at the training points of each fidelity level, or
+         `ndarray` containing the model evaluations of the highest fidelity only.
+        :param optimizations_number: Number of MLE optimizations of each level.
+
+        If `runmodel_objects` are provided, the models of lower fidelity are first evaluated at the training points of
+        the next fidelity that are missing from their training set.
+        """
+        if isinstance(samples, (list, tuple)) and len(samples) == self.levels and np.ndim(samples[0]) == 2:
+            self.samples = [np.atleast_2d(np.array(s, dtype=float)) for s in samples]
+            self.values = [np.array(v, dtype=float).reshape(-1) for v in values]
+        else:
+            self.samples[-1] = np.atleast_2d(np.array(samples, dtype=float))
+            self.values[-1] = np.array(values, dtype=float).reshape(-1)
+        self._nest()
+        if any(s is None for s in self.samples):
+            raise RuntimeError("UQpy: Training data or RunModel objects are required for all fidelity levels.")
+
+        self.logger.info("UQpy: Running multi-fidelity gpr.fit")
+        for surrogate, samples_t, values_t in zip(self.surrogates, self.samples, self.values):
+            surrogate.fit(samples_t, values_t, optimizations_number=optimizations_number)
+        self.rho = [surrogate.regression_model.scaling_factor() for surrogate in self.surrogates[1:]]
+        self.logger.info("UQpy: Multi-fidelity gpr fit complete.")
+
+    def update(self, new_samples, new_values, optimizations_number=None):
+        """
+        Add training points of the highest fidelity and update the surrogate models.
+
+        If the training sets of the lower fidelities are unchanged, i.e. if no `runmodel_objects` are provided or the
+        new points are already part of these training sets, only the surrogate of the highest fidelity is updated
+        with :meth:`.GaussianProcessRegression.update`, which extends its Cholesky decomposition and re-optimizes its
+        hyperparameters according to its `reoptimization_interval` and `likelihood_drift` attributes. Otherwise, the
+        models of lower fidelity are evaluated at the new points and the surrogate models of all levels are refitted
+        from scratch with :meth:`fit`.
+
+        :param new_samples: `ndarray` containing the new training points.
+        :param new_values: `ndarray` containing the model evaluations of the highest fidelity at the new training
+         points.
+        :param optimizations_number: Number of MLE optimizations of each level.
+        """
+        new_samples = np.atleast_2d(np.array(new_samples, dtype=float))
+        new_values = np.array(new_values, dtype=float).reshape(-1)
+        self.samples[-1] = np.vstack([self.samples[-1], new_samples])
+        self.values[-1] = np.hstack([self.values[-1], new_values])
+        sizes = [s.shape[0] for s in self.samples[:-1]]
+        self._nest()
+        if [s.shape[0] for s in self.samples[:-1]] != sizes:
+            self.fit(self.samples, self.values, optimizations_number=optimizations_number)
+            return
+        self.surrogates[-1].update(new_samples, new_values, optimizations_number=optimizations_number)
+        self.rho[-1] = self.surrogates[-1].regression_model.scaling_factor()
+
+    def run(self, points, fidelity: int, optimizations_number=None):
+        """
+        Evaluate the model of a fidelity level at new points using its :class:`.RunModel` object, add the points to
+        the training sets and refit the surrogate models. The models of lower fidelity are also evaluated at the new
+        points, such that the designs remain nested.
+
+        :param points: Points at which to evaluate the model.
+        :param fidelity: Index of the fidelity level, starting from 0 for the lowest fidelity.
+        :param optimizations_number: Number of MLE optimizations of each level.
+        """
+        if self.runmodel_objects is None:
+            raise RuntimeError("UQpy: RunModel objects are required to evaluate the models.")
+        points = np.atleast_2d(points)
+        self._evaluate(fidelity, points)
+        self._nest()
+        self.fit(self.samples, self.values, optimizations_number=optimizations_number)
+
+    def _evaluate(self, fidelity, points):
+        self.runmodel_objects[fidelity].run(samples=points, append_samples=True)
+        values = np.array(self.runmodel_objects[fidelity].qoi_list[-points.shape[0]:], dtype=float).reshape(-1)
+        if self.samples[fidelity] is None:
+            self.samples[fidelity], self.values[fidelity] = points, values
+        else:
+            self.samples[fidelity] = np.vstack([self.samples[fidelity], points])
+            self.values[fidelity] = np.hstack([self.values[fidelity], values])
+
+    def _nest(self):
+        # Evaluate the models of lower fidelity at the training points of the next fidelity missing from their
+        # training set
+        if self.runmodel_objects is None:
+            return
+        for t in range(self.levels - 2, -1, -1):
+            if self.samples[t + 1] is None:
+                continue
+            existing = set() if self.samples[t] is None else set(map(tuple, self.samples[t].tolist()))
+            missing = [tuple(x) not in existing for x in self.samples[t + 1].tolist()]
+            if any(missing):
+                self.logger.info("UQpy: Evaluating the model of fidelity level %(t)s at %(n)s points."
+                                 % {"t": t, "n": sum(missing)})
+                self._evaluate(t, self.samples[t + 1][missing])
+
+    def predict(self, points, return_std: bool = False):
+        """
+        Predict the response of the model of highest fidelity at new points.
+
+        The predictive variance is :math:`\\sigma_t^2(x) = \\rho_t^2 \\sigma_{t-1}^2(x) + \\sigma_{\\delta_t}^2(x)`,
+        which is exact for nested designs.
+
+        :param points: Points at which to predict the model response.
+        :param return_std: Indicator to estimate standard deviation.
+        :return: Predicted values at the new points, Standard deviation of predicted values at the new points
+        """
+        if not return_std:
+            return self._predict(points, self.levels - 1)[0]
+        mean, variances = self._predict(points, self.levels - 1, return_std=True)
+        return mean, np.sqrt(np.sum(variances, axis=1)).reshape(np.shape(mean))
+
+    def variance_decomposition(self, points):
+        """
+        Contributions of the fidelity levels to the predictive variance of the highest fidelity, i.e.
+        :math:`\\left(\\prod_{j>t} \\rho_j^2\\right) \\sigma_{\\delta_t}^2(x)` for each level :math:`t`, where
+        :math:`\\sigma_{\\delta_0}^2` is the predictive variance of the lowest fidelity.
+
+        :param points: Points at which to evaluate the contributions.
+        :return: `ndarray` of shape ``(npoints, levels)``.
+        """
+        return self._predict(points, self.levels - 1, return_std=True)[1]
+
+    def _predict(self, points, level, return_std=False):
+        # Predictions of the levels up to 'level'. The prediction of each level is passed explicitly to the regression
+        # model of the next level, such that every level is predicted once.
+        x_ = np.atleast_2d(points)
+        mean, variances = None, np.zeros((x_.shape[0], level + 1))
+        for t in range(level + 1):
+            surrogate = self.surrogates[t]
+            regression_values = None
+            if t > 0:
+                regression_values = surrogate.regression_model.evaluate(x_, np.reshape(mean, -1))
+            if return_std:
+                mean, std = surrogate.predict(x_, True, regression_values=regression_values)
+                if t > 0:
+                    variances[:, :t] *= surrogate.regression_model.scaling_factor() ** 2
+                variances[:, t] = np.reshape(std, -1) ** 2
+            else:
+                mean = surrogate.predict(x_, regression_values=regression_values)
+        return mean, variances
+
+
+class _AutoregressiveRegression(Regression):
+    """
+    Regression model of a fidelity level of a :class:`.MultiFidelityGaussianProcessRegression`, which appends the
+    regression functions of the level to the prediction of the previous level.
+    """
+
+    def __init__(self, multi_fidelity, level, regression_model):
+        self.multi_fidelity = multi_fidelity
+        self.level = level
+        self.regression_model = regression_model
+
+    def r(self, s):
+        s = np.atleast_2d(s)
+        surrogate = self.multi_fidelity.surrogates[self.level]
+        x_ = s * surrogate.sample_std + surrogate.sample_mean if surrogate.normalize else s
+        return self._append(s, np.reshape(self.multi_fidelity._predict(x_, self.level - 1)[0], -1))
+
+    def evaluate(self, points, previous):
+        """
+        Regression functions at `points`, in the units of the model input, given the prediction `previous` of the
+        previous level at these points.
+        """
+        surrogate = self.multi_fidelity.surrogates[self.level]
+        s = (points - surrogate.sample_mean) / surrogate.sample_std if surrogate.normalize else points
+        return self._append(s, previous)
+
+    def _append(self, s, previous):
+        if self.regression_model is None:
+            return previous[:, None]
+        return np.hstack([previous[:, None], self.regression_model.r(s)])
+
+    def scaling_factor(self):
+        # Coefficient of the prediction of the previous level, in the units of the model output
+        surrogate = self.multi_fidelity.surrogates[self.level]
+        rho = surrogate.beta[0, 0]
+        return rho * surrogate.value_std[0] if surrogate.normalize else rho
@@ -0,0 +1,318 @@
+import logging
+from typing import Union
+
+import numpy as np
+from beartype import beartype
+from scipy.linalg import cholesky, cho_solve, solve_triangular
+
+from UQpy.utilities.Utilities import process_random_state
+from UQpy.surrogates.baseclass.Surrogate import Surrogate
+from UQpy.utilities.ValidationTypes import RandomStateType, PositiveInteger
+from UQpy.surrogates.gaussian_process.kernels.baseclass.Kernel import Kernel
+from UQpy.surrogates.gaussian_process.regression_models.baseclass.Regression import Regression
+
+
+class SparseGaussianProcessRegression(Surrogate):
+    @beartype
+    def __init__(
+            self,
+            kernel: Kernel,
+            hyperparameters: list,
+            inducing_points_number: PositiveInteger = 100,
+            inducing_points: Union[None, np.ndarray] = None,
+            inducing_method: str = "kmeans",
+            approximation: str = "VFE",
+            regression_model: Union[None, Regression] = None,
+            optimizer=None,
+            bounds=None,
+            optimizations_number: int = 1,
+            optimization_samples_number: Union[None, PositiveInteger] = None,
+            batch_size: Union[None, PositiveInteger] = None,
+            normalize: bool = False,
+            random_state: RandomStateType = None,
+    ):
+        """
+        Sparse Gaussian process regression surrogate model, based on :math:`m \\ll n` inducing points. Training costs
+        :math:`O(nm^2)` time and, if the training points are processed in batches, :math:`O(bm + m^2)` memory instead
+        of the :math:`O(n^3)` time and :math:`O(n^2)` memory of :class:`.GaussianProcessRegression`.
+
+        :param kernel: `kernel` specifies and evaluates the kernel.
+         Built-in options: RBF, Matern
+        :param hyperparameters: List or array of initial values for the kernel hyperparameters, i.e. 'd' length scales,
+         the process standard deviation and the noise standard deviation. Its length should be equal to the input
+         dimension plus two (d+2).
+        :param inducing_points_number: Number of inducing points :math:`m`. Ignored if `inducing_points` are provided.
+         Default: 100
+        :param inducing_points: Array of shape ``(m, d)`` with user-defined inducing points.
+        :param inducing_method: Method used to select the inducing points among the training points.
+         Options: "kmeans" (centroids of a k-means clustering of the training points) and "greedy_variance" (training
+         points that maximize the residual variance of the Nyström approximation, chosen with a partial pivoted
+         Cholesky decomposition).
+         Default: "kmeans"
+        :param approximation: Sparse approximation of the likelihood. Options: "VFE" (variational free energy) and
+         "FITC" (fully independent training conditional).
+         Default: "VFE"
+        :param regression_model: A class object, which computes the basis function at a sample point. If
+         regression_model is None, a zero-mean process is used.
+         Default: None
+        :param optimizer: A class object of 'MinimizeOptimizer' or 'FminCobyla' from UQpy.utilities module. If optimizer
+         is not defined, the hyperparameters provided as input are used.
+         Default: None.
+        :param bounds: Bounds of the hyperparameters, used to draw random starting points of the optimization.
+         Default: [10**-3, 10**3] for each hyperparameter and [10**-10, 10**-1] for the noise standard deviation.
+        :param optimizations_number: Number of times the optimization problem is solved with a random starting point.
+         Default: 1.
+        :param optimization_samples_number: Number of training points, selected at random, used to evaluate the
+         approximate likelihood during the hyperparameter optimization. If :any:`None`, all training points are used.
+        :param batch_size: Number of training points processed at once. If :any:`None`, all training points are
+         processed at once.
+        :param normalize: Boolean flag used in case data normalization is required.
+        :param random_state: Random seed used to initialize the pseudo-random number generator. If an integer is
+         provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise, the
+         object itself can be passed directly.
+        """
+        if inducing_method not in ["kmeans", "greedy_variance"]:
+            raise ValueError("UQpy: inducing_method must be either 'kmeans' or 'greedy_variance'.")
+        if approximation not in ["VFE", "FITC"]:
+            raise ValueError("UQpy: approximation must be either 'VFE' or 'FITC'.")
+        self.kernel = kernel
+        self.hyperparameters = np.array(hyperparameters)
+        self.inducing_points_number = inducing_points_number
+        self.inducing_method = inducing_method
+        self.approximation = approximation
+        self.regression_model = regression_model
+        self.optimizer = optimizer
+        self.bounds = bounds
+        self.optimizations_number = optimizations_number
+        self.optimization_samples_number = optimization_samples_number
+        self.batch_size = batch_size
+        self.normalize = normalize
+        self.logger = logging.getLogger(__name__)
+        self.random_state = process_random_state(random_state)
+
+        self.samples = None
+        self.values = None
+        self.inducing_points = inducing_points
+        """Inducing points of the sparse approximation."""
+        self.beta = None
+        """Regression coefficients."""
+        self.sample_mean, self.sample_std = None, None
+        self.value_mean, self.value_std = None, None
+        self.F = None
+        self._user_inducing_points = inducing_points is not None
+        self._z, self._cholesky_uu, self._cholesky_b, self._weights = None, None, None, None
+
+        if bounds is None:
+            if self.optimizer is None or getattr(self.optimizer, "_bounds", None) is None:
+                self.bounds = [[10 ** -3, 10 ** 3]] * (self.hyperparameters.shape[0] - 1) + [[10 ** -10, 10 ** -1]]
+            else:
+                self.bounds = self.optimizer._bounds
+
+    def fit(self, samples, values, optimizations_number=None, hyperparameters=None):
+        """
+        Fit the surrogate model using the training samples and the corresponding model values.
+
+        The inducing points are selected, the hyperparameters are optimized (if an optimizer is provided) and the
+        posterior is computed by processing the training points in batches of `batch_size` points.
+
+        :param samples: `ndarray` containing the training points.
+        :param values: `ndarray` containing the model evaluations at the training points.
+        :param optimizations_number: number of optimization iterations
+        :param hyperparameters: List or array of initial values for the kernel hyperparameters.
+        """
+        self.logger.info("UQpy: Running sparse gpr.fit")
+        if optimizations_number is not None:
+            self.optimizations_number = optimizations_number
+        if hyperparameters is not None:
+            self.hyperparameters = np.array(hyperparameters)
+        self.samples = np.array(samples)
+        nsamples, input_dim = self.samples.shape
+        if self.hyperparameters.shape[0] != input_dim + 2:
+            raise RuntimeError("UQpy: The length/shape of attribute 'hyperparameter' and input dimension are not "
+                               "consistent.")
+        self.values = np.array(values).reshape(nsamples, -1)
+
+        if self.normalize:
+            self.sample_mean, self.sample_std = np.mean(self.samples, 0), np.std(self.samples, 0)
+            self.value_mean, self.value_std = np.mean(self.values, 0), np.std(self.values, 0)
+            s_ = (self.samples - self.sample_mean) / self.sample_std
+            y_ = (self.values - self.value_mean) / self.value_std
+        else:
+            s_, y_ = self.samples, self.values
+        self.F = self.regression_model.r(s_) if self.regression_model is not None else None
+
+        if self._user_inducing_points:
+            z_ = np.atleast_2d(self.inducing_points)
+            if self.normalize:
+                z_ = (z_ - self.sample_mean) / self.sample_std
+        else:
+            z_ = self._select_inducing_points(s_)
+            self.inducing_points = z_ * self.sample_std + self.sample_mean if self.normalize else z_
+
+        if self.optimizer is not None:
+            subset = np.arange(nsamples)
+            if self.optimization_samples_number is not None and self.optimization_samples_number < nsamples:
+                subset = np.sort(self.random_state.choice(nsamples, self.optimization_samples_number, replace=False))
+            f_subset = self.F[subset] if self.F is not None else None
+
+            lb = [np.log10(xy[0]) for xy in self.bounds]
+            ub = [np.log10(xy[1]) for xy in self.bounds]
+            starting_point = self.random_state.uniform(low=lb, high=ub,
+                                                       size=(self.optimizations_number, len(self.bounds)))
+            starting_point[0, :] = np.log10(self.hyperparameters)
+            self.optimizer.update_bounds(bounds=[[l_, u_] for l_, u_ in zip(lb, ub)])
+
+            minimizer = np.zeros([self.optimizations_number, len(self.bounds)])
+            fun_value = np.zeros(self.optimizations_number)
+            for i__ in range(self.optimizations_number):
+                p_ = self.optimizer.optimize(function=self._objective, initial_guess=starting_point[i__, :],
+                                             args=(s_[subset], y_[subset], f_subset, z_))
+                minimizer[i__, :] = p_ if isinstance(p_, np.ndarray) else p_.x
+                fun_value[i__] = self._objective(minimizer[i__, :], s_[subset], y_[subset], f_subset, z_)
+            if np.min(fun_value) == np.inf:
+                raise NotImplementedError("Maximum likelihood estimator failed: Choose different starting point or "
+                                          "increase nopt")
+            self.hyperparameters = 10 ** minimizer[np.argmin(fun_value), :]
+
+        _, self._cholesky_uu, self._cholesky_b, self.beta, self._weights = \
+            self._factorize(s_, y_, self.F, z_, self.hyperparameters)
+        self._z = z_
+        self.logger.info("UQpy: sparse gpr fit complete.")
+
+    def predict(self, points, return_std: bool = False):
+        """
+        Predict the model response at new points.
+
+        :param points: Points at which to predict the model response.
+        :param return_std: Indicator to estimate standard deviation.
+        :return: Predicted values at the new points, Standard deviation of predicted values at the new points
+        """
+        x_ = np.atleast_2d(points)
+        if self.normalize:
+            x_ = (x_ - self.sample_mean) / self.sample_std
+        kernelparameters = self.hyperparameters[:-1]
+
+        v = solve_triangular(self._cholesky_uu, self.kernel.c(x=self._z, s=x_, params=kernelparameters), lower=True)
+        y = v.T @ self._weights
+        if self.regression_model is not None:
+            y = y + self.regression_model.r(x_) @ self.beta
+        if self.normalize:
+            y = self.value_mean + y * self.value_std
+        if x_.shape[1] == 1:
+            y = y.flatten()
+
+        if return_std:
+            # Diagonal of K(x, x) - K(x, Z) (Kuu^-1 - (Kuu + Kuf Lambda^-1 Kfu)^-1) K(Z, x)
+            v_b = solve_triangular(self._cholesky_b, v, lower=True)
+            var = self.kernel.diagonal(x_, kernelparameters) - np.einsum("ij,ij->j", v, v) + \
+                np.einsum("ij,ij->j", v_b, v_b)
+            mse = np.sqrt(np.maximum(var, 0))
+            if self.normalize:
+                mse = self.value_std * mse
+            if x_.shape[1] == 1:
+                mse = mse.flatten()
+            return y, mse
+        return y
+
+    def _export(self):
+        arrays = {"inducing_points": self._z, "cholesky_uu": self._cholesky_uu, "cholesky_b": self._cholesky_b,
+                  "weights": self._weights, "beta": self.beta, "hyperparameters": self.hyperparameters,
+                  "sample_mean": self.sample_mean, "sample_std": self.sample_std, "value_mean": self.value_mean,
+                  "value_std": self.value_std}
+        metadata = {"kernel": self._describe(self.kernel), "regression_model": self._describe(self.regression_model),
+                    "normalize": self.normalize}
+        return arrays, metadata
+
+    def _import(self, arrays, metadata):
+        self.kernel = self._restore(metadata["kernel"])
+        self.regression_model = self._restore(metadata["regression_model"])
+        self.normalize = metadata["normalize"]
+        self._z, self._weights, self.beta = arrays["inducing_points"], arrays["weights"], arrays.get("beta")
+        self._cholesky_uu, self._cholesky_b = arrays["cholesky_uu"], arrays["cholesky_b"]
+        self.hyperparameters = np.array(arrays["hyperparameters"])
+        self.sample_mean, self.sample_std = arrays.get("sample_mean"), arrays.get("sample_std")
+        self.value_mean, self.value_std = arrays.get("value_mean"), arrays.get("value_std")
+        self.inducing_points = self._z * self.sample_std + self.sample_mean if self.normalize else self._z
+        self.samples, self.values, self.optimizer = None, None, None
+
+    def _objective(self, p0, s_, y_, f_, z_):
+        # Negative log-likelihood per training point, which keeps the scale of the objective independent of n
+        try:
+            return self._factorize(s_, y_, f_, z_, 10 ** p0)[0] / s_.shape[0]
+        except np.linalg.LinAlgError:
+            return np.inf
+
+    def _factorize(self, s_, y_, f_, z_, hyperparameters):
+        """
+        Accumulate the sufficient statistics of the sparse approximation over batches of training points, and return
+        the negative log-likelihood, the Cholesky factors :math:`L_{uu}` of :math:`K_{uu}` and :math:`L_B` of
+        :math:`B = I + L_{uu}^{-1} K_{uf} \\Lambda^{-1} K_{fu} L_{uu}^{-T}`, the regression coefficients and the weights
+        of the posterior mean with respect to :math:`L_{uu}^{-1} K_{u*}`.
+        """
+        kernelparameters, noise_variance = hyperparameters[:-1], hyperparameters[-1] ** 2
+        n, q, m = s_.shape[0], y_.shape[1], z_.shape[0]
+        p = f_.shape[1] if f_ is not None else 0
+        k_uu = self.kernel.c(x=z_, s=z_, params=kernelparameters)
+        l_uu = cholesky(k_uu + 1e-8 * kernelparameters[-1] ** 2 * np.eye(m), lower=True)
+
+        c_uu, u_y, u_f = np.zeros((m, m)), np.zeros((m, q)), np.zeros((m, p))
+        f_f, f_y = np.zeros((p, p)), np.zeros((p, q))
+        y_y, log_lambda, trace = 0., 0., 0.
+        batch_size = self.batch_size or n
+        for start in range(0, n, batch_size):
+            s_b, y_b = s_[start:start + batch_size], y_[start:start + batch_size]
+            v = solve_triangular(l_uu, self.kernel.c(x=z_, s=s_b, params=kernelparameters), lower=True)
+            residual = self.kernel.diagonal(s_b, kernelparameters) - np.einsum("ij,ij->j", v, v)
+            if self.approximation == "FITC":
+                lambda_ = np.maximum(residual, 0) + noise_variance
+            else:
+                lambda_ = np.full(s_b.shape[0], noise_variance)
+                trace += np.sum(residual)
+            v_scaled = v / lambda_
+            c_uu += v_scaled @ v.T
+            u_y += v_scaled @ y_b
+            y_y += np.sum(y_b ** 2 / lambda_[:, None])
+            log_lambda += np.sum(np.log(lambda_))
+            if f_ is not None:
+                f_b = f_[start:start + batch_size]
+                u_f += v_scaled @ f_b
+                f_f += f_b.T @ (f_b / lambda_[:, None])
+                f_y += f_b.T @ (y_b / lambda_[:, None])
+        l_b = cholesky(np.eye(m) + c_uu, lower=True)
+
+        beta, u_r, r_r = None, u_y, y_y
+        if f_ is not None:
+            # Generalized least squares estimate of the regression coefficients under the sparse covariance
+            a_f = solve_triangular(l_b, u_f, lower=True)
+            a_y = solve_triangular(l_b, u_y, lower=True)
+            beta = np.linalg.solve(f_f - a_f.T @ a_f, f_y - a_f.T @ a_y)
+            u_r = u_y - u_f @ beta
+            r_r = y_y - 2 * np.sum(beta * f_y) + np.sum(beta * (f_f @ beta))
+        a_r = solve_triangular(l_b, u_r, lower=True)
+
+        log_det = 2 * np.sum(np.log(np.diag(l_b))) + log_lambda
+        value = 0.5 * (r_r - np.sum(a_r ** 2) + q * (log_det + n * np.log(2 * np.pi)))
+        if self.approximation == "VFE":
+            value += 0.5 * q * trace / noise_variance
+        weights = cho_solve((l_b, True), u_r)
+        return value, l_uu, l_b, beta, weights
+
+    def _select_inducing_points(self, s_):
+        m = min(self.inducing_points_number, s_.shape[0])
+        if self.inducing_method == "kmeans":
+            from sklearn.cluster import KMeans
+            return KMeans(n_clusters=m, n_init=3, random_state=self.random_state).fit(s_).cluster_centers_
+
+        # Greedy variance selection with a partial pivoted Cholesky decomposition of K(X, X)
+        kernelparameters = self.hyperparameters[:-1]
+        residual = np.array(self.kernel.diagonal(s_, kernelparameters), dtype=float)
+        rows, indices = np.zeros((m, s_.shape[0])), []
+        for j in range(m):
+            i = int(np.argmax(residual))
+            if residual[i] <= 1e-12 * kernelparameters[-1] ** 2:
+                break
+            indices.append(i)
+            k_i = self.kernel.c(x=s_[i:i + 1], s=s_, params=kernelparameters)[0]
+            rows[j] = (k_i - rows[:j, i] @ rows[:j]) / np.sqrt(residual[i])
+            residual -= rows[j] ** 2
+        return s_[indices]
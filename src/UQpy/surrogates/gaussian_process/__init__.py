@@ -1,4 +1,9 @@
 from UQpy.surrogates.gaussian_process.GaussianProcessRegression import GaussianProcessRegression
+from UQpy.surrogates.gaussian_process.SparseGaussianProcessRegression import SparseGaussianProcessRegression
+from UQpy.surrogates.gaussian_process.GradientEnhancedGaussianProcessRegression import \
+    GradientEnhancedGaussianProcessRegression
+from UQpy.surrogates.gaussian_process.MultiFidelityGaussianProcessRegression import \
+    MultiFidelityGaussianProcessRegression
 
 from UQpy.surrogates.gaussian_process.kernels import *
 from UQpy.surrogates.gaussian_process.regression_models import *
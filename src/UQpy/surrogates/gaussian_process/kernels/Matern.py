@@ -1,32 +1,116 @@
 from UQpy.surrogates.gaussian_process.kernels.baseclass.Kernel import *
-from scipy.spatial.distance import pdist, cdist, squareform
 from scipy.special import gamma, kv
 
 
 class Matern(Kernel):
-    def __init__(self, nu=1.5):
+    def __init__(self, nu=1.5, memory_budget: int = 2 ** 28, single_precision: bool = False, n_threads: int = 1):
         """
         Matern Kernel is a generalization of Radial Basis Function kernel.
 
         :params nu: Shape parameter. For nu=0.5, 1.5, 2.5 and infinity, matern coincides with the exponential,
          matern-3/2, matern-5/2 and RBF covariance function, respectively.
+        :params memory_budget: Approximate number of bytes of the temporary arrays used to evaluate a block of the
+         covariance matrix. Default: :math:`2^{28}` (256 MB).
+        :params single_precision: If :any:`True`, the distances are accumulated in single precision.
+         Default: False
+        :params n_threads: Number of threads used to evaluate the blocks of the covariance matrix concurrently.
+         Default: 1
         """
+        super().__init__(memory_budget=memory_budget, single_precision=single_precision, n_threads=n_threads)
         self.nu = nu
 
-    def c(self, x, s, params):
+    def c(self, x, s, params, dtype=np.float64):
+        """
+        This method compute the Matern kernel on sample points 'x' and 's'.
+
+        :params x: An array containing input samples.
+        :params s: An array containing input samples.
+        :params params: A list/array of hyperparameters containing length scales and the process variance.
+        :params dtype: Floating point type of the covariance matrix, see :meth:`.Kernel.scaled_distances`.
+        """
+        l, sigma = params[:-1], params[-1]
+        if self.nu == np.inf:
+            k = self.scaled_distances(x, s, l, lambda stack: np.exp(-stack/2), dtype=dtype)
+        else:
+            k = self.scaled_distances(x, s, l, self._correlation, squared=False, dtype=dtype)
+        k *= sigma**2
+        return k
+
+    def supports_derivatives(self):
+        return self.nu in (0.5, 1.5, 2.5, np.inf)
+
+    def c_with_derivatives(self, x, params):
+        """
+        This method computes the Matern kernel on sample points 'x' and the matrix required for its derivatives with
+        respect to the length scales, see :meth:`.Kernel.c_with_derivatives`. Available for nu=0.5, 1.5, 2.5 and
+        infinity.
+
+        :params x: An array containing input samples.
+        :params params: A list/array of hyperparameters containing length scales and the process variance.
+        """
+        if not self.supports_derivatives():
+            return super().c_with_derivatives(x, params)
+        l, sigma = params[:-1], params[-1]
+        if self.nu == np.inf:
+            k = self.c(x, x, params)
+            return k, k
+        stack = self.scaled_distances(x, x, l, lambda distances: distances, squared=False)
+        if self.nu == 0.5:
+            k = sigma**2 * np.exp(-stack)
+            g = np.divide(k, stack, out=np.zeros_like(k), where=stack > 0)
+        elif self.nu == 1.5:
+            k = sigma**2 * (1+np.sqrt(3)*stack)*np.exp(-np.sqrt(3)*stack)
+            g = 3 * sigma**2 * np.exp(-np.sqrt(3)*stack)
+        else:
+            k = sigma**2 * (1+np.sqrt(5)*stack+5*(stack**2)/3)*np.exp(-np.sqrt(5)*stack)
+            g = 5 * sigma**2 * (1+np.sqrt(5)*stack)*np.exp(-np.sqrt(5)*stack)/3
+        return k, g
+
+    def supports_input_derivatives(self):
+        return self.nu in (2.5, np.inf)
+
+    def c_with_input_derivatives(self, x, s, params):
+        """
+        This method computes the Matern kernel on sample points 'x' and 's' and the matrices required for its
+        derivatives with respect to the inputs, see :meth:`.Kernel.c_with_input_derivatives`. Available for nu=2.5 and
+        infinity, since the sample paths must be differentiable.
+
+        :params x: An array containing input samples.
+        :params s: An array containing input samples.
+        :params params: A list/array of hyperparameters containing length scales and the process variance.
+        """
+        if not self.supports_input_derivatives():
+            return super().c_with_input_derivatives(x, s, params)
+        if self.nu == np.inf:
+            k = self.c(x, s, params)
+            return k, k, k
         l, sigma = params[:-1], params[-1]
-        stack = cdist(x/l, s/l, metric='euclidean')
+        stack = self.scaled_distances(x, s, l, lambda distances: distances, squared=False)
+        exponential = sigma**2 * np.exp(-np.sqrt(5)*stack)
+        k = (1+np.sqrt(5)*stack+5*(stack**2)/3) * exponential
+        g = 5 * (1+np.sqrt(5)*stack) * exponential / 3
+        h = 25 * exponential / 3
+        return k, g, h
+
+    def _correlation(self, stack):
         if self.nu == 0.5:
-            return sigma**2 * np.exp(-np.abs(stack))
+            return np.exp(-np.abs(stack))
         elif self.nu == 1.5:
-            return sigma**2 * (1+np.sqrt(3)*stack)*np.exp(-np.sqrt(3)*stack)
+            return (1+np.sqrt(3)*stack)*np.exp(-np.sqrt(3)*stack)
         elif self.nu == 2.5:
-            return sigma**2 * (1+np.sqrt(5)*stack+5*(stack**2)/3)*np.exp(-np.sqrt(5)*stack)
-        elif self.nu == np.inf:
-            return sigma**2 * np.exp(-(stack**2)/2)
+            return (1+np.sqrt(5)*stack+5*(stack**2)/3)*np.exp(-np.sqrt(5)*stack)
         else:
-            stack *= np.sqrt(2*self.nu)
+            stack = stack * np.sqrt(2*self.nu)
             tmp = 1/(gamma(self.nu)*(2**(self.nu-1)))
             tmp1 = stack ** self.nu
             tmp2 = kv(self.nu, stack)
-            return sigma**2 * tmp * tmp1 * tmp2
+            return tmp * tmp1 * tmp2
+
+    def diagonal(self, x, params):
+        """
+        Diagonal of the covariance matrix of the sample points 'x', which equals the process variance.
+
+        :params x: An array containing input samples.
+        :params params: A list/array of hyperparameters containing length scales and the process variance.
+        """
+        return np.full(np.atleast_2d(x).shape[0], params[-1] ** 2)
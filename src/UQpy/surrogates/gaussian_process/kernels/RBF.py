@@ -2,14 +2,53 @@ from UQpy.surrogates.gaussian_process.kernels.baseclass.Kernel import *
 
 
 class RBF(Kernel):
-    def c(self, x, s, params):
+    def c(self, x, s, params, dtype=np.float64):
         """
         This method compute the RBF kernel on sample points 'x' and 's'.
 
         :params x: An array containing input samples.
         :params s: An array containing input samples.
         :params params: A list/array of hyperparameters containing length scales and the process variance.
+        :params dtype: Floating point type of the covariance matrix, see :meth:`.Kernel.scaled_distances`.
         """
-        stack = Kernel.check_samples_and_return_stack(x/params[:-1], s/params[:-1])
-        k = params[-1] ** 2 * np.exp(np.sum(-0.5 * (stack ** 2), axis=2))
+        k = self.scaled_distances(x, s, params[:-1], lambda d2: np.exp(-0.5 * d2), dtype=dtype)
+        k *= params[-1] ** 2
         return k
+
+    def supports_derivatives(self):
+        return True
+
+    def c_with_derivatives(self, x, params):
+        """
+        This method computes the RBF kernel on sample points 'x' and the matrix required for its derivatives with
+        respect to the length scales, see :meth:`.Kernel.c_with_derivatives`.
+
+        :params x: An array containing input samples.
+        :params params: A list/array of hyperparameters containing length scales and the process variance.
+        """
+        k = self.c(x, x, params)
+        return k, k
+
+    def supports_input_derivatives(self):
+        return True
+
+    def c_with_input_derivatives(self, x, s, params):
+        """
+        This method computes the RBF kernel on sample points 'x' and 's' and the matrices required for its derivatives
+        with respect to the inputs, see :meth:`.Kernel.c_with_input_derivatives`.
+
+        :params x: An array containing input samples.
+        :params s: An array containing input samples.
+        :params params: A list/array of hyperparameters containing length scales and the process variance.
+        """
+        k = self.c(x, s, params)
+        return k, k, k
+
+    def diagonal(self, x, params):
+        """
+        Diagonal of the covariance matrix of the sample points 'x', which equals the process variance.
+
+        :params x: An array containing input samples.
+        :params params: A list/array of hyperparameters containing length scales and the process variance.
+        """
+        return np.full(np.atleast_2d(x).shape[0], params[-1] ** 2)
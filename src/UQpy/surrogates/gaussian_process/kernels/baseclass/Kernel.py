@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+from scipy.spatial.distance import cdist
 
 
 class Kernel(ABC):
@@ -8,13 +11,145 @@ class Kernel(ABC):
     functions.
     """
 
+    memory_budget = 2 ** 28
+    single_precision = False
+    n_threads = 1
+
+    def __init__(self, memory_budget: int = 2 ** 28, single_precision: bool = False, n_threads: int = 1):
+        """
+        :params memory_budget: Approximate number of bytes of the temporary arrays used to evaluate a block of the
+         covariance matrix. The covariance matrix is evaluated block-wise, in row blocks that satisfy this budget.
+         Default: :math:`2^{28}` (256 MB).
+        :params single_precision: If :any:`True`, the squared distances are accumulated in single precision using the
+         :math:`\\|x\\|^2+\\|s\\|^2-2x \\cdot s` form, which is faster but less accurate for nearby points. It
+         is recommended only for cross-covariances between prediction and training points.
+         Default: False
+        :params n_threads: Number of threads used to evaluate the blocks of the covariance matrix concurrently.
+         Default: 1
+        """
+        self.memory_budget = memory_budget
+        self.single_precision = single_precision
+        self.n_threads = n_threads
+
     @abstractmethod
     def c(self, x, s, params):
         """
         Abstract method that needs to be implemented by the user when creating a new Covariance function.
+
+        Covariance functions may accept an optional `dtype` argument, the floating point type of the returned matrix,
+        which is used by :meth:`.GaussianProcessRegression.predict` to evaluate the cross-covariance between prediction
+        and training points in single precision. The built-in kernels support it through :meth:`scaled_distances`.
         """
         pass
 
+    def supports_derivatives(self):
+        """
+        Returns :any:`True` if the covariance function implements :meth:`c_with_derivatives`, which enables analytic
+        gradients of the log-likelihood in the maximum likelihood estimation of the hyperparameters.
+        """
+        return False
+
+    def c_with_derivatives(self, x, params):
+        """
+        Evaluate the covariance matrix :math:`K` of the sample points 'x' together with a matrix :math:`G`, such that
+        the derivative of :math:`K` with respect to the logarithm of the :math:`i`-th length scale is
+        :math:`G \\circ D_i`, where :math:`(D_i)_{jk} = (x_{ji}-x_{ki})^2/l_i^2`. Stationary kernels of the form
+        :math:`\\sigma^2 \\mathcal{R}(r)` with scaled distance :math:`r` have :math:`G = -\\sigma^2\\mathcal{R}'(r)/r`.
+
+        :params x: An array containing input samples.
+        :params params: A list/array of hyperparameters containing length scales and the process variance.
+        :return: The covariance matrix :math:`K` and the matrix :math:`G`.
+        """
+        raise NotImplementedError("UQpy: Derivatives are not available for this kernel.")
+
+    def supports_input_derivatives(self):
+        """
+        Returns :any:`True` if the covariance function implements :meth:`c_with_input_derivatives`, which is required
+        to condition a Gaussian process on gradient observations, see
+        :class:`.GradientEnhancedGaussianProcessRegression`.
+        """
+        return False
+
+    def c_with_input_derivatives(self, x, s, params):
+        """
+        Evaluate the covariance matrix :math:`K` between the sample points 'x' and 's' together with the matrices
+        :math:`G` and :math:`H` that define its derivatives with respect to the inputs. For a stationary kernel
+        :math:`\\sigma^2 \\mathcal{R}(r)` with scaled distance :math:`r`, :math:`G = -\\sigma^2\\mathcal{R}'(r)/r` and
+        :math:`H = -G'(r)/r`, such that with :math:`D_i = (x_i-s_i)/l_i^2`
+
+        .. math:: \\frac{\\partial k}{\\partial s_j} = G D_j, \\qquad
+                  \\frac{\\partial^2 k}{\\partial x_i \\partial s_j} = G \\frac{\\delta_{ij}}{l_i^2} - H D_i D_j
+
+        :params x: An array containing input samples.
+        :params s: An array containing input samples.
+        :params params: A list/array of hyperparameters containing length scales and the process variance.
+        :return: The matrices :math:`K`, :math:`G` and :math:`H`.
+        """
+        raise NotImplementedError("UQpy: Derivatives with respect to the inputs are not available for this kernel.")
+
+    def diagonal(self, x, params):
+        """
+        Evaluate only the diagonal :math:`k(x_i, x_i)` of the covariance matrix of the sample points 'x'. This default
+        implementation evaluates :meth:`c` at each point separately and may be overridden by covariance functions
+        with a cheaper closed form.
+
+        :params x: An array containing input samples.
+        :params params: A list/array of hyperparameters.
+        """
+        x_ = np.atleast_2d(x)
+        return np.array([self.c(x=x_[i:i + 1], s=x_[i:i + 1], params=params)[0, 0] for i in range(x_.shape[0])])
+
+    def scaled_distances(self, x, s, length_scales, function, squared=True, dtype=np.float64):
+        """
+        Evaluate `function` on the pairwise distances between the sample points 'x' and 's', scaled by the length
+        scales. The distance matrix is never formed at once: it is processed in row blocks whose temporary arrays
+        fit in `memory_budget` bytes, optionally in a pool of `n_threads` threads.
+
+        :params x: An array containing input samples.
+        :params s: An array containing input samples.
+        :params length_scales: A list/array of length scales.
+        :params function: Element-wise function applied to a block of (squared) distances.
+        :params squared: If :any:`True`, `function` receives squared distances, otherwise distances.
+        :params dtype: Floating point type of the result. If it is :class:`numpy.float32`, the distances are computed
+         and passed to `function` in single precision, as if `single_precision` was :any:`True`.
+         Default: :class:`numpy.float64`
+        :return: Array of shape ``(x.shape[0], s.shape[0])``.
+        """
+        x_, s_ = np.atleast_2d(x) / length_scales, np.atleast_2d(s) / length_scales
+        n_x, n_s = x_.shape[0], s_.shape[0]
+        result = np.empty((n_x, n_s), dtype=dtype)
+        single_precision = self.single_precision or result.dtype == np.float32
+        if single_precision:
+            # The points are centered before rounding to reduce the cancellation in the expansion of the distances
+            center = np.mean(s_, axis=0) if n_s > 0 else 0
+            x_, s_ = (x_ - center).astype(np.float32), (s_ - center).astype(np.float32)
+            s_norms = np.einsum("ij,ij->i", s_, s_)
+            item_size = 4
+        else:
+            item_size = 8
+        # Each row of a block requires a few temporary arrays of size n_s
+        rows = int(max(1, min(n_x, self.memory_budget // (4 * item_size * max(n_s, 1)))))
+
+        def evaluate_block(start):
+            x_block = x_[start:start + rows]
+            if single_precision:
+                distances = np.einsum("ij,ij->i", x_block, x_block)[:, None] + s_norms - 2 * (x_block @ s_.T)
+                np.maximum(distances, 0, out=distances)
+                if not squared:
+                    np.sqrt(distances, out=distances)
+            else:
+                distances = cdist(x_block, s_, metric="sqeuclidean" if squared else "euclidean")
+            result[start:start + rows] = function(distances)
+
+        starts = range(0, n_x, rows)
+        if self.n_threads > 1 and len(starts) > 1:
+            with ThreadPoolExecutor(max_workers=self.n_threads) as executor:
+                list(executor.map(evaluate_block, starts))
+        else:
+            for start in starts:
+                evaluate_block(start)
+        return result
+
     @staticmethod
     def check_samples_and_return_stack(x, s):
         x_, s_ = np.atleast_2d(x), np.atleast_2d(s)
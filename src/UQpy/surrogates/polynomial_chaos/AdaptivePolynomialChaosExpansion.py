@@ -0,0 +1,148 @@
+from typing import Union
+
+import numpy as np
+from beartype import beartype
+
+from UQpy.distributions.baseclass import Distribution
+from UQpy.distributions.collection import JointIndependent, JointCopula
+from UQpy.surrogates.polynomial_chaos.PolynomialChaosExpansion import PolynomialChaosExpansion
+from UQpy.surrogates.polynomial_chaos.polynomials.baseclass.PolynomialBasis import PolynomialBasis
+from UQpy.surrogates.polynomial_chaos.regressions.LeastAngleRegression import LeastAngleRegression
+from UQpy.surrogates.polynomial_chaos.regressions.LeastSquareRegression import LeastSquareRegression
+
+
+class AdaptivePolynomialChaosExpansion(PolynomialChaosExpansion):
+
+    @beartype
+    def __init__(self, distributions: Union[Distribution, list[Distribution]], max_degree: int = 10,
+                 hyperbolic: Union[list, tuple] = (0.5, 0.75, 1), max_polynomials: int = 10000,
+                 target_error: Union[int, float] = 0, patience: int = 2):
+        """
+        Polynomial Chaos Expansion with a sparse basis that is adapted to the experimental design, following the
+        degree-adaptive hybrid Least Angle Regression of :cite:`BLATMANLARS`.
+
+        Candidate bases are hyperbolic sets :math:`\\{\\alpha : \\|\\alpha\\|_q \\leq p\\}`, with the hyperbolic norm
+        :math:`\\|\\alpha\\|_q = (\\sum_i \\alpha_i^q)^{1/q}`, for increasing degrees :math:`p` and each value of
+        :math:`q`. The candidate bases are nested, and each one is obtained from the previous one by adding the forward
+        neighbours of its multi-indices, such that the columns of the design matrix are evaluated once. The sparse basis
+        of each candidate basis is selected by Least Angle Regression, with the coefficients computed by ordinary least
+        squares, and the sparse basis with the smallest leave-one-out error is retained.
+
+        :param distributions: Distribution of the inputs.
+        :param max_degree: Maximum degree of the candidate bases.
+        :param hyperbolic: Values of the parameter :math:`q \\in (0, 1]` of the hyperbolic norm. Values smaller than 1
+         exclude the interaction terms of high degree from the candidate bases.
+        :param max_polynomials: Maximum number of polynomials of the candidate bases, which bounds the size of the
+         design matrix. Larger candidate bases are skipped.
+        :param target_error: The adaptation stops when the leave-one-out error falls below this value.
+        :param patience: The adaptation stops when the leave-one-out error has not improved for this number of
+         consecutive degrees.
+        """
+        inputs_number = 1 if not isinstance(distributions, (JointIndependent, JointCopula)) \
+            else len(distributions.marginals)
+        multi_index_set = np.zeros((1, inputs_number), dtype=int)
+        super().__init__(PolynomialBasis(inputs_number, 1, multi_index_set, None, distributions),
+                         LeastSquareRegression())
+        self.max_degree = max_degree
+        self.hyperbolic = sorted(hyperbolic)
+        self.max_polynomials = max_polynomials
+        self.target_error = target_error
+        self.patience = patience
+
+        self.bases: list = []
+        """Degree and hyperbolic parameter :math:`(p, q)` of the candidate bases."""
+        self.errors: list = []
+        """Leave-one-out errors of the sparse bases selected from the candidate bases."""
+        self.polynomials_numbers: list = []
+        """Number of polynomials of the sparse bases selected from the candidate bases."""
+
+    def fit(self, x: np.ndarray, y: np.ndarray):
+        """
+        Adapt the basis to the training samples and fit the surrogate model with the sparse basis of smallest
+        leave-one-out error.
+
+        :param x: containing the training points.
+        :param y: containing the model evaluations at the training points.
+        """
+        x = np.asarray(x)
+        samples_number = x.shape[0]
+        inputs_number = self.polynomial_basis.inputs_number
+        y_ = np.asarray(y, dtype=float).reshape(samples_number, -1)
+        self.experimental_design_input, self.experimental_design_output = x, y
+        self.gram_matrix = None
+
+        # Columns of the design matrix, evaluated once for all candidate bases
+        indices = [(0,) * inputs_number]
+        positions = {indices[0]: 0}
+        design_matrix = np.ones((samples_number, 1))
+        candidate_sets = {q: {indices[0]} for q in self.hyperbolic}
+        self.bases, self.errors, self.polynomials_numbers = [], [], []
+        best_error, best_columns, stalled = np.inf, np.array([0]), 0
+        self.logger.info("UQpy: Running adaptive polynomial_chaos.fit")
+        for degree in range(1, self.max_degree + 1):
+            improved = False
+            for q in list(candidate_sets):
+                candidate_set = self._grow(candidate_sets[q], degree, q)
+                if candidate_set is None:
+                    # The candidate bases of this hyperbolic parameter exceed the maximum number of polynomials
+                    del candidate_sets[q]
+                    continue
+                candidate_sets[q] = candidate_set
+
+                new = [index for index in candidate_set if index not in positions]
+                if len(new) > 0:
+                    positions.update(zip(new, range(len(indices), len(indices) + len(new))))
+                    indices.extend(new)
+                    self._set_basis(np.array(new, dtype=int))
+                    design_matrix = np.hstack([design_matrix, self.polynomial_basis.evaluate_basis(x)])
+                columns = np.sort([positions[index] for index in candidate_set])
+
+                mask = np.zeros(len(columns), dtype=bool)
+                for output in range(y_.shape[1]):
+                    lars = LeastAngleRegression()
+                    lars.run(x, y_[:, output], design_matrix[:, columns])
+                    mask |= LeastAngleRegression._hybrid_selection(design_matrix[:, columns], y_[:, output],
+                                                                   lars.Beta_path)[0]
+                self._fit_columns(x, y, design_matrix, columns[mask], indices)
+                error = float(np.max(self.leaveoneout_error()))
+                self.bases.append((degree, q))
+                self.errors.append(error)
+                self.polynomials_numbers.append(int(np.sum(mask)))
+                if error < best_error:
+                    best_error, best_columns, improved = error, columns[mask], True
+
+            stalled = 0 if improved else stalled + 1
+            if best_error <= self.target_error or stalled >= self.patience or len(candidate_sets) == 0:
+                break
+
+        self._fit_columns(x, y, design_matrix, best_columns, indices)
+        self.logger.info("UQpy: Adaptive polynomial_chaos fit complete with %s polynomials.", len(best_columns))
+
+    def _set_basis(self, multi_index_set):
+        self.polynomial_basis.multi_index_set = multi_index_set
+        self.polynomial_basis.polynomials_number = len(multi_index_set)
+        self.multi_index_set = multi_index_set
+
+    def _fit_columns(self, x, y, design_matrix, columns, indices):
+        self._set_basis(np.array([indices[column] for column in columns], dtype=int))
+        self.design_matrix = design_matrix[:, columns]
+        self.coefficients, self.bias, self.outputs_number = self.regression_method.run(x, y, self.design_matrix)
+
+    def _grow(self, candidate_set, degree, q):
+        # Forward neighbours are added until the hyperbolic set of the given degree is complete. The hyperbolic sets
+        # are downward closed, such that all their multi-indices are reached from a subset.
+        candidate_set = set(candidate_set)
+        frontier = list(candidate_set)
+        while len(frontier) > 0:
+            neighbours = []
+            for index in frontier:
+                for m in range(len(index)):
+                    neighbour = index[:m] + (index[m] + 1,) + index[m + 1:]
+                    if neighbour not in candidate_set and \
+                            round(sum(a ** q for a in neighbour) ** (1 / q), 4) <= degree:
+                        candidate_set.add(neighbour)
+                        neighbours.append(neighbour)
+            if len(candidate_set) > self.max_polynomials:
+                return None
+            frontier = neighbours
+        return candidate_set
@@ -0,0 +1,271 @@
+import logging
+from typing import Union
+
+import numpy as np
+from beartype import beartype
+
+from UQpy.surrogates.baseclass.Surrogate import Surrogate, _import_class, _qualified_name
+from UQpy.surrogates.polynomial_chaos.PolynomialChaosExpansion import PolynomialChaosExpansion
+from UQpy.utilities.ValidationTypes import PositiveInteger, RandomStateType
+from UQpy.utilities.Utilities import process_random_state
+
+
+class PODPolynomialChaosExpansion(Surrogate):
+
+    @beartype
+    def __init__(self, pce: PolynomialChaosExpansion, modes_number: PositiveInteger = None,
+                 reconstruction_percentage: Union[int, float] = None, method: str = "snapshot",
+                 oversampling: int = 10, power_iterations: int = 2, random_state: RandomStateType = None):
+        """
+        Surrogate model of field outputs, e.g. the values of a solution at the nodes of a mesh or at time steps, which
+        combines a Proper Orthogonal Decomposition (POD) of the outputs with a Polynomial Chaos Expansion of the modal
+        coordinates.
+
+        The centered outputs :math:`Y - \\bar{y}` of shape ``(samples_number, nodes_number)`` are approximated by their
+        truncated singular value decomposition :math:`Z \\Phi^T`, where the columns of :math:`\\Phi` are the
+        :math:`k` orthonormal POD modes and :math:`Z = (Y - \\bar{y}) \\Phi` are the modal coordinates. The PCE is
+        fitted to the modal coordinates only, such that it has :math:`k` outputs instead of one output per node.
+
+        :param pce: Polynomial Chaos Expansion of the modal coordinates, with any basis and regression method.
+        :param modes_number: Number of POD modes. Either `modes_number` or `reconstruction_percentage` may be provided,
+         but not both. If none of them is provided, all modes whose singular value exceeds the numerical noise level of
+         the decomposition are retained.
+        :param reconstruction_percentage: Percentage of the variance of the outputs that the retained modes must
+         reconstruct. Must be in the range (0, 100].
+        :param method: Method used to compute the POD modes.
+
+         - "snapshot": Eigendecomposition of the matrix :math:`(Y - \\bar{y})(Y - \\bar{y})^T` of size
+           ``(samples_number, samples_number)``, as in :class:`.SnapshotPOD`, for many nodes and few samples.
+         - "direct": Eigendecomposition of the covariance matrix of size ``(nodes_number, nodes_number)``, as in
+           :class:`.DirectPOD`, for few nodes.
+         - "randomized": Randomized singular value decomposition :cite:`RandomizedSVD`, for many nodes and samples.
+        :param oversampling: Number of additional columns of the random projection of the randomized method.
+        :param power_iterations: Number of power iterations of the randomized method, which improve the accuracy of the
+         modes for slowly decaying singular values.
+        :param random_state: Random seed of the randomized method. Default is :any:`None`.
+         If an :any:`int` is provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise,
+         the object itself can be passed directly.
+        """
+        if modes_number is not None and reconstruction_percentage is not None:
+            raise ValueError("UQpy: Either a number of modes or a reconstruction percentage must be chosen, not both.")
+        if reconstruction_percentage is not None and not 0 < reconstruction_percentage <= 100:
+            raise ValueError("UQpy: The reconstruction percentage is defined in the range (0,100].")
+        if method not in ("snapshot", "direct", "randomized"):
+            raise ValueError("UQpy: method must be 'snapshot', 'direct' or 'randomized'.")
+        self.pce = pce
+        self.modes_number_input = modes_number
+        self.reconstruction_percentage_input = reconstruction_percentage
+        self.method = method
+        self.oversampling = oversampling
+        self.power_iterations = power_iterations
+        self.random_state = process_random_state(random_state)
+        self.logger = logging.getLogger(__name__)
+
+        self.mean: np.ndarray = None
+        """Mean of the outputs over the training samples, of shape ``(nodes_number,)``."""
+        self.modes: np.ndarray = None
+        """Retained POD modes, of shape ``(nodes_number, modes_number)``."""
+        self.singular_values: np.ndarray = None
+        """Singular values of the centered outputs associated with the retained modes."""
+        self.modes_number: int = None
+        """Number of retained POD modes."""
+        self.reconstruction_percentage: float = None
+        """Percentage of the variance of the training outputs reconstructed by the retained modes."""
+
+    def fit(self, x: np.ndarray, y: np.ndarray):
+        """
+        Compute the POD modes of the model evaluations and fit the Polynomial Chaos Expansion to the modal coordinates.
+
+        :param x: containing the training points.
+        :param y: containing the model evaluations at the training points, of shape ``(samples_number, nodes_number)``.
+         Fields of higher dimension are flattened.
+        """
+        x = np.asarray(x)
+        y = np.asarray(y, dtype=float).reshape(x.shape[0], -1)
+        self.mean = np.mean(y, axis=0)
+        centered = y - self.mean
+        self.logger.info("UQpy: Running %s POD of outputs of shape %s", self.method, centered.shape)
+        singular_values, modes = getattr(self, "_" + self.method)(centered)
+
+        if len(singular_values) == 0:
+            raise ValueError("UQpy: The outputs are constant, no POD mode can be computed.")
+
+        energy = np.sum(centered ** 2)
+        if self.modes_number_input is not None:
+            if self.modes_number_input > len(singular_values):
+                self.logger.warning("UQpy: The number of modes is larger than the rank of the outputs, %i modes "
+                                    "are retained.", len(singular_values))
+            modes_number = min(self.modes_number_input, len(singular_values))
+        elif self.reconstruction_percentage_input is not None:
+            percentages = 100 * np.cumsum(singular_values ** 2) / energy
+            modes_number = min(int(np.searchsorted(percentages, self.reconstruction_percentage_input * (1 - 1e-12)))
+                               + 1, len(singular_values))
+        else:
+            modes_number = len(singular_values)
+
+        self.modes_number = modes_number
+        self.modes = modes[:, :modes_number]
+        self.singular_values = singular_values[:modes_number]
+        self.reconstruction_percentage = float(100 * np.sum(self.singular_values ** 2) / energy) \
+            if energy > 0 else 100.0
+        self.logger.info("UQpy: %i POD modes reconstruct %.3f%% of the variance", modes_number,
+                         self.reconstruction_percentage)
+        self.pce.fit(x, centered @ self.modes)
+
+    def _snapshot(self, centered):
+        eigenvalues, eigenvectors = np.linalg.eigh(centered @ centered.T)
+        eigenvalues, eigenvectors = eigenvalues[::-1], eigenvectors[:, ::-1]
+        # The eigendecomposition of the Gram matrix resolves the singular values down to sqrt(eps) only. The
+        # eigenvectors of the significant ones are projected onto the outputs, and the SVD of the projection yields
+        # modes that are orthonormal to machine precision.
+        rank = self._rank(np.sqrt(np.maximum(eigenvalues, 0)), np.sqrt(max(centered.shape) * np.finfo(float).eps))
+        modes, singular_values, _ = np.linalg.svd(centered.T @ eigenvectors[:, :rank], full_matrices=False)
+        return singular_values, modes
+
+    def _direct(self, centered):
+        eigenvalues, eigenvectors = np.linalg.eigh(centered.T @ centered)
+        singular_values = np.sqrt(np.maximum(eigenvalues[::-1], 0))
+        rank = self._rank(singular_values, np.sqrt(max(centered.shape) * np.finfo(float).eps))
+        return singular_values[:rank], eigenvectors[:, ::-1][:, :rank]
+
+    def _randomized(self, centered):
+        # Range finder with power iterations, the rank of the sketch is doubled until the singular values reach the
+        # reconstruction percentage
+        rank = min(centered.shape)
+        energy = np.sum(centered ** 2)
+        sketch = min((self.modes_number_input or self.oversampling) + self.oversampling, rank)
+        while True:
+            q = np.linalg.qr(centered @ self.random_state.normal(size=(centered.shape[1], sketch)))[0]
+            for _ in range(self.power_iterations):
+                q = np.linalg.qr(centered.T @ q)[0]
+                q = np.linalg.qr(centered @ q)[0]
+            _, singular_values, modes = np.linalg.svd(q.T @ centered, full_matrices=False)
+            significant = self._rank(singular_values, max(centered.shape) * np.finfo(float).eps)
+            singular_values, modes = singular_values[:significant], modes[:significant]
+            if self.modes_number_input is not None or sketch == rank or significant < sketch:
+                break
+            percentage = 100 * np.sum(singular_values[:sketch - self.oversampling] ** 2) / energy
+            if percentage >= (self.reconstruction_percentage_input or 100) * (1 - 1e-12) or energy == 0:
+                break
+            sketch = min(2 * sketch, rank)
+        return singular_values, modes.T
+
+    @staticmethod
+    def _rank(singular_values, tolerance):
+        # Number of singular values above the relative noise level of the decomposition
+        if len(singular_values) == 0 or singular_values[0] <= 0:
+            return 0
+        return int(np.sum(singular_values > tolerance * singular_values[0]))
+
+    def predict(self, points: np.ndarray, nodes=None, **kwargs: dict):
+        """
+        Predict the field outputs at new points, by evaluating the Polynomial Chaos Expansion of the modal coordinates
+        and reconstructing the outputs at the requested nodes only.
+
+        :param points: Points at which to predict the model response.
+        :param nodes: Indices of the nodes (or time steps) of the flattened outputs at which the outputs are
+         reconstructed, i.e. an array of integers, a boolean mask or a slice. Default: :any:`None`, i.e. all nodes.
+        :return: Predicted values of shape ``(points_number, nodes_number)``.
+        """
+        coordinates = self.pce.predict(points, **kwargs)
+        return self._reconstruct(coordinates, nodes)
+
+    def _reconstruct(self, coordinates, nodes):
+        if nodes is None:
+            return self.mean + coordinates @ self.modes.T
+        return self.mean[nodes] + coordinates @ np.asarray(self.modes[nodes]).T
+
+    def get_moments(self, nodes=None):
+        """
+        Mean and variance of the field outputs, computed in the reduced space.
+
+        The mean of the modal coordinates is the coefficient of the constant polynomial and, due to the orthonormality
+        of the basis, their covariance is :math:`G = C^T C`, where :math:`C` contains the coefficients of the
+        non-constant polynomials. The moments of node :math:`j` are
+        :math:`\\mu_j = \\bar{y}_j + \\phi_j^T c_0` and :math:`\\sigma_j^2 = \\phi_j^T G \\phi_j`, such that only
+        matrices of size ``(modes_number, modes_number)`` are formed.
+
+        :param nodes: Indices of the nodes of the flattened outputs. Default: :any:`None`, i.e. all nodes.
+        :return: Returns the mean and variance at the nodes.
+        """
+        modes = self._modes(nodes)
+        coefficients = self.pce.coefficients
+        constant = self._constant_row()
+        modal_mean = coefficients[constant] if constant is not None else np.zeros(coefficients.shape[1])
+        if self.pce.bias is not None:
+            modal_mean = modal_mean + np.ravel(self.pce.bias)
+        mean = (self.mean if nodes is None else self.mean[nodes]) + modes @ modal_mean
+        return mean, self._variance(modes, np.any(self.pce.multi_index_set != 0, axis=1))
+
+    def calculate_first_order_indices(self, nodes=None) -> np.ndarray:
+        """
+        First order Sobol indices of the field outputs, computed in the reduced space from the coefficients of the
+        polynomials that depend on a single input.
+
+        :param nodes: Indices of the nodes of the flattened outputs. Default: :any:`None`, i.e. all nodes.
+        :return: First order Sobol indices of shape ``(inputs_number, nodes_number)``.
+        """
+        multi_index_set = self.pce.multi_index_set
+        active = multi_index_set != 0
+        single = np.sum(active, axis=1) == 1
+        return self._indices(nodes, [single & active[:, i] for i in range(multi_index_set.shape[1])])
+
+    def calculate_total_order_indices(self, nodes=None) -> np.ndarray:
+        """
+        Total order Sobol indices of the field outputs, computed in the reduced space from the coefficients of the
+        polynomials that depend on each input.
+
+        :param nodes: Indices of the nodes of the flattened outputs. Default: :any:`None`, i.e. all nodes.
+        :return: Total order Sobol indices of shape ``(inputs_number, nodes_number)``.
+        """
+        active = self.pce.multi_index_set != 0
+        return self._indices(nodes, list(active.T))
+
+    def _indices(self, nodes, masks):
+        modes = self._modes(nodes)
+        variance = self._variance(modes, np.any(self.pce.multi_index_set != 0, axis=1))
+        return np.array([self._variance(modes, mask) for mask in masks]) / variance
+
+    def _variance(self, modes, mask):
+        # Variance of the reconstructed outputs due to the polynomials of the mask, phi_j^T C_m^T C_m phi_j
+        coefficients = self.pce.coefficients[mask]
+        return np.sum((modes @ (coefficients.T @ coefficients)) * modes, axis=1)
+
+    def _modes(self, nodes):
+        return np.asarray(self.modes if nodes is None else self.modes[nodes])
+
+    def _constant_row(self):
+        constant = np.flatnonzero(~np.any(self.pce.multi_index_set != 0, axis=1))
+        return constant[0] if len(constant) > 0 else None
+
+    def _export(self):
+        arrays, metadata = self.pce._export()
+        name, key, position, has_gauss, cached_gaussian = self.random_state.get_state()
+        arrays = dict(arrays, modes=self.modes, mean=self.mean, singular_values=self.singular_values,
+                      random_state_key=key)
+        metadata = dict(metadata, pce=_qualified_name(self.pce), modes_number=self.modes_number,
+                        reconstruction_percentage=self.reconstruction_percentage,
+                        modes_number_input=self.modes_number_input,
+                        reconstruction_percentage_input=self.reconstruction_percentage_input, method=self.method,
+                        oversampling=self.oversampling, power_iterations=self.power_iterations,
+                        random_state=[name, int(position), int(has_gauss), float(cached_gaussian)])
+        return arrays, metadata
+
+    def _import(self, arrays, metadata):
+        pce_class = _import_class(metadata["pce"])
+        self.pce = pce_class.__new__(pce_class)
+        self.pce.logger = logging.getLogger(pce_class.__module__)
+        self.modes, self.mean = arrays.pop("modes"), arrays.pop("mean")
+        self.singular_values = arrays.pop("singular_values")
+        name, position, has_gauss, cached_gaussian = metadata["random_state"]
+        self.random_state = np.random.RandomState()
+        self.random_state.set_state((name, np.array(arrays.pop("random_state_key")), position, has_gauss,
+                                     cached_gaussian))
+        self.pce._import(arrays, metadata)
+        self.modes_number = metadata["modes_number"]
+        self.reconstruction_percentage = metadata["reconstruction_percentage"]
+        self.modes_number_input = metadata["modes_number_input"]
+        self.reconstruction_percentage_input = metadata["reconstruction_percentage_input"]
+        self.method = metadata["method"]
+        self.oversampling = metadata["oversampling"]
+        self.power_iterations = metadata["power_iterations"]
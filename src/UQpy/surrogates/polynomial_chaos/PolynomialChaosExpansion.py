@@ -7,8 +7,7 @@ from UQpy.utilities.ValidationTypes import NumpyFloatArray
 from UQpy.surrogates.baseclass.Surrogate import Surrogate
 from UQpy.surrogates.polynomial_chaos.regressions.baseclass.Regression import Regression
 from UQpy.surrogates.polynomial_chaos.polynomials.TotalDegreeBasis import PolynomialBasis
-from UQpy.distributions import Uniform, Normal
-from UQpy.surrogates.polynomial_chaos.polynomials import Legendre, Hermite
+from UQpy.distributions import JointIndependent, JointCopula
 
 
 class PolynomialChaosExpansion(Surrogate):
@@ -36,6 +35,8 @@ class PolynomialChaosExpansion(Surrogate):
         self.design_matrix: NumpyFloatArray = None
         """Matrix containing the evaluations of the PCE basis on the experimental 
         design that has been used to fit the PCE coefficients"""
+        self.gram_matrix: NumpyFloatArray = None
+        """Gram matrix :math:`\\Psi^T \\Psi` of the design matrix accumulated by :meth:`fit_streaming`"""
 
         self.experimental_design_input: NumpyFloatArray = None
         """Realizations of the random parameter in the experimental design that 
@@ -46,7 +47,7 @@ class PolynomialChaosExpansion(Surrogate):
 
     @property
     def polynomials_number(self):
-        return len(self.polynomial_basis.polynomials)
+        return self.polynomial_basis.polynomials_number
 
     @property
     def inputs_number(self):
@@ -66,25 +67,98 @@ class PolynomialChaosExpansion(Surrogate):
         self.experimental_design_input = x
         self.experimental_design_output = y
         self.design_matrix = self.polynomial_basis.evaluate_basis(x)
+        self.gram_matrix = None
         self.logger.info("UQpy: Running polynomial_chaos.fit")
         self.coefficients, self.bias, self.outputs_number = self.regression_method.run(x, y, self.design_matrix)
         self.logger.info("UQpy: polynomial_chaos fit complete.")
 
-    def predict(self, points: np.ndarray, **kwargs: dict):
+    def fit_streaming(self, chunks):
+        """
+        Fit the surrogate model without assembling the design matrix of the whole experimental design.
+
+        The training data is consumed in chunks, e.g. from a generator or from slices of memory-mapped arrays. For each
+        chunk, the design matrix :math:`\\Psi_k` is evaluated and the products :math:`\\Psi_k^T \\Psi_k` and
+        :math:`\\Psi_k^T Y_k`, as well as the sums of the columns of :math:`\\Psi_k` and :math:`Y_k`, are accumulated,
+        such that the memory requirements depend on the chunk size and the number of polynomials only. The
+        coefficients are computed with the :meth:`.Regression.solve_normal_equations` method of the regression method,
+        which must support the normal equations (:class:`.LeastSquareRegression` or :class:`.RidgeRegression`),
+        otherwise a :class:`TypeError` is raised. The solution equals the one of :meth:`fit` with the same regression
+        method, computed in closed form.
+
+        :param chunks: Iterable of tuples ``(x, y)`` containing the training points and the model evaluations of each
+         chunk. The model evaluations may have several outputs.
+
+        The design matrix and the experimental design are not stored. The leave-one-out error of the fitted model can
+        be computed with a second pass over the data using :meth:`leaveoneout_error`.
+        """
+        if not self.regression_method.supports_normal_equations():
+            raise TypeError("UQpy: {0} does not support streaming fits."
+                            .format(type(self.regression_method).__name__))
+        self.logger.info("UQpy: Running polynomial_chaos.fit_streaming")
+        gram, moments, column_sums, output_sums, samples_number = 0, 0, 0, 0, 0
+        for x, y in chunks:
+            x = np.asarray(x)
+            y = np.asarray(y, dtype=float).reshape(x.shape[0], -1)
+            design_matrix = self.polynomial_basis.evaluate_basis(x)
+            gram = gram + design_matrix.T @ design_matrix
+            moments = moments + design_matrix.T @ y
+            column_sums = column_sums + np.sum(design_matrix, axis=0)
+            output_sums = output_sums + np.sum(y, axis=0)
+            samples_number += x.shape[0]
+        if samples_number == 0:
+            raise ValueError("UQpy: No training data was provided.")
+
+        self.experimental_design_input, self.experimental_design_output, self.design_matrix = None, None, None
+        self.gram_matrix = gram
+        self.coefficients, self.bias, self.outputs_number = \
+            self.regression_method.solve_normal_equations(gram, moments, column_sums, output_sums, samples_number)
+        self.logger.info("UQpy: polynomial_chaos fit complete.")
+
+    def predict(self, points: np.ndarray, dtype=np.float64, **kwargs: dict):
         """
         Predict the model response at new points.
         This method evaluates the polynomial_chaos model at new sample points.
 
         :param points: Points at which to predict the model response.
+        :param dtype: Floating point type of the predictions. If it is :class:`numpy.float32`, the design matrix is
+         assembled and multiplied by the coefficients in single precision.
+         Default: :class:`numpy.float64`
         :return: Predicted values at the new points.
         """
-        a = self.polynomial_basis.evaluate_basis(points)
-        y = a.dot(self.coefficients)
+        a = self.polynomial_basis.evaluate_basis(points, dtype=dtype)
+        y = a.dot(self.coefficients.astype(dtype, copy=False))
         if self.bias is not None:
-            y = y + self.bias
+            y = y + np.asarray(self.bias, dtype=dtype)
         return y
 
-    def leaveoneout_error(self):
+    def _export(self):
+        distributions = self.polynomial_basis.distributions
+        if isinstance(distributions, JointCopula):
+            raise NotImplementedError("UQpy: Saving is not supported for distributions with a copula.")
+        joint = isinstance(distributions, JointIndependent)
+        marginals = distributions.marginals if joint else [distributions]
+        arrays = {"multi_index_set": self.multi_index_set, "coefficients": self.coefficients, "bias": self.bias}
+        metadata = {"joint": joint, "outputs_number": self.outputs_number,
+                    "regression_method": self._describe(self.regression_method),
+                    "marginals": [{"class": type(marginal).__module__ + "." + type(marginal).__qualname__,
+                                   "parameters": marginal.parameters} for marginal in marginals]}
+        return arrays, metadata
+
+    def _import(self, arrays, metadata):
+        marginals = [self._restore(marginal) for marginal in metadata["marginals"]]
+        distributions = JointIndependent(marginals) if metadata["joint"] else marginals[0]
+        self.multi_index_set = np.asarray(arrays["multi_index_set"])
+        self.polynomial_basis = PolynomialBasis(len(marginals), len(self.multi_index_set), self.multi_index_set, None,
+                                                distributions)
+        self.coefficients, self.bias = arrays["coefficients"], arrays.get("bias")
+        self.outputs_number = metadata["outputs_number"]
+        self.regression_method = self._restore(metadata.get("regression_method"))
+        if self.regression_method is not None:
+            self.regression_method.logger = logging.getLogger(type(self.regression_method).__module__)
+        self.design_matrix, self.gram_matrix = None, None
+        self.experimental_design_input, self.experimental_design_output = None, None
+
+    def leaveoneout_error(self, chunks=None):
         """
         Returns the cross validation error (leave-one-out) based on experimental design.
 
@@ -96,8 +170,16 @@ class PolynomialChaosExpansion(Surrogate):
 
         where :math:`\sigma_Y^2` is a variance of model response and :math:`h_i` represents the :math:`i` th diagonal term of matrix :math:`\mathbf{H}= \Psi ( \Psi^T \Psi )^{-1} \Psi^T` obtained from design matrix :math:`\Psi` without additional simulations  :cite:`BLATMANLARS`.
 
+        :param chunks: Iterable of tuples ``(x, y)`` containing the experimental design in chunks, which is required
+         after :meth:`fit_streaming`. The diagonal terms :math:`h_i` are then computed chunk by chunk from the
+         accumulated :attr:`gram_matrix`, without assembling the design matrix.
         :return: Cross validation error of experimental design.
         """
+        if chunks is not None:
+            return self._streaming_leaveoneout_error(chunks)
+        if self.design_matrix is None:
+            raise ValueError("UQpy: The experimental design is required to compute the leave-one-out error of a "
+                             "streaming fit.")
 
         x = self.experimental_design_input
         y = self.experimental_design_output
@@ -107,8 +189,10 @@ class PolynomialChaosExpansion(Surrogate):
 
         n_samples = x.shape[0]
         mu_yval = (1 / n_samples) * np.sum(y, axis=0)
-        y_val = self.predict(x, )
         polynomialbasis = self.design_matrix
+        y_val = polynomialbasis.dot(self.coefficients)
+        if self.bias is not None:
+            y_val = y_val + self.bias
 
         H = np.dot(polynomialbasis, np.linalg.pinv(np.dot(polynomialbasis.T, polynomialbasis)))
         H *= polynomialbasis
@@ -121,6 +205,37 @@ class PolynomialChaosExpansion(Surrogate):
 
         return np.round(eps_val, 7)
 
+    def _streaming_leaveoneout_error(self, chunks):
+        gram = self.gram_matrix
+        if gram is None and self.design_matrix is not None:
+            gram = self.design_matrix.T @ self.design_matrix
+        if gram is None:
+            raise ValueError("UQpy: The leave-one-out error requires a fitted surrogate model.")
+        gram_inverse = np.linalg.pinv(gram)
+        # Sum of squared leave-one-out residuals, and running mean and sum of squared deviations of the outputs, which
+        # are combined chunk by chunk
+        errors, mean, deviations, n_samples = 0, 0, 0, 0
+        for x, y in chunks:
+            x = np.asarray(x)
+            y = np.asarray(y, dtype=float).reshape(x.shape[0], -1)
+            design_matrix = self.polynomial_basis.evaluate_basis(x)
+            h_diag = np.sum((design_matrix @ gram_inverse) * design_matrix, axis=1).reshape(-1, 1)
+            residuals = y - self.predict(x)
+            errors = errors + np.sum((residuals / (1 - h_diag)) ** 2, axis=0)
+
+            chunk_size, chunk_mean = x.shape[0], np.mean(y, axis=0)
+            chunk_deviations = np.sum((y - chunk_mean) ** 2, axis=0)
+            delta = chunk_mean - mean
+            deviations = deviations + chunk_deviations + delta ** 2 * n_samples * chunk_size / (n_samples + chunk_size)
+            mean = mean + delta * chunk_size / (n_samples + chunk_size)
+            n_samples += chunk_size
+
+        eps_val = ((n_samples - 1) / n_samples * errors) / deviations
+        if self.outputs_number == 1:
+            eps_val = float(eps_val)
+
+        return np.round(eps_val, 7)
+
     def validation_error(self, x: np.ndarray, y: np.ndarray):
         """
         Returns the validation error.
@@ -166,17 +281,17 @@ class PolynomialChaosExpansion(Surrogate):
 
         The first moment (mean value) is calculated as
 
-        .. math:: \mu_{PCE} = \mathbb{E} [ \mathcal{M}^{PCE}(x)] = y_{0}
+        .. math:: \\mu_{PCE} = \\mathbb{E} [ \\mathcal{M}^{PCE}(x)] = y_{0}
 
         where :math:`y_{0}` is the first PCE coefficient associated with the constant term.
 
         The second moment (variance) is calculated as
 
-        .. math:: \sigma^{2}_{PCE} = \mathbb{E} [( \mathcal{M}^{PCE}(x) - \mu_{PCE} )^{2} ] = \sum_{i=1}^{p} y_{i}
+        .. math:: \\sigma^{2}_{PCE} = \\mathbb{E} [( \\mathcal{M}^{PCE}(x) - \\mu_{PCE} )^{2} ] = \\sum_{i=1}^{p} y_{i}
 
         where :math:`p` is the number of polynomials (first PCE coefficient is excluded).
         
-        The third moment (skewness) and the fourth moment (kurtosis) are generally obtained from third and fourth order products obtained by integration, which are extremely computationally demanding. Therefore here we use analytical solution of standard linearization problem for Hermite (based on normalized Feldheim's formula ) and Legendre polynomials (based on normalized Neumann-Adams formula), though it might be still computationally demanding for high number of input random variables.
+        The third moment (skewness) and the fourth moment (kurtosis) are generally obtained from third and fourth order products obtained by integration, which are extremely computationally demanding. Therefore here we use the solution of the linearization problem :math:`\\Psi_i \\Psi_j = \\sum_k \\mathbb{E}[\\Psi_i \\Psi_j \\Psi_k] \\Psi_k`, where the univariate triple products are tabulated once per polynomial family and degree by Gauss quadrature. The square of the centered PCE is linearized over the pairs of non-zero coefficients, such that the third and fourth moments follow from the orthonormality of the basis as :math:`\\mathbb{E}[f^3] = \\sum_k c_k y_k` and :math:`\\mathbb{E}[f^4] = \\sum_k c_k^2`, where :math:`c_k` are the coefficients of the linearized square.
         
         :param higher: True corresponds to calculation of skewness and kurtosis (computationaly expensive for large basis set).
         :return: Returns the mean and variance.
@@ -197,79 +312,64 @@ class PolynomialChaosExpansion(Surrogate):
             return mean, variance
 
         else:
-            multindex = self.multi_index_set
-            P, inputs_number = multindex.shape
-
-            if inputs_number == 1:
-                marginals = [self.polynomial_basis.distributions]
-
-            else:
-                marginals = self.polynomial_basis.distributions.marginals
-
-            skewness = np.zeros(self.outputs_number)
-            kurtosis = np.zeros(self.outputs_number)
-
-            for ii in range(0, self.outputs_number):
-
-                Beta = self.coefficients[:, ii]
-                third_moment = 0
-                fourth_moment = 0
-
-                indices = np.array(np.meshgrid(range(1, P), range(1, P), range(1, P), range(1, P))).T.reshape(-1, 4)
-                i = 0
-                for index in indices:
-                    tripleproduct_ND = 1
-                    quadproduct_ND = 1
+            third_moment, fourth_moment = self._higher_moments()
+            skewness = third_moment / (np.sqrt(variance) ** 3)
+            kurtosis = fourth_moment / (variance ** 2)
 
-                    for m in range(0, inputs_number):
-
-                        if i < (P - 1) ** 3:
-
-                            if type(marginals[m]) == Normal:
-                                tripleproduct_1D = Hermite.hermite_triple_product(multindex[index[0], m],
-                                                                                  multindex[index[1], m],
-                                                                                  multindex[index[2], m])
-
-                            if type(marginals[m]) == Uniform:
-                                tripleproduct_1D = Legendre.legendre_triple_product(multindex[index[0], m],
-                                                                                    multindex[index[1], m],
-                                                                                    multindex[index[2], m])
-
-                            tripleproduct_ND = tripleproduct_ND * tripleproduct_1D
-
-                        else:
-                            tripleproduct_ND = 0
-
-                        quadproduct_1D = 0
-
-                        for n in range(0, multindex[index[0], m] + multindex[index[1], m] + 1):
-
-                            if type(marginals[m]) == Normal:
-                                tripproduct1 = Hermite.hermite_triple_product(multindex[index[0], m],
-                                                                              multindex[index[1], m], n)
-                                tripproduct2 = Hermite.hermite_triple_product(multindex[index[2], m],
-                                                                              multindex[index[3], m], n)
-
-                            if type(marginals[m]) == Uniform:
-                                tripproduct1 = Legendre.legendre_triple_product(multindex[index[0], m],
-                                                                                multindex[index[1], m], n)
-                                tripproduct2 = Legendre.legendre_triple_product(multindex[index[2], m],
-                                                                                multindex[index[3], m], n)
-
-                            quadproduct_1D = quadproduct_1D + tripproduct1 * tripproduct2
-
-                        quadproduct_ND = quadproduct_ND * quadproduct_1D
-
-                    third_moment += tripleproduct_ND * Beta[index[0]] * Beta[index[1]] * Beta[index[2]]
-                    fourth_moment += quadproduct_ND * Beta[index[0]] * Beta[index[1]] * Beta[index[2]] * Beta[index[3]]
-
-                    i += 1
-
-                skewness[ii] = 1 / (np.sqrt(variance) ** 3) * third_moment
-                kurtosis[ii] = 1 / (variance ** 2) * fourth_moment
-
-                if self.coefficients.ndim == 1 or self.coefficients.shape[1] == 1:
-                    skewness = float(skewness[0])
-                    kurtosis = float(kurtosis[0])
+            if self.coefficients.ndim == 1 or self.coefficients.shape[1] == 1:
+                skewness = float(skewness[0])
+                kurtosis = float(kurtosis[0])
 
             return mean, variance, skewness, kurtosis
+
+    def _higher_moments(self):
+        # Third and fourth central moments from the linearization f^2 = sum_g c_g Psi_g of the square of the centered
+        # expansion f = sum_{i>0} y_i Psi_i, such that E[f^3] = sum_g c_g y_g and E[f^4] = sum_g c_g^2. Each pair of
+        # non-zero coefficients contributes y_i y_j prod_m E[psi_(i_m) psi_(j_m) psi_(g_m)] to the multi-indices g
+        # with |i_m - j_m| <= g_m <= i_m + j_m, which are the only non-zero terms of the linearization of
+        # psi_(i_m) psi_(j_m).
+        multi_index_set = np.asarray(self.multi_index_set, dtype=int).reshape(-1, self.inputs_number)
+        coefficients = np.asarray(self.coefficients).reshape(multi_index_set.shape[0], -1)
+        support = np.flatnonzero(np.any(coefficients[1:] != 0, axis=1)) + 1
+        if len(support) == 0:
+            return np.zeros(coefficients.shape[1]), np.zeros(coefficients.shape[1])
+        active = np.flatnonzero(np.any(multi_index_set[support] > 0, axis=0))
+        indices, beta = multi_index_set[np.ix_(support, active)], coefficients[support]
+
+        univariate = self.polynomial_basis._univariate_polynomials()
+        tables = [univariate[m].triple_product_table(int(degree)) for m, degree in zip(active, np.max(indices, axis=0))]
+
+        first, second = np.triu_indices(len(support))
+        weights = np.where(first == second, 1.0, 2.0)[:, None] * beta[first] * beta[second]
+        lowest = np.abs(indices[first] - indices[second])
+        counts = 2 * np.minimum(indices[first], indices[second]) + 1
+        terms = np.prod(counts, axis=1)
+
+        # Pairs are processed in blocks, the terms of each block are summed per multi-index g
+        linearization_set, linearization = np.zeros((0, len(active)), dtype=int), np.zeros((0, beta.shape[1]))
+        limit = max(1, self.polynomial_basis.memory_budget // (8 * (len(active) + beta.shape[1] + 2)))
+        boundaries = np.searchsorted(np.cumsum(terms), np.arange(limit, np.sum(terms), limit))
+        for pairs in np.split(np.arange(len(first)), np.unique(boundaries + 1)):
+            if len(pairs) == 0:
+                continue
+            pair = np.repeat(pairs, terms[pairs])
+            local = np.arange(len(pair)) - np.repeat(np.cumsum(terms[pairs]) - terms[pairs], terms[pairs])
+            gamma = np.empty((len(pair), len(active)), dtype=int)
+            products = np.ones(len(pair))
+            for m, table in enumerate(tables):
+                local, digit = np.divmod(local, counts[pair, m])
+                gamma[:, m] = lowest[pair, m] + digit
+                products *= table[indices[first[pair], m], indices[second[pair], m], gamma[:, m]]
+            gamma = np.concatenate([linearization_set, gamma])
+            values = np.concatenate([linearization, products[:, None] * weights[pair]])
+            linearization_set, inverse = np.unique(gamma, axis=0, return_inverse=True)
+            linearization = np.stack([np.bincount(inverse.reshape(-1), weights=values[:, q],
+                                                  minlength=len(linearization_set))
+                                      for q in range(values.shape[1])], axis=1)
+
+        positions = {index: row for row, index in enumerate(map(tuple, linearization_set.tolist()))}
+        rows = [positions.get(index, -1) for index in map(tuple, indices.tolist())]
+        support_linearization = np.where(np.array(rows)[:, None] >= 0, linearization[rows], 0)
+        third_moment = np.einsum("gq,gq->q", support_linearization, beta)
+        fourth_moment = np.einsum("gq,gq->q", linearization, linearization)
+        return third_moment, fourth_moment
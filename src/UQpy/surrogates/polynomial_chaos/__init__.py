@@ -2,6 +2,8 @@ from UQpy.surrogates.polynomial_chaos.polynomials import *
 from UQpy.surrogates.polynomial_chaos.regressions import *
 
 from UQpy.surrogates.polynomial_chaos.PolynomialChaosExpansion import PolynomialChaosExpansion
+from UQpy.surrogates.polynomial_chaos.AdaptivePolynomialChaosExpansion import AdaptivePolynomialChaosExpansion
+from UQpy.surrogates.polynomial_chaos.PODPolynomialChaosExpansion import PODPolynomialChaosExpansion
 from UQpy.surrogates.polynomial_chaos.polynomials.baseclass.Polynomials import Polynomials
 from UQpy.surrogates.polynomial_chaos.regressions.LassoRegression import LassoRegression
 from UQpy.surrogates.polynomial_chaos.regressions.LeastSquareRegression import LeastSquareRegression
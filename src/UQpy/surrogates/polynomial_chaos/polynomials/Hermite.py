@@ -49,7 +49,14 @@ class Hermite(Polynomials):
 
         return Polynomials.normalized(self.degree, x_, a, b, pdf_st, p)
 
-    def evaluate(self, x):
+    def evaluate(self, x, dtype=np.float64):
+        """
+        Calculates the normalized Hermite polynomials evaluated at sample points.
+
+        :param x: :class:`numpy.ndarray` containing the samples.
+        :param dtype: Floating point type of the evaluations. The polynomials are evaluated in double precision and
+         rounded.
+        """
         x = np.array(x).flatten()
 
         # normalize data
@@ -64,8 +71,26 @@ class Hermite(Polynomials):
 
         h = h / st_herm_norm
 
-        return h
+        return h.astype(dtype, copy=False)
     
+    def supports_recurrence(self):
+        return True
+
+    def standardize(self, x: np.ndarray):
+        return Polynomials.standardize_normal(x, mean=self.distributions.parameters['loc'],
+                                              std=self.distributions.parameters['scale'])
+
+    def recurrence_coefficients(self, n: int):
+        """
+        Recurrence coefficients of the monic (probabilists') Hermite polynomials, orthogonal with respect to the
+        standard normal density: :math:`a_k = 0` and :math:`b_k = k`.
+
+        :param n: Number of coefficients.
+        """
+        b = np.arange(n, dtype=float)
+        b[0] = 1
+        return np.zeros(n), b
+
     @staticmethod
     def hermite_triple_product (k,l,m):
         tripleproduct=0
@@ -24,5 +24,4 @@ class HyperbolicBasis(PolynomialBasis):
         if 0 < hyperbolic < 1:
             mask = np.round(np.sum(multi_index_set ** hyperbolic, axis=1) ** (1 / hyperbolic), 4) <= max_degree
             multi_index_set = multi_index_set[mask]
-        polynomials = PolynomialBasis.construct_arbitrary_basis(inputs_number, distributions, multi_index_set)
-        super().__init__(inputs_number, len(multi_index_set), multi_index_set, polynomials, distributions)
+        super().__init__(inputs_number, len(multi_index_set), multi_index_set, None, distributions)
@@ -25,11 +25,13 @@ class Legendre(Polynomials):
         self.degree = degree
         self.pdf = self.distributions
 
-    def evaluate(self, x: np.ndarray):
+    def evaluate(self, x: np.ndarray, dtype=np.float64):
         """
         Calculates the normalized Legendre polynomials evaluated at sample points.
 
         :param x: :class:`numpy.ndarray` containing the samples.
+        :param dtype: Floating point type of the evaluations. The polynomials are evaluated in double precision and
+         rounded.
         :return: Α list of :class:`numpy.ndarray` with the design matrix and the
                     normalized polynomials.
         """
@@ -48,7 +50,25 @@ class Legendre(Polynomials):
         # multiply by sqrt(2) to take into account the pdf 1/2
         l = np.sqrt(2) * l / st_lege_norm
 
-        return l
+        return l.astype(dtype, copy=False)
+
+    def supports_recurrence(self):
+        return True
+
+    def standardize(self, x: np.ndarray):
+        return Polynomials.standardize_uniform(x, self.distributions)
+
+    def recurrence_coefficients(self, n: int):
+        """
+        Recurrence coefficients of the monic Legendre polynomials, orthogonal with respect to the uniform probability
+        density on :math:`[-1, 1]`: :math:`a_k = 0` and :math:`b_k = k^2 / (4k^2-1)`.
+
+        :param n: Number of coefficients.
+        """
+        k = np.arange(n, dtype=float)
+        b = np.ones(n)
+        b[1:] = k[1:] ** 2 / (4 * k[1:] ** 2 - 1)
+        return np.zeros(n), b
 
     @staticmethod
     def legendre_triple_product(k, l, m):
@@ -0,0 +1,113 @@
+import numpy as np
+from beartype import beartype
+
+from UQpy.distributions.baseclass import DistributionContinuous1D
+from UQpy.surrogates.polynomial_chaos.polynomials.baseclass.Polynomials import Polynomials
+
+
+class OrthonormalPolynomials(Polynomials):
+
+    @beartype
+    def __init__(self, degree: int, distributions: DistributionContinuous1D):
+        """
+        Class of univariate polynomials orthonormal with respect to an arbitrary continuous distribution with finite
+        variance, for which no classical family of polynomials is available.
+
+        The polynomials are defined by the three-term recurrence of the monic orthogonal polynomials of the standardized
+        variable :math:`(x-\\mu)/\\sigma`. The recurrence coefficients are computed by the discretized Stieltjes
+        procedure :cite:`Gautschi`, i.e. by Lanczos iterations on a quadrature of the distribution, and are cached for
+        each distribution type and parameters.
+
+        :param degree: Maximum degree of the polynomials.
+        :param distributions: Distribution object of the generated samples.
+        """
+        super().__init__(distributions, degree)
+        self.degree = degree
+        self.pdf = self.distributions.pdf
+        mean, variance = self.distributions.moments(moments2return="mv")
+        if not (np.isfinite(mean) and np.isfinite(variance) and variance > 0):
+            raise ValueError("UQpy: Orthonormal polynomials require a distribution with finite mean and variance.")
+        self.mean, self.std = float(mean), float(np.sqrt(variance))
+
+    def evaluate(self, x: np.ndarray, dtype=np.float64):
+        """
+        Calculates the orthonormal polynomials evaluated at sample points, with the three-term recurrence.
+
+        :param x: :class:`numpy.ndarray` containing the samples.
+        :param dtype: Floating point type of the evaluations. The polynomials are evaluated in double precision and
+         rounded.
+        """
+        return self.evaluate_table(x, self.degree, dtype=dtype)[:, -1]
+
+    def supports_recurrence(self):
+        return True
+
+    def standardize(self, x: np.ndarray):
+        return Polynomials.standardize_normal(x, self.mean, self.std)
+
+    def recurrence_coefficients(self, n: int):
+        """
+        Recurrence coefficients of the monic polynomials orthogonal with respect to the distribution of the
+        standardized variable, computed by the discretized Stieltjes procedure.
+
+        :param n: Number of coefficients.
+        """
+        key = (type(self.distributions), repr(sorted(self.distributions.get_parameters().items())))
+        cached = OrthonormalPolynomials._recurrence_coefficients.get(key)
+        if cached is None or len(cached[0]) < n:
+            nodes, weights = self._discretize()
+            OrthonormalPolynomials._recurrence_coefficients[key] = self._stieltjes(nodes, weights, max(n, 1))
+        a, b = OrthonormalPolynomials._recurrence_coefficients[key]
+        return a[:n].copy(), b[:n].copy()
+
+    def _discretize(self, panels=200, nodes_number=20):
+        # Composite Gauss-Legendre quadrature of the distribution, on each side of the median. A finite end is graded
+        # by the map 1 - cos, in the space of the samples if the density is finite at the end and in the space of the
+        # probabilities otherwise, such that singular densities are integrated accurately. An infinite tail is mapped
+        # to a finite interval.
+        distribution = self.distributions
+        t, w = np.polynomial.legendre.leggauss(nodes_number)
+        edges = np.linspace(-1, 1, panels + 1)
+        t = ((edges[:-1] + edges[1:])[:, None] + np.diff(edges)[:, None] * t).flatten() / 2
+        w = (np.diff(edges)[:, None] * w).flatten() / 2
+        graded, graded_derivative = 1 - np.cos(np.pi * (1 + t) / 4), np.pi / 4 * np.sin(np.pi * (1 + t) / 4)
+
+        median = float(distribution.icdf(0.5)[0])
+        samples, weights = [], []
+        for sign, end in ((-1, float(distribution.icdf(0)[0])), (1, float(distribution.icdf(1)[0]))):
+            if np.isinf(end):
+                x = median + sign * self.std * (1 + t) / (1 - t)
+                weights.append(w * distribution.pdf(x) * self.std * 2 / (1 - t) ** 2)
+            elif np.isfinite(distribution.pdf(end)[0]):
+                x = end + (median - end) * graded
+                weights.append(w * distribution.pdf(x) * abs(median - end) * graded_derivative)
+            else:
+                x = distribution.icdf(0.5 + sign * (0.5 - graded / 2))
+                weights.append(w * graded_derivative / 2)
+            samples.append(x)
+        samples, weights = np.concatenate(samples), np.concatenate(weights)
+        finite = np.isfinite(samples) & np.isfinite(weights)
+        return self.standardize(samples[finite]), weights[finite] / np.sum(weights[finite])
+
+    @staticmethod
+    def _stieltjes(nodes, weights, n):
+        # Lanczos iterations with full reorthogonalization of the orthonormal polynomials at the nodes
+        a, b = np.zeros(n), np.ones(n)
+        q = np.zeros((n + 1, nodes.shape[0]))
+        q[0] = 1
+        for k in range(n):
+            a[k] = np.sum(weights * nodes * q[k] ** 2)
+            r = (nodes - a[k]) * q[k]
+            if k > 0:
+                r -= np.sqrt(b[k]) * q[k - 1]
+            r -= q[:k + 1].T @ (q[:k + 1] @ (weights * r))
+            norm = np.sum(weights * r ** 2)
+            if k + 1 < n:
+                b[k + 1] = norm
+            q[k + 1] = r / np.sqrt(norm)
+        return a, b
+
+    _recurrence_coefficients = {}
+
+
+Polynomials.distribution_to_polynomial[DistributionContinuous1D] = OrthonormalPolynomials
@@ -16,14 +16,15 @@ class PolynomialsND(Polynomials):
         self.distributions = distributions
         marginals = distributions.marginals
         N = len(multi_index)  # dimensions
-        self.polynomials1d = [Polynomials.distribution_to_polynomial[type(marginals[n])]
+        self.polynomials1d = [Polynomials.get_polynomials_class(marginals[n])
                               (distributions=marginals[n], degree=int(multi_index[n])) for n in range(N)]
 
-    def evaluate(self, eval_data) ->np.ndarray:
+    def evaluate(self, eval_data, dtype=np.float64) ->np.ndarray:
         """
         Evaluate Nd chaos polynomial on the given data set.
 
         :param eval_data: Points upon which the ND chaos polynomial will be evaluated.
+        :param dtype: Floating point type in which the 1d polynomials are multiplied.
         :return: Evaluations of the ND chaos polynomial.
         """
         try:  # case: 2d array, K x N, N being the number of dimensions
@@ -36,9 +37,9 @@ class PolynomialsND(Polynomials):
         # Store evaluations of 1d polynomials in a KxN matrix. Each column has
         # the evaluations of the n-th 1d polynomial on the n-th data column,
         # i.e. on the values of the n-th parameter
-        eval_matrix = np.empty([K, N])
+        eval_matrix = np.empty([K, N], dtype=dtype)
         for n in range(N):
-            eval_matrix[:, n] = self.polynomials1d[n].evaluate(eval_data[:, n])
+            eval_matrix[:, n] = self.polynomials1d[n].evaluate(eval_data[:, n], dtype=dtype)
 
         # The output of the multivariate polynomial is the product of the
         # outputs of the corresponding 1d polynomials
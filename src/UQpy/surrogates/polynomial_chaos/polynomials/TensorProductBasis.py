@@ -19,7 +19,6 @@ class TensorProductBasis(PolynomialBasis):
             else len(distributions.marginals)
         multi_index_set = PolynomialBasis.calculate_tensor_product_set(inputs_number=inputs_number,
                                                                        degree=max_degree)
-        polynomials = PolynomialBasis.construct_arbitrary_basis(inputs_number, distributions, multi_index_set)
-        super().__init__(inputs_number, len(multi_index_set), multi_index_set, polynomials, distributions)
+        super().__init__(inputs_number, len(multi_index_set), multi_index_set, None, distributions)
 
 
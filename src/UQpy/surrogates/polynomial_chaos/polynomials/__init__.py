@@ -1,5 +1,6 @@
 from UQpy.surrogates.polynomial_chaos.polynomials.Hermite import Hermite
 from UQpy.surrogates.polynomial_chaos.polynomials.Legendre import Legendre
+from UQpy.surrogates.polynomial_chaos.polynomials.OrthonormalPolynomials import OrthonormalPolynomials
 
 from UQpy.surrogates.polynomial_chaos.polynomials.PolynomialsND import PolynomialsND
 
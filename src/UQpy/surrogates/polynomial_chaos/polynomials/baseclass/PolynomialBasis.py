@@ -15,6 +15,10 @@ from scipy.special import comb
 
 class PolynomialBasis(ABC):
 
+    memory_budget = 2 ** 26
+    """Approximate number of bytes of the block of rows of the design matrix assembled at once by
+    :meth:`evaluate_basis`."""
+
     def __init__(self, inputs_number: int,
                  polynomials_number: int,
                  multi_index_set: np.ndarray,
@@ -23,20 +27,112 @@ class PolynomialBasis(ABC):
         """
         Create polynomial basis for a given multi index set.
         """
-        self.polynomials = polynomials
         self.multi_index_set = multi_index_set
+        self.polynomials = polynomials
         self.polynomials_number = polynomials_number
         self.inputs_number = inputs_number
         self.distributions = distributions
 
-    def evaluate_basis(self, samples: np.ndarray):
-        samples_number = len(samples)
-        eval_matrix = np.empty([samples_number, self.polynomials_number])
-        for ii in range(self.polynomials_number):
-            eval_matrix[:, ii] = self.polynomials[ii].evaluate(samples)
+    @property
+    def multi_index_set(self):
+        """
+        Multi-indices of the polynomials of the basis. Setting a new multi-index set discards the chaos polynomials,
+        which are constructed again when they are needed.
+        """
+        return self._multi_index_set
+
+    @multi_index_set.setter
+    def multi_index_set(self, multi_index_set):
+        self._multi_index_set = multi_index_set
+        self._polynomials = None
+        self._provided_polynomials = False
+
+    @property
+    def polynomials(self):
+        """
+        Chaos polynomials of the basis. If they are not provided, they are constructed from the `multi_index_set` and
+        the `distributions` when they are first needed.
+        """
+        if self._polynomials is None:
+            self._polynomials = PolynomialBasis.construct_arbitrary_basis(self.inputs_number, self.distributions,
+                                                                          self.multi_index_set)
+        return self._polynomials
+
+    @polynomials.setter
+    def polynomials(self, polynomials):
+        self._polynomials = polynomials
+        self._provided_polynomials = polynomials is not None
 
+    def evaluate_basis(self, samples: np.ndarray, dtype=np.float64):
+        """
+        Evaluate the polynomials of the basis at the samples.
+
+        If the chaos polynomials are constructed from the `multi_index_set`, i.e. they were not provided to the basis,
+        and the univariate polynomials of all inputs support a three-term recurrence, the samples are processed in
+        blocks of rows that fit in `memory_budget` bytes. For each block, every input column is evaluated once for all
+        degrees up to the maximum degree :math:`p` of the multi-index set, into a table of shape
+        ``(rows, inputs_number, p + 1)``, and each polynomial is gathered from the table as the product of the entries
+        selected by the non-zero entries of its multi-index. This requires :math:`O(ndp + n\\,P\\,m)` operations for
+        :math:`P` polynomials with at most :math:`m` non-zero entries in their multi-indices. Otherwise, the chaos
+        polynomials are evaluated one at a time.
+
+        :param samples: Points at which to evaluate the polynomials.
+        :param dtype: Floating point type of the design matrix.
+         Default: :class:`numpy.float64`
+        :return: Design matrix of shape ``(samples_number, polynomials_number)``.
+        """
+        univariate = None if self._provided_polynomials else self._univariate_polynomials()
+        if univariate is None or not all(polynomial.supports_recurrence() for polynomial in univariate):
+            samples_number = len(samples)
+            eval_matrix = np.empty([samples_number, self.polynomials_number], dtype=dtype)
+            for ii in range(self.polynomials_number):
+                eval_matrix[:, ii] = self.polynomials[ii].evaluate(samples, dtype=dtype)
+            return eval_matrix
+
+        samples = np.asarray(samples).reshape(-1, self.inputs_number)
+        multi_index_set = np.asarray(self.multi_index_set, dtype=int).reshape(-1, self.inputs_number)
+        samples_number, polynomials_number = samples.shape[0], multi_index_set.shape[0]
+        max_degree = max(polynomial.degree for polynomial in univariate)
+        gather = self._gather_indices(multi_index_set, max_degree)
+
+        eval_matrix = np.empty([samples_number, polynomials_number], dtype=dtype)
+        row_bytes = np.dtype(dtype).itemsize * (2 * polynomials_number + self.inputs_number * (max_degree + 1))
+        rows = int(max(1, min(samples_number, self.memory_budget // max(row_bytes, 1))))
+        table = np.empty((rows, self.inputs_number, max_degree + 1), dtype=dtype)
+        for start in range(0, samples_number, rows):
+            block = eval_matrix[start:start + rows]
+            block_table = table[:block.shape[0]]
+            for n, polynomial in enumerate(univariate):
+                block_table[:, n, :] = polynomial.evaluate_table(samples[start:start + rows, n], max_degree,
+                                                                 dtype=dtype)
+            flat_table = block_table.reshape(block.shape[0], -1)
+            np.take(flat_table, gather[:, 0], axis=1, out=block)
+            for k in range(1, gather.shape[1]):
+                block *= np.take(flat_table, gather[:, k], axis=1)
         return eval_matrix
 
+    @staticmethod
+    def _gather_indices(multi_index_set, max_degree):
+        # Columns of the flattened table (input n, degree k) -> n * (max_degree + 1) + k of the non-zero entries of each
+        # multi-index. Rows with fewer non-zero entries are padded with column 0, i.e. the constant polynomial.
+        polynomials_number, inputs_number = multi_index_set.shape
+        nonzero = multi_index_set > 0
+        width = max(int(np.max(np.sum(nonzero, axis=1))) if polynomials_number > 0 else 0, 1)
+        gather = np.zeros((polynomials_number, width), dtype=int)
+        rows, inputs = np.nonzero(nonzero)
+        positions = np.cumsum(nonzero, axis=1)[rows, inputs] - 1
+        gather[rows, positions] = inputs * (max_degree + 1) + multi_index_set[rows, inputs]
+        return gather
+
+    def _univariate_polynomials(self):
+        # Univariate polynomials of each input, of the maximum degree of that input in the multi-index set
+        multi_index_set = np.asarray(self.multi_index_set, dtype=int).reshape(-1, self.inputs_number)
+        marginals = [self.distributions] if self.inputs_number == 1 else self.distributions.marginals
+        max_degrees = np.max(multi_index_set, axis=0) if multi_index_set.shape[0] > 0 else \
+            np.zeros(self.inputs_number, dtype=int)
+        return [Polynomials.get_polynomials_class(marginal)(distributions=marginal, degree=int(degree))
+                for marginal, degree in zip(marginals, max_degrees)]
+
     @staticmethod
     def calculate_total_degree_set(inputs_number: int, degree: int):
         # size of the total degree multiindex set
@@ -165,7 +261,7 @@ class PolynomialBasis(ABC):
         poly_basis = []
         if inputs_number == 1:
             return [
-                Polynomials.distribution_to_polynomial[type(distributions)](
+                Polynomials.get_polynomials_class(distributions)(
                     distributions=distributions, degree=int(idx[0])) for idx in multi_index_set]
         else:
             return [PolynomialsND(distributions, idx) for idx in multi_index_set]
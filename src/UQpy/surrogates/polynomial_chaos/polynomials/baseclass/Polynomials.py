@@ -59,26 +59,39 @@ class Polynomials:
         :return: Design matrix,normalized polynomials
         """
         pol_normed = []
-        m = np.zeros((degree, degree))
         for i in range(degree):
-            for j in range(degree):
-                int_res = integrate.quad(
-                    lambda k: p[i](k) * p[j](k) * pdf_st(k),
-                    a,
-                    b,
-                    epsabs=1e-15,
-                    epsrel=1e-15,
-                )
-                m[i, j] = int_res[0]
-            pol_normed.append(p[i] / np.sqrt(m[i, i]))
-
+            int_res = integrate.quad(
+                lambda k: p[i](k) ** 2 * pdf_st(k),
+                a,
+                b,
+                epsabs=1e-15,
+                epsrel=1e-15,
+            )
+            pol_normed.append(p[i] / np.sqrt(int_res[0]))
+
+        samples = np.asarray(samples, dtype=float).flatten()
         a = np.zeros((samples.shape[0], degree))
-        for i in range(samples.shape[0]):
-            for j in range(degree):
-                a[i, j] = pol_normed[j](samples[i])
+        for j in range(degree):
+            a[:, j] = pol_normed[j](samples)
 
         return a, pol_normed
 
+    @staticmethod
+    def get_polynomials_class(distribution: Distribution):
+        """
+        Returns the class of the univariate polynomials orthonormal with respect to a distribution, i.e. the class
+        registered in :py:attr:`distribution_to_polynomial` for the closest parent class of the distribution. The
+        :class:`.OrthonormalPolynomials` class is registered for all continuous distributions without a classical family
+        of polynomials.
+
+        :param distribution: Object from a distribution class.
+        """
+        for distribution_class in type(distribution).__mro__:
+            if distribution_class in Polynomials.distribution_to_polynomial:
+                return Polynomials.distribution_to_polynomial[distribution_class]
+        raise ValueError("UQpy: No orthonormal polynomials are available for the distribution {0}."
+                         .format(type(distribution).__name__))
+
     def get_mean(self):
         """
         Returns a :any:`float` with the mean of the :py:mod:`UQpy` distribution object.
@@ -108,7 +121,89 @@ class Polynomials:
         return s
 
     @abstractmethod
-    def evaluate(self, x: np.ndarray):
+    def evaluate(self, x: np.ndarray, dtype=np.float64):
         pass
 
-    distribution_to_polynomial = { }
\ No newline at end of file
+    def supports_recurrence(self):
+        """
+        Returns :any:`True` if the polynomials implement :meth:`standardize` and :meth:`recurrence_coefficients`, which
+        enables the evaluation of all degrees at once with :meth:`evaluate_table`.
+        """
+        return False
+
+    def standardize(self, x: np.ndarray):
+        """
+        Map samples of the distribution to the standardized variable in which the recurrence is defined.
+
+        :param x: :class:`numpy.ndarray` containing the samples.
+        """
+        raise NotImplementedError("UQpy: A three-term recurrence is not available for these polynomials.")
+
+    def recurrence_coefficients(self, n: int):
+        """
+        Coefficients :math:`a_k, b_k` of the three-term recurrence
+        :math:`\\pi_{k+1}(x) = (x-a_k)\\pi_k(x) - b_k\\pi_{k-1}(x)` of the monic orthogonal polynomials of the
+        standardized variable, for :math:`k=0,\\dots,n-1`. The coefficient :math:`b_0` is the total mass of the
+        probability measure, i.e. 1.
+
+        :param n: Number of coefficients.
+        :return: The arrays of coefficients :math:`a` and :math:`b`.
+        """
+        raise NotImplementedError("UQpy: A three-term recurrence is not available for these polynomials.")
+
+    def evaluate_table(self, x: np.ndarray, max_degree: int, dtype=np.float64):
+        """
+        Evaluate the orthonormal polynomials of all degrees :math:`0,\\dots,` `max_degree` at the samples with the
+        three-term recurrence :math:`\\sqrt{b_{k+1}}\\psi_{k+1} = (x-a_k)\\psi_k - \\sqrt{b_k}\\psi_{k-1}`, which costs
+        :math:`O(n p)` operations instead of evaluating each degree separately.
+
+        :param x: :class:`numpy.ndarray` containing the samples.
+        :param max_degree: Maximum degree of the polynomials.
+        :param dtype: Floating point type of the table. The recurrence is evaluated in double precision.
+        :return: :class:`numpy.ndarray` of shape ``(len(x), max_degree + 1)``.
+        """
+        x_ = self.standardize(np.asarray(x, dtype=float).flatten())
+        a, b = self.recurrence_coefficients(max_degree + 1)
+        return Polynomials._recurrence_table(x_, a, b, max_degree).astype(dtype, copy=False)
+
+    @staticmethod
+    def _recurrence_table(x_, a, b, max_degree):
+        # Orthonormal polynomials of degrees 0, ..., max_degree at the standardized points x_
+        sqrt_b = np.sqrt(b)
+        table = np.empty((x_.shape[0], max_degree + 1))
+        table[:, 0] = 1
+        if max_degree > 0:
+            table[:, 1] = (x_ - a[0]) / sqrt_b[1]
+        for k in range(1, max_degree):
+            table[:, k + 1] = ((x_ - a[k]) * table[:, k] - sqrt_b[k] * table[:, k - 1]) / sqrt_b[k + 1]
+        return table
+
+    def triple_product_table(self, max_degree: int):
+        """
+        Expectations :math:`\\mathbb{E}[\\psi_i \\psi_j \\psi_k]` of the products of three orthonormal polynomials, for
+        :math:`i, j \\leq` `max_degree` and :math:`k \\leq 2` `max_degree`. These are also the coefficients of the
+        linearization :math:`\\psi_i \\psi_j = \\sum_k \\mathbb{E}[\\psi_i \\psi_j \\psi_k] \\psi_k`.
+
+        The expectations are computed exactly with the Gauss quadrature of :math:`2p+1` nodes obtained from the
+        recurrence coefficients, and the tables are cached for each recurrence and degree.
+
+        :param max_degree: Maximum degree :math:`p` of the first two polynomials.
+        :return: :class:`numpy.ndarray` of shape ``(max_degree + 1, max_degree + 1, 2 * max_degree + 1)``.
+        """
+        nodes_number = 2 * max_degree + 1
+        a, b = self.recurrence_coefficients(nodes_number)
+        key = (a.tobytes(), b.tobytes())
+        if key not in Polynomials._triple_product_tables:
+            # Golub-Welsch: the nodes are the eigenvalues of the Jacobi matrix and the weights are obtained from the
+            # first components of its eigenvectors
+            off_diagonal = np.sqrt(b[1:])
+            nodes, vectors = np.linalg.eigh(np.diag(a) + np.diag(off_diagonal, 1) + np.diag(off_diagonal, -1))
+            weights = b[0] * vectors[0] ** 2
+            table = Polynomials._recurrence_table(nodes, a, b, 2 * max_degree)
+            first = table[:, :max_degree + 1]
+            Polynomials._triple_product_tables[key] = np.einsum("n,ni,nj,nk->ijk", weights, first, first, table)
+        return Polynomials._triple_product_tables[key]
+
+    distribution_to_polynomial = { }
+
+    _triple_product_tables = {}
\ No newline at end of file
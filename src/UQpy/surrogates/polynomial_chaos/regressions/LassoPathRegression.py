@@ -0,0 +1,171 @@
+import logging
+from typing import Union
+
+import numpy as np
+from beartype import beartype
+
+from UQpy.surrogates.polynomial_chaos.regressions.baseclass.Regression import Regression
+
+
+class LassoPathRegression(Regression):
+    @beartype
+    def __init__(self, penalties: Union[None, list, np.ndarray] = None, penalties_number: int = 50,
+                 penalty_ratio: float = 1e-3, criterion: Union[str, int] = "loo", tolerance: float = 1e-6,
+                 iterations: int = 1000):
+        """
+        Class to calculate the polynomial_chaos coefficients with the Least Absolute Shrinkage and Selection Operator
+        (LASSO) method, solved by cyclic coordinate descent along a path of decreasing penalties. The penalty of each
+        output is selected by a leave-one-out or k-fold cross-validation criterion.
+
+        :param penalties: Penalties :math:`\\lambda` of the regularization path. Default: :any:`None`, i.e. a
+         logarithmically spaced path from the smallest penalty for which all coefficients vanish is used.
+        :param penalties_number: Number of penalties of the default regularization path.
+        :param penalty_ratio: Ratio of the smallest to the largest penalty of the default regularization path.
+        :param criterion: Criterion used to select the penalty. If "loo", the leave-one-out error is computed from the
+         hat matrix of the active polynomials. If an integer :math:`k`, the :math:`k`-fold cross-validation error is
+         used, where the folds are formed by every :math:`k`-th training point.
+        :param tolerance: Convergence tolerance of the coordinate descent, relative to the standard deviation of the
+         model evaluations.
+        :param iterations: Maximum number of sweeps of the coordinate descent for each penalty.
+        """
+        if isinstance(criterion, str) and criterion != "loo":
+            raise ValueError("UQpy: The criterion must be 'loo' or the number of folds.")
+        if not isinstance(criterion, str) and criterion < 2:
+            raise ValueError("UQpy: At least two folds are required for cross-validation.")
+        self.penalties_input = penalties
+        self.penalties_number = penalties_number
+        self.penalty_ratio = penalty_ratio
+        self.criterion = criterion
+        self.tolerance = tolerance
+        self.iterations = iterations
+        self.logger = logging.getLogger(__name__)
+
+        self.penalties: np.ndarray = None
+        """Penalties of the regularization path, of shape ``(penalties_number, outputs_number)``."""
+        self.errors: np.ndarray = None
+        """Values of the selection criterion along the regularization path."""
+        self.penalty: np.ndarray = None
+        """Selected penalty of each output."""
+
+    def run(self, x: np.ndarray, y: np.ndarray, design_matrix: np.ndarray):
+        """
+        Implements the LASSO method with coordinate descent to compute the polynomial_chaos coefficients.
+
+        The coefficients minimize :math:`\\frac{1}{2N} \\| y - X \\beta - b \\|_{2}^{2} + \\lambda \\| \\beta \\|_{1}`
+        for each output, where the bias :math:`b` is not penalized. The path is computed from the Gram matrix of the
+        centered design matrix, with warm starts, strong-rule screening of the polynomials and cycles restricted to the
+        active polynomials.
+
+        :param x: :class:`numpy.ndarray` containing the training points (samples).
+        :param y: :class:`numpy.ndarray` containing the model evaluations (labels) at the training points.
+        :param design_matrix: matrix containing the evaluation of the polynomials at the input points **x**.
+        :return: Weights (polynomial_chaos coefficients)  and Bias of the regressor
+        """
+        m = design_matrix.shape[0]
+        y = np.asarray(y, dtype=float).reshape(m, -1)
+        outputs_number = y.shape[1]
+        x_mean, y_mean = np.mean(design_matrix, axis=0), np.mean(y, axis=0)
+        centered_matrix, centered_y = design_matrix - x_mean, y - y_mean
+        gram = centered_matrix.T @ centered_matrix / m
+        moments = centered_matrix.T @ centered_y / m
+
+        if self.penalties_input is None:
+            largest = np.maximum(np.max(np.abs(moments), axis=0), np.finfo(float).tiny)
+            self.penalties = largest * np.logspace(0, np.log10(self.penalty_ratio), self.penalties_number)[:, None]
+        else:
+            penalties = np.sort(np.asarray(self.penalties_input, dtype=float))[::-1]
+            self.penalties = np.tile(penalties[:, None], (1, outputs_number))
+
+        scale = np.sqrt(np.mean(centered_y ** 2, axis=0))
+        path = self._solve_path(gram, moments, scale)
+        if self.criterion == "loo":
+            self.errors = self._leaveoneout_errors(centered_matrix, centered_y, gram, path)
+        else:
+            self.errors = self._crossvalidation_errors(design_matrix, y, scale)
+
+        best = np.argmin(self.errors, axis=0)
+        self.penalty = self.penalties[best, np.arange(outputs_number)]
+        w = path[best, :, np.arange(outputs_number)].T
+        b = (y_mean - x_mean @ w).reshape(1, -1)
+        self.logger.info("UQpy: Selected LASSO penalties %s", self.penalty)
+        return w, b, outputs_number
+
+    def _solve_path(self, gram, moments, scale):
+        polynomials_number, outputs_number = moments.shape
+        diagonal = np.diag(gram).copy()
+        # Constant polynomials vanish after centering and are represented by the bias
+        valid = diagonal > 1e-12 * max(np.max(diagonal), np.finfo(float).tiny)
+        tolerance = self.tolerance * np.maximum(scale, np.finfo(float).tiny)
+
+        w = np.zeros((polynomials_number, outputs_number))
+        gradient = moments.copy()
+        path = np.zeros((len(self.penalties), polynomials_number, outputs_number))
+        previous = self.penalties[0]
+        for k, penalty in enumerate(self.penalties):
+            # Sequential strong rule: polynomials that are likely to remain inactive are discarded, and the
+            # Karush-Kuhn-Tucker conditions are checked once the coordinate descent has converged
+            strong = valid & (np.any(np.abs(gradient) >= 2 * penalty - previous, axis=1) | np.any(w != 0, axis=1))
+            while True:
+                self._coordinate_descent(gram, diagonal, gradient, w, penalty, np.flatnonzero(strong), tolerance)
+                violations = valid & ~strong & np.any(np.abs(gradient) > penalty, axis=1)
+                if not np.any(violations):
+                    break
+                strong |= violations
+            path[k] = w
+            previous = penalty
+        return path
+
+    def _coordinate_descent(self, gram, diagonal, gradient, w, penalty, indices, tolerance):
+        # Sweeps over all candidate polynomials alternate with sweeps restricted to the active polynomials
+        for _ in range(self.iterations):
+            if self._sweep(gram, diagonal, gradient, w, penalty, indices, tolerance):
+                return
+            active = indices[np.any(w[indices] != 0, axis=1)]
+            for _ in range(self.iterations):
+                if self._sweep(gram, diagonal, gradient, w, penalty, active, tolerance):
+                    break
+        self.logger.warning("UQpy: The coordinate descent did not converge for the penalty %s.", penalty)
+
+    @staticmethod
+    def _sweep(gram, diagonal, gradient, w, penalty, indices, tolerance):
+        converged = True
+        for j in indices:
+            z = gradient[j] + diagonal[j] * w[j]
+            updated = np.sign(z) * np.maximum(np.abs(z) - penalty, 0) / diagonal[j]
+            delta = updated - w[j]
+            if delta.any():
+                gradient -= gram[:, j, None] * delta
+                w[j] = updated
+                if converged and (np.abs(delta) * np.sqrt(diagonal[j]) > tolerance).any():
+                    converged = False
+        return converged
+
+    def _leaveoneout_errors(self, centered_matrix, centered_y, gram, path):
+        m = centered_matrix.shape[0]
+        errors = np.full(path.shape[::2], np.inf)
+        for k in range(path.shape[0]):
+            for output in range(path.shape[2]):
+                active = np.flatnonzero(path[k, :, output])
+                if len(active) >= m - 1:
+                    continue
+                active_matrix = centered_matrix[:, active]
+                h_diag = 1 / m + np.sum((active_matrix @ np.linalg.pinv(m * gram[np.ix_(active, active)]))
+                                        * active_matrix, axis=1)
+                residuals = centered_y[:, output] - active_matrix @ path[k, active, output]
+                errors[k, output] = np.mean((residuals / (1 - h_diag)) ** 2)
+        return errors
+
+    def _crossvalidation_errors(self, design_matrix, y, scale):
+        m = design_matrix.shape[0]
+        folds = np.arange(m) % self.criterion
+        errors = np.zeros(self.penalties.shape)
+        for fold in range(self.criterion):
+            train, test = folds != fold, folds == fold
+            x_mean, y_mean = np.mean(design_matrix[train], axis=0), np.mean(y[train], axis=0)
+            centered_matrix = design_matrix[train] - x_mean
+            gram = centered_matrix.T @ centered_matrix / np.sum(train)
+            moments = centered_matrix.T @ (y[train] - y_mean) / np.sum(train)
+            path = self._solve_path(gram, moments, scale)
+            predictions = y_mean + np.einsum("np,kpq->knq", design_matrix[test] - x_mean, path)
+            errors += np.sum((y[test] - predictions) ** 2, axis=1)
+        return errors / m
@@ -41,17 +41,12 @@ class LassoRegression(Regression):
         if y.ndim == 1 or y.shape[1] == 1:
             y = y.reshape(-1, 1)
             w = np.zeros(n).reshape(-1, 1)
-            dw = np.zeros(n).reshape(-1, 1)
             b = 0
 
             for _ in range(self.iterations):
                 y_pred = design_matrix.dot(w) + b
 
-                for i in range(n):
-                    if w[i] > 0:
-                        dw[i] = (-(2 * (design_matrix.T[i, :]).dot(y - y_pred)) + self.penalty) / m
-                    else:
-                        dw[i] = (-(2 * (design_matrix.T[i, :]).dot(y - y_pred)) - self.penalty) / m
+                dw = (-(2 * design_matrix.T.dot(y - y_pred)) + self.penalty * np.where(w > 0, 1, -1)) / m
 
                 db = -2 * np.sum(y - y_pred) / m
 
@@ -65,6 +65,10 @@ class LeastAngleRegression(Regression):
         measured by Cross validation: Leave-one-out error (1 is perfect approximation). Option to check overfitting by 
         empirical rule: if three steps in a row have a decreasing accuracy, stop the algorithm.
 
+        The ordinary least squares solutions of the LARS steps are not refitted: the columns of the design matrix that
+        enter the model are appended to a QR factorization, from which the residuals and the diagonal of the hat matrix
+        required by the leave-one-out error are updated.
+
         :param PolynomialChaosExpansion: existing target PCE for model_selection
         :param target_error: Target error of an approximation (stoping criterion).
         :param check_overfitting: Whether to check over-fitting by empirical rule.
@@ -75,20 +79,34 @@ class LeastAngleRegression(Regression):
         x = pce.experimental_design_input
         y = pce.experimental_design_output
 
-        pce.regression_method = LeastAngleRegression()
-        pce.fit(x, y)
-
-        LarsBeta = pce.regression_method.Beta_path
-        P, steps = LarsBeta.shape
-
         polynomialbasis = pce.design_matrix
         multindex = pce.multi_index_set
 
+        lars = LeastAngleRegression()
+        lars.run(x, y, polynomialbasis)
+
         pce.regression_method = LeastSquareRegression()
+        BestLarsMask, BestLarsError = LeastAngleRegression._hybrid_selection(polynomialbasis, y, lars.Beta_path,
+                                                                             target_error, check_overfitting)
 
-        larsbasis = []
-        OLSBetaList = []
-        larsindex = []
+        BestLarsMultindex = multindex[BestLarsMask, :]
+        pce.polynomial_basis.polynomials_number = len(BestLarsMultindex)
+        pce.polynomial_basis.multi_index_set = BestLarsMultindex
+        pce.multi_index_set = BestLarsMultindex
+
+        pce.design_matrix = polynomialbasis[:, BestLarsMask]
+        pce.coefficients, pce.bias, pce.outputs_number = pce.regression_method.run(x, y, pce.design_matrix)
+
+        return pce
+
+    @staticmethod
+    def _hybrid_selection(polynomialbasis, y, LarsBeta, target_error=1, check_overfitting=True):
+        # Ordinary least squares fits of the LARS steps, returns the mask of the best step and its accuracy measured by
+        # one minus the leave-one-out error
+        P, steps = LarsBeta.shape
+
+        larsmask = []
+        hybrid = _HybridLeastSquares(polynomialbasis, y)
 
         LarsError = []
         error = 0
@@ -104,29 +122,20 @@ class LeastAngleRegression(Regression):
             mask = LarsBeta[:, step + 2] != 0
             mask[0] = True
 
-            larsindex.append(multindex[mask, :])
-            larsbasis.append(list(np.array(pce_object.polynomial_basis.polynomials)[mask]))
-
-            pce.polynomial_basis.polynomials_number = len(larsbasis[step])
-            pce.polynomial_basis.polynomials = larsbasis[step]
-            pce.multi_index_set = larsindex[step]
-
-            pce.fit(x, y)
-            coefficients = pce.coefficients
+            larsmask.append(mask)
+            hybrid.update(mask)
 
-            LarsError.append(float(1 - pce.leaveoneout_error()))
+            LarsError.append(float(1 - hybrid.leaveoneout_error()))
 
             error = LarsError[step]
 
             if step == 0:
-                BestLarsMultindex = larsindex[step]
-                BestLarsBasis = larsbasis[step]
+                BestLarsMask = larsmask[step]
                 BestLarsError = LarsError[step]
 
             else:
                 if error > BestLarsError:
-                    BestLarsMultindex = larsindex[step]
-                    BestLarsBasis = larsbasis[step]
+                    BestLarsMask = larsmask[step]
                     BestLarsError = LarsError[step]
 
             if (step > 3) and (check_overfitting == True):
@@ -136,10 +145,55 @@ class LeastAngleRegression(Regression):
 
             step += 1
 
-        pce.polynomial_basis.polynomials_number = len(BestLarsBasis)
-        pce.polynomial_basis.polynomials = BestLarsBasis
-        pce.multi_index_set = BestLarsMultindex
-
-        pce.fit(x, y)
-
-        return pce
+        return BestLarsMask, BestLarsError
+
+
+class _HybridLeastSquares:
+    """
+    Ordinary least squares fits on growing subsets of the columns of a design matrix, using a QR factorization that is
+    updated by Gram-Schmidt orthogonalization as columns enter the model.
+    """
+
+    def __init__(self, design_matrix, y):
+        self.design_matrix = design_matrix
+        self.y = np.array(y, dtype=float).reshape(design_matrix.shape[0], -1)
+        self._reset()
+
+    def _reset(self):
+        self.mask = np.zeros(self.design_matrix.shape[1], dtype=bool)
+        self.q = np.zeros((self.design_matrix.shape[0], 0))
+        self.residuals = self.y.copy()
+        self.h_diag = np.zeros((self.design_matrix.shape[0], 1))
+
+    def update(self, mask):
+        if np.any(self.mask & ~mask):
+            # A column has left the model, the factorization is restarted
+            self._reset()
+        for column in np.flatnonzero(mask & ~self.mask):
+            self._insert(self.design_matrix[:, column])
+        self.mask = mask.copy()
+
+    def _insert(self, column):
+        norm = np.linalg.norm(column)
+        q = column.copy()
+        # Classical Gram-Schmidt with reorthogonalization
+        for _ in range(2):
+            q -= self.q @ (self.q.T @ q)
+        q_norm = np.linalg.norm(q)
+        if q_norm <= 1e-10 * norm:
+            # The column lies in the span of the model, which leaves the projection unchanged
+            return
+        q /= q_norm
+        self.q = np.column_stack([self.q, q])
+        self.residuals -= np.outer(q, q @ self.residuals)
+        self.h_diag += q.reshape(-1, 1) ** 2
+
+    def leaveoneout_error(self):
+        # Same estimator as PolynomialChaosExpansion.leaveoneout_error
+        n_samples = self.y.shape[0]
+        mu_yval = (1 / n_samples) * np.sum(self.y, axis=0)
+        eps_val = ((n_samples - 1) / n_samples * np.sum((self.residuals / (1 - self.h_diag)) ** 2, axis=0)) / (
+            np.sum((self.y - mu_yval) ** 2, axis=0))
+        if self.y.shape[1] == 1:
+            eps_val = float(eps_val)
+        return np.round(eps_val, 7)
@@ -1,4 +1,5 @@
 import numpy as np
+import scipy.linalg
 
 from UQpy.surrogates.polynomial_chaos.polynomials import PolynomialBasis
 from UQpy.surrogates.polynomial_chaos.regressions.baseclass.Regression import Regression
@@ -20,3 +21,33 @@ class LeastSquareRegression(Regression):
             c_ = c_.reshape(-1, 1)
 
         return c_, None, np.shape(c_)[1]
+
+    def supports_normal_equations(self):
+        return True
+
+    def solve_normal_equations(self, gram: np.ndarray, moments: np.ndarray, column_sums: np.ndarray = None,
+                               output_sums: np.ndarray = None, samples_number: int = None):
+        """
+        Least squares solution computed from the normal equations :math:`\\Psi^T \\Psi c = \\Psi^T Y`. If the Gram
+        matrix is singular, the minimum norm solution is returned. As in :meth:`run`, no bias is fitted, such that
+        `column_sums`, `output_sums` and `samples_number` are not used.
+
+        :param gram: :class:`numpy.ndarray` containing the Gram matrix :math:`\\Psi^T \\Psi` of the design matrix.
+        :param moments: :class:`numpy.ndarray` containing the product :math:`\\Psi^T Y`.
+        :param column_sums: :class:`numpy.ndarray` containing the sums :math:`\\Psi^T 1` of the columns of the design
+         matrix.
+        :param output_sums: :class:`numpy.ndarray` containing the sums :math:`1^T Y` of the model evaluations.
+        :param samples_number: Number of training points.
+        :return: Returns the polynomial_chaos coefficients.
+        """
+        return _solve_symmetric(gram, moments)
+
+
+def _solve_symmetric(gram, moments):
+    try:
+        c_ = scipy.linalg.cho_solve(scipy.linalg.cho_factor(gram), moments)
+    except np.linalg.LinAlgError:
+        c_ = np.linalg.lstsq(gram, moments, rcond=None)[0]
+    if c_.ndim == 1:
+        c_ = c_.reshape(-1, 1)
+    return c_, None, np.shape(c_)[1]
@@ -3,6 +3,7 @@ import numpy as np
 
 from UQpy.surrogates.polynomial_chaos.polynomials import PolynomialBasis
 from UQpy.surrogates.polynomial_chaos.regressions.baseclass.Regression import Regression
+from UQpy.surrogates.polynomial_chaos.regressions.LeastSquareRegression import _solve_symmetric
 
 
 class RidgeRegression(Regression):
@@ -65,3 +66,38 @@ class RidgeRegression(Regression):
                 b = b - self.learning_rate * db
 
         return w, b, np.shape(w)[1]
+
+    def supports_normal_equations(self):
+        return True
+
+    def solve_normal_equations(self, gram: np.ndarray, moments: np.ndarray, column_sums: np.ndarray,
+                               output_sums: np.ndarray, samples_number: int):
+        """
+        Closed-form minimizer of the objective of :meth:`run`, :math:`\\|Y - \\Psi c - b\\|^2 + \\lambda \\|c\\|^2`,
+        where the bias :math:`b` is not penalized. It is the solution of the normal equations
+
+        .. math:: \\begin{bmatrix} \\Psi^T \\Psi + \\lambda I & \\Psi^T 1 \\\\ 1^T \\Psi & n \\end{bmatrix}
+                  \\begin{bmatrix} c \\\\ b \\end{bmatrix} = \\begin{bmatrix} \\Psi^T Y \\\\ 1^T Y \\end{bmatrix}
+
+        If the basis contains the constant polynomial, its coefficient vanishes and the mean is carried by the bias,
+        such that the constant is not penalized.
+
+        :param gram: :class:`numpy.ndarray` containing the Gram matrix :math:`\\Psi^T \\Psi` of the design matrix.
+        :param moments: :class:`numpy.ndarray` containing the product :math:`\\Psi^T Y`.
+        :param column_sums: :class:`numpy.ndarray` containing the sums :math:`\\Psi^T 1` of the columns of the design
+         matrix.
+        :param output_sums: :class:`numpy.ndarray` containing the sums :math:`1^T Y` of the model evaluations.
+        :param samples_number: Number of training points :math:`n`.
+        :return: Weights (polynomial_chaos coefficients)  and Bias of the regressor
+        """
+        n = gram.shape[0]
+        system = np.zeros((n + 1, n + 1))
+        system[:n, :n] = gram + self.penalty * np.eye(n)
+        system[:n, n] = system[n, :n] = np.reshape(column_sums, -1)
+        system[n, n] = samples_number
+        c_, _, outputs_number = _solve_symmetric(system, np.vstack([np.reshape(moments, (n, -1)),
+                                                                    np.reshape(output_sums, (1, -1))]))
+        w, b = c_[:n], c_[n:]
+        if outputs_number == 1:
+            b = b[0, 0]
+        return w, b, outputs_number
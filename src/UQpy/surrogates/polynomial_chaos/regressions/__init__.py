@@ -2,3 +2,4 @@ from UQpy.surrogates.polynomial_chaos.regressions.LassoRegression import LassoRe
 from UQpy.surrogates.polynomial_chaos.regressions.LeastSquareRegression import LeastSquareRegression
 from UQpy.surrogates.polynomial_chaos.regressions.RidgeRegression import RidgeRegression
 from UQpy.surrogates.polynomial_chaos.regressions.LeastAngleRegression import LeastAngleRegression
+from UQpy.surrogates.polynomial_chaos.regressions.LassoPathRegression import LassoPathRegression
@@ -8,3 +8,25 @@ class Regression(ABC):
     @abstractmethod
     def run(self, x, y, polynomial_basis):
         pass
+
+    def supports_normal_equations(self):
+        """
+        Returns :any:`True` if the coefficients can be computed with :meth:`solve_normal_equations` from the
+        accumulated products :math:`\\Psi^T \\Psi` and :math:`\\Psi^T Y`, which enables
+        :meth:`.PolynomialChaosExpansion.fit_streaming`.
+        """
+        return False
+
+    def solve_normal_equations(self, gram, moments, column_sums, output_sums, samples_number):
+        """
+        Compute the polynomial_chaos coefficients from the normal equations of the regression.
+
+        :param gram: :class:`numpy.ndarray` containing the Gram matrix :math:`\\Psi^T \\Psi` of the design matrix.
+        :param moments: :class:`numpy.ndarray` containing the product :math:`\\Psi^T Y`.
+        :param column_sums: :class:`numpy.ndarray` containing the sums :math:`\\Psi^T 1` of the columns of the design
+         matrix, required by regressions fitting a bias.
+        :param output_sums: :class:`numpy.ndarray` containing the sums :math:`1^T Y` of the model evaluations.
+        :param samples_number: Number of training points.
+        :return: Returns the polynomial_chaos coefficients, the bias and the number of outputs.
+        """
+        raise TypeError("UQpy: {0} does not support the normal equations.".format(type(self).__name__))
@@ -355,6 +355,27 @@ def process_random_state(random_state: RandomStateType):
         return random_state
 
 
+def fit_or_update(surrogate, samples, values):
+    """
+    Train a surrogate model. If the surrogate provides an :py:meth:`update` method and its current training points
+    are the leading rows of `samples`, only the additional points are passed to :py:meth:`update`. Otherwise, the
+    surrogate is fitted from scratch.
+
+    :param surrogate: Surrogate model with a :py:meth:`fit` method.
+    :param numpy.ndarray samples: Training points.
+    :param numpy.ndarray values: Model evaluations at the training points.
+    """
+    samples = np.atleast_2d(samples)
+    values = np.array(values).reshape(samples.shape[0], -1)
+    old_samples = getattr(surrogate, "samples", None) if hasattr(surrogate, "update") else None
+    if old_samples is not None and old_samples.shape[0] <= samples.shape[0] \
+            and np.array_equal(old_samples, samples[:old_samples.shape[0]]) \
+            and np.array_equal(surrogate.values, values[:old_samples.shape[0]]):
+        surrogate.update(samples[old_samples.shape[0]:], values[old_samples.shape[0]:])
+    else:
+        surrogate.fit(samples, values)
+
+
 def calculate_gradient(krig_object, step_size, x, y, xt):
     """
     Estimating gradients with a Kriging metamodel (surrogate).
@@ -369,7 +390,7 @@ def calculate_gradient(krig_object, step_size, x, y, xt):
     """
 
     if krig_object is not None:
-        krig_object.fit(x, y)
+        fit_or_update(krig_object, x, y)
         krig_object.nopt = 1
         tck = krig_object.predict
     else:
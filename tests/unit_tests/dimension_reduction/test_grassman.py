@@ -79,3 +79,20 @@ def test_parsimonious():
 
     assert dmaps_object.parsimonious_indices[0] == 1
     assert dmaps_object.parsimonious_indices[1] == 5
+
+
+def test_surrogate_interpolation():
+    from UQpy.surrogates.gaussian_process import GaussianProcessRegression, RBF
+    nodes = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    manifold_projection = SVDProjection([sol0, sol1, sol2, sol3], p=2)
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1., 1., 1.])
+    interpolation = GrassmannInterpolation(interpolation_method=gpr,
+                                           manifold_data=manifold_projection.v,
+                                           coordinates=nodes,
+                                           distance=GeodesicDistance())
+    assert interpolation.surrogate.values.shape == (4, 12)
+
+    interpolated_solution = interpolation.interpolate_manifold(point=nodes[1])
+    projection = interpolated_solution.data @ interpolated_solution.data.T
+    expected = manifold_projection.v[1].data @ manifold_projection.v[1].data.T
+    assert np.allclose(projection, expected, atol=1e-6)
@@ -0,0 +1,51 @@
+import os
+
+import numpy as np
+import pytest
+
+from UQpy.run_model.RunModel import RunModel
+from UQpy.run_model.model_execution.PythonModel import PythonModel
+from UQpy.distributions import Normal
+from UQpy.reliability import FORM, LineSampling, DirectionalSimulation
+
+
+@pytest.fixture
+def setup():
+    path = os.path.abspath(os.path.dirname(__file__))
+    os.chdir(path)
+    model = PythonModel(model_script='pfn1.py', model_object_name='model_i', delete_files=True)
+    h_func = RunModel(model=model)
+    yield h_func
+
+
+def test_line_sampling_gradient_direction(setup):
+    dist = [Normal(loc=200, scale=20), Normal(loc=150, scale=10)]
+    line_sampling = LineSampling(distributions=dist, runmodel_object=setup, nsamples=20, random_state=1)
+    # The limit state is linear, hence every line returns the exact probability of failure.
+    np.testing.assert_allclose(line_sampling.failure_probability, 0.0126, rtol=1e-02)
+    np.testing.assert_allclose(line_sampling.important_direction, [-0.894427, 0.447214], rtol=1e-03)
+
+
+def test_line_sampling_form_direction(setup):
+    dist = [Normal(loc=200, scale=20), Normal(loc=150, scale=10)]
+    form_obj = FORM(distributions=dist, runmodel_object=setup, seed_u=[1, 1])
+    line_sampling = LineSampling(distributions=dist, runmodel_object=setup, important_direction=form_obj,
+                                 random_state=1)
+    line_sampling.run(nsamples=10)
+    line_sampling.run(nsamples=10)
+    assert line_sampling.roots.shape == (20, )
+    np.testing.assert_allclose(line_sampling.roots, 2.236, rtol=1e-03)
+    np.testing.assert_allclose(line_sampling.failure_probability, 0.0126, rtol=1e-02)
+
+
+def test_line_sampling_wrong_direction(setup):
+    dist = [Normal(loc=200, scale=20), Normal(loc=150, scale=10)]
+    with pytest.raises(ValueError):
+        LineSampling(distributions=dist, runmodel_object=setup, important_direction=[1.0, 0.0, 0.0])
+
+
+def test_directional_simulation(setup):
+    dist = [Normal(loc=200, scale=20), Normal(loc=150, scale=10)]
+    directional = DirectionalSimulation(distributions=dist, runmodel_object=setup, nsamples=2000, random_state=1)
+    np.testing.assert_allclose(directional.failure_probability, 0.0126, rtol=1e-01)
+    assert directional.n_model_calls <= 21
@@ -0,0 +1,9 @@
+import numpy as np
+
+
+def forrester_high(samples):
+    return (6 * samples[:, 0] - 2) ** 2 * np.sin(12 * samples[:, 0] - 4)
+
+
+def forrester_low(samples):
+    return 0.5 * forrester_high(samples) + 10 * (samples[:, 0] - 0.5) - 5
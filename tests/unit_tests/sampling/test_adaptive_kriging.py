@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from UQpy import GaussianProcessRegression, RBF, LinearRegression
@@ -164,3 +165,288 @@ def test_akmcs_u_run_from_init():
 
     assert a.samples[23, 0] == -3.781937137406927
     assert a.samples[20, 1] == 0.17610325620498946
+
+
+def test_akmcs_u_fixed_population():
+    marginals = [Normal(loc=0., scale=4.), Normal(loc=0., scale=4.)]
+    x = MonteCarloSampling(distributions=marginals, nsamples=20, random_state=1)
+    model = PythonModel(model_script='series.py', model_object_name="series")
+    rmodel = RunModel(model=model)
+    kernel1 = RBF()
+    bounds_1 = [[10 ** (-4), 10 ** 3], [10 ** (-3), 10 ** 2], [10 ** (-3), 10 ** 2]]
+    optimizer1 = MinimizeOptimizer(method='L-BFGS-B', bounds=bounds_1)
+    gpr = GaussianProcessRegression(kernel=kernel1, hyperparameters=[1, 10 ** (-3), 10 ** (-2)], optimizer=optimizer1,
+                                    optimizations_number=10, noise=False, regression_model=LinearRegression(),
+                                    random_state=0)
+    learning_function = UFunction(u_stop=2)
+    a = AdaptiveKriging(distributions=marginals, runmodel_object=rmodel, surrogate=gpr,
+                        learning_nsamples=10 ** 3, n_add=1, learning_function=learning_function,
+                        random_state=2, fixed_population=True)
+    a.run(nsamples=30, samples=x.samples)
+
+    assert a.learning_set.shape == (10 ** 3, 2)
+    assert len(a.training_indices) == a.samples.shape[0] - 20
+    np.testing.assert_array_equal(a.samples[20:], a.learning_set[a.training_indices])
+    assert np.sum(a._candidates) == 10 ** 3 - len(a.training_indices)
+    # Cached predictions on the remaining candidates agree with the surrogate.
+    mean, std = gpr.predict(a.learning_set[a._candidates], True)
+    np.testing.assert_allclose(a._mean[a._candidates], mean.reshape(-1), atol=1e-6)
+
+
+def test_akmcs_fixed_population_partial_update():
+    marginals = [Normal(loc=0., scale=4.), Normal(loc=0., scale=4.)]
+    x = MonteCarloSampling(distributions=marginals, nsamples=20, random_state=1)
+    model = PythonModel(model_script='series.py', model_object_name="series")
+    rmodel = RunModel(model=model)
+    bounds_1 = [[10 ** (-4), 10 ** 3], [10 ** (-3), 10 ** 2], [10 ** (-3), 10 ** 2]]
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1, 10 ** (-3), 10 ** (-2)],
+                                    optimizer=MinimizeOptimizer(method='L-BFGS-B', bounds=bounds_1),
+                                    optimizations_number=10, regression_model=LinearRegression(), random_state=0)
+    a = AdaptiveKriging(distributions=marginals, runmodel_object=rmodel, surrogate=gpr,
+                        learning_nsamples=10 ** 3, n_add=1, learning_function=UFunction(u_stop=2),
+                        random_state=2, fixed_population=True)
+
+    # Record whether each cache update recomputed all predictions
+    fully_updated = []
+    update_predictions = a._update_predictions
+
+    def recording_update_predictions(*args, **kwargs):
+        result = update_predictions(*args, **kwargs)
+        fully_updated.append(a._fully_updated)
+        return result
+
+    a._update_predictions = recording_update_predictions
+    a.run(nsamples=30, samples=x.samples)
+
+    assert a.samples.shape[0] == 30
+    # With the default reoptimization_interval, the hyperparameters are held between re-optimizations
+    assert not all(fully_updated)
+    mean = gpr.predict(a.learning_set[a._candidates])
+    np.testing.assert_allclose(a._mean[a._candidates], mean.reshape(-1), atol=1e-6)
+
+
+@pytest.mark.parametrize("learning_function", [UFunction(u_stop=2), UFunction(u_stop=2, chunk_size=64, n_threads=2)])
+def test_akmcs_fixed_population_cache_hits(learning_function):
+    marginals = [Normal(loc=0., scale=4.), Normal(loc=0., scale=4.)]
+    x = MonteCarloSampling(distributions=marginals, nsamples=20, random_state=1)
+    model = PythonModel(model_script='series.py', model_object_name="series")
+    rmodel = RunModel(model=model)
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1, 1, 5], regression_model=LinearRegression())
+
+    # Count the predictions of the surrogate requested by the learning function and by the cache updates
+    calls = {"learning_function": 0, "updates": 0}
+    in_learning_function = [False]
+    predict, evaluate_function = gpr.predict, learning_function.evaluate_function
+
+    def counting_predict(points, return_std=False):
+        calls["learning_function" if in_learning_function[0] else "updates"] += 1
+        return predict(points, return_std)
+
+    def flagged_evaluate_function(*args, **kwargs):
+        in_learning_function[0] = True
+        try:
+            return evaluate_function(*args, **kwargs)
+        finally:
+            in_learning_function[0] = False
+
+    gpr.predict, learning_function.evaluate_function = counting_predict, flagged_evaluate_function
+    a = AdaptiveKriging(distributions=marginals, runmodel_object=rmodel, surrogate=gpr,
+                        learning_nsamples=10 ** 3, n_add=1, learning_function=learning_function,
+                        random_state=2, fixed_population=True)
+    a.run(nsamples=25, samples=x.samples)
+
+    assert a.samples.shape[0] == 25
+    assert calls["learning_function"] == 0
+    assert calls["updates"] > 0
+
+
+def test_akmcs_u_kriging_believer_batch():
+    marginals = [Normal(loc=0., scale=4.), Normal(loc=0., scale=4.)]
+    x = MonteCarloSampling(distributions=marginals, nsamples=20, random_state=1)
+    model = PythonModel(model_script='series.py', model_object_name="series")
+    rmodel = RunModel(model=model)
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1, 1, 5], regression_model=LinearRegression())
+    a = AdaptiveKriging(distributions=marginals, runmodel_object=rmodel, surrogate=gpr,
+                        learning_nsamples=10 ** 3, n_add=4, learning_function=UFunction(u_stop=2),
+                        random_state=2, fixed_population=True, batch_acquisition='kriging_believer')
+    a.run(nsamples=30, samples=x.samples)
+
+    assert a.samples.shape[0] == 30
+    assert len(rmodel.qoi_list) == 30
+    assert len(set(a.training_indices)) == 10
+    # Points of the same batch are not clustered on top of each other.
+    batch = a.samples[20:24]
+    distances = np.linalg.norm(batch[:, None, :] - batch[None, :, :], axis=2)
+    assert np.min(distances[np.triu_indices(4, 1)]) > 0.1
+
+
+def test_akmcs_resampled_batch_chunked_predictions():
+    marginals = [Normal(loc=0., scale=4.), Normal(loc=0., scale=4.)]
+    x = MonteCarloSampling(distributions=marginals, nsamples=20, random_state=1)
+    model = PythonModel(model_script='series.py', model_object_name="series")
+    rmodel = RunModel(model=model)
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1, 1, 5], regression_model=LinearRegression())
+    learning_function = UFunction(u_stop=2, chunk_size=64, n_threads=2)
+
+    # Record the number of points of each prediction of the surrogate
+    sizes = []
+    predict = gpr.predict
+
+    def recording_predict(points, return_std=False):
+        sizes.append(np.atleast_2d(points).shape[0])
+        return predict(points, return_std)
+
+    gpr.predict = recording_predict
+    a = AdaptiveKriging(distributions=marginals, runmodel_object=rmodel, surrogate=gpr,
+                        learning_nsamples=10 ** 3, n_add=2, learning_function=learning_function,
+                        random_state=2, batch_acquisition='kriging_believer')
+    a.run(nsamples=24, samples=x.samples)
+
+    assert a.samples.shape[0] == 24
+    assert len(sizes) > 0 and max(sizes) <= 64
+    mean, std = learning_function.predict_in_chunks(gpr, a.learning_set)
+    expected_mean, expected_std = predict(a.learning_set, True)
+    np.testing.assert_allclose(mean, expected_mean.reshape(-1))
+    np.testing.assert_allclose(std, expected_std.reshape(-1))
+
+
+def test_akmcs_constant_liar_batch_wrong_strategy():
+    marginals = [Normal(loc=0., scale=4.), Normal(loc=0., scale=4.)]
+    model = PythonModel(model_script='series.py', model_object_name="series")
+    rmodel = RunModel(model=model)
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1, 1, 5])
+    with pytest.raises(ValueError):
+        AdaptiveKriging(distributions=marginals, runmodel_object=rmodel, surrogate=gpr,
+                        learning_nsamples=10 ** 3, n_add=4, learning_function=UFunction(u_stop=2),
+                        batch_acquisition='liar')
+
+
+@pytest.mark.parametrize("noise", [False, True])
+def test_akmcs_batch_conditioning_matches_refit(noise):
+    marginals = [Normal(loc=0., scale=4.), Normal(loc=0., scale=4.)]
+    x = MonteCarloSampling(distributions=marginals, nsamples=20, random_state=1)
+    population = MonteCarloSampling(distributions=marginals, nsamples=200, random_state=3).samples
+    model = PythonModel(model_script='series.py', model_object_name="series")
+    rmodel = RunModel(model=model)
+    rmodel.run(samples=x.samples)
+    qoi = np.array(rmodel.qoi_list).reshape(-1)
+    hyperparameters = [1, 1, 5, 0.1] if noise else [1, 1, 5]
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=hyperparameters, noise=noise,
+                                    regression_model=LinearRegression())
+    gpr.fit(x.samples, qoi)
+    a = AdaptiveKriging(distributions=marginals, runmodel_object=rmodel, surrogate=gpr,
+                        learning_function=UFunction(u_stop=2), batch_acquisition='constant_liar')
+    a.samples, a.qoi = x.samples, list(qoi)
+
+    mean, std = gpr.predict(population, True)
+    mean, variance = mean.reshape(-1), std.reshape(-1) ** 2
+    fantasies = []
+    for row in [5, 17]:
+        mean, variance = a._condition(population, mean, variance, fantasies, row, a._liar_value())
+
+    # Refit of the surrogate with the fantasized observations at the limit state and fixed hyperparameters
+    refit = GaussianProcessRegression(kernel=RBF(), hyperparameters=hyperparameters, noise=noise,
+                                      regression_model=LinearRegression())
+    refit.fit(np.vstack([x.samples, population[[5, 17]]]), np.hstack([qoi, [0, 0]]))
+    refit_mean, refit_std = refit.predict(population, True)
+    np.testing.assert_allclose(mean, refit_mean.reshape(-1), atol=1e-6)
+    # The jitter of the factorization bounds the standard deviation at the training points by 1e-5
+    np.testing.assert_allclose(np.sqrt(variance), refit_std.reshape(-1), atol=1e-4)
+
+
+def test_akmcs_constant_liar_requires_liar_value():
+    marginals = [Normal(loc=0., scale=4.), Normal(loc=0., scale=4.)]
+    model = PythonModel(model_script='series.py', model_object_name="series")
+    rmodel = RunModel(model=model)
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1, 1, 5])
+    a = AdaptiveKriging(distributions=marginals, runmodel_object=rmodel, surrogate=gpr,
+                        learning_function=ExpectedImprovementGlobalFit(), batch_acquisition='constant_liar')
+    with pytest.raises(ValueError):
+        a._liar_value()
+    a.liar_value = 1.5
+    assert a._liar_value() == 1.5
+
+
+def test_learning_functions_chunked_evaluation():
+    marginals = [Normal(loc=0., scale=4.), Normal(loc=0., scale=4.)]
+    x = MonteCarloSampling(distributions=marginals, nsamples=20, random_state=1)
+    model = PythonModel(model_script='series.py', model_object_name="series")
+    rmodel = RunModel(model=model)
+    rmodel.run(samples=x.samples)
+    qoi = np.array(rmodel.qoi_list).reshape(-1)
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1, 1, 10], regression_model=LinearRegression())
+    gpr.fit(x.samples, qoi)
+    population = MonteCarloSampling(distributions=marginals, nsamples=1000, random_state=3).samples
+
+    for function, chunked in [(UFunction(u_stop=2), UFunction(u_stop=2, chunk_size=64, n_threads=4)),
+                              (WeightedUFunction(weighted_u_stop=2),
+                               WeightedUFunction(weighted_u_stop=2, chunk_size=64, n_threads=4)),
+                              (ExpectedFeasibility(), ExpectedFeasibility(chunk_size=64, n_threads=4)),
+                              (ExpectedImprovement(), ExpectedImprovement(chunk_size=64)),
+                              (ExpectedImprovementGlobalFit(), ExpectedImprovementGlobalFit(chunk_size=64))]:
+        new, values, indicator = function.evaluate_function(marginals, 3, gpr, population, qoi=list(qoi),
+                                                            samples=x.samples)
+        new_chunked, values_chunked, indicator_chunked = chunked.evaluate_function(
+            marginals, 3, gpr, population, qoi=list(qoi), samples=x.samples)
+        assert np.allclose(new, new_chunked)
+        assert np.allclose(values, values_chunked)
+        assert indicator == indicator_chunked
+
+
+def test_akmcs_cost_aware_variance_reduction():
+    from UQpy.distributions.collection import Uniform
+    from UQpy.surrogates.gaussian_process import MultiFidelityGaussianProcessRegression
+
+    marginals = [Uniform(loc=0., scale=1.)]
+    low_fidelity = RunModel(model=PythonModel(model_script='forrester.py', model_object_name="forrester_low"))
+    high_fidelity = RunModel(model=PythonModel(model_script='forrester.py', model_object_name="forrester_high"))
+    levels = [GaussianProcessRegression(kernel=RBF(), hyperparameters=[0.2, 5], regression_model=regression_model,
+                                        optimizer=MinimizeOptimizer(method='L-BFGS-B', bounds=[[0.01, 1], [0.1, 100]]),
+                                        random_state=0) for regression_model in [None, LinearRegression()]]
+    surrogate = MultiFidelityGaussianProcessRegression(surrogates=levels,
+                                                       runmodel_objects=[low_fidelity, high_fidelity], costs=[1, 20])
+    learning_function = CostAwareVarianceReduction()
+    a = AdaptiveKriging(distributions=marginals, runmodel_object=high_fidelity, surrogate=surrogate,
+                        learning_nsamples=200, n_add=1, learning_function=learning_function, random_state=2)
+    a.run(nsamples=6, samples=np.array([[0.], [0.5], [1.]]))
+
+    # The low fidelity model is evaluated at all points of the high fidelity model and at additional points
+    assert a.samples.shape[0] == 6
+    low_fidelity_samples = set(map(tuple, surrogate.samples[0].tolist()))
+    assert all(tuple(x) in low_fidelity_samples for x in a.samples.tolist())
+    assert len(low_fidelity_samples) > 6
+    assert np.allclose(surrogate.values[0], np.array(low_fidelity.qoi_list).reshape(-1))
+
+    # The learning function selects the points and fidelities, without evaluating the models
+    n_low = surrogate.samples[0].shape[0]
+    population = np.linspace(0, 1, 50).reshape(-1, 1)
+    new_samples, _, _ = learning_function.evaluate_function(marginals, 3, surrogate, population)
+    assert new_samples.shape == (3, 1)
+    assert learning_function.fidelities.shape == (3, )
+    assert surrogate.samples[0].shape[0] == n_low
+
+
+def test_akmcs_cost_aware_variance_reduction_bounded():
+    from UQpy.distributions.collection import Uniform
+    from UQpy.surrogates.gaussian_process import MultiFidelityGaussianProcessRegression
+
+    marginals = [Uniform(loc=0., scale=1.)]
+    for max_iterations, budget in [(4, None), (None, 5)]:
+        low_fidelity = RunModel(model=PythonModel(model_script='forrester.py', model_object_name="forrester_low"))
+        high_fidelity = RunModel(model=PythonModel(model_script='forrester.py', model_object_name="forrester_high"))
+        levels = [GaussianProcessRegression(kernel=RBF(), hyperparameters=[0.2, 5], regression_model=regression_model)
+                  for regression_model in [None, LinearRegression()]]
+        # The high fidelity model is so expensive that the low fidelity model is always preferred
+        surrogate = MultiFidelityGaussianProcessRegression(surrogates=levels,
+                                                           runmodel_objects=[low_fidelity, high_fidelity],
+                                                           costs=[1, 10 ** 8])
+        learning_function = CostAwareVarianceReduction(budget=budget)
+        a = AdaptiveKriging(distributions=marginals, runmodel_object=high_fidelity, surrogate=surrogate,
+                            learning_nsamples=200, n_add=1, learning_function=learning_function, random_state=2,
+                            max_iterations=max_iterations)
+        a.run(nsamples=6, samples=np.array([[0.], [0.5], [1.]]))
+
+        assert a.samples.shape[0] == 3
+        assert len(high_fidelity.qoi_list) == 3
+        assert len(low_fidelity.qoi_list) == (3 + 4 if budget is None else 3 + 5)
+        assert learning_function.cost == len(low_fidelity.qoi_list) - 3
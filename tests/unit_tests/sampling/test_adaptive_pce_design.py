@@ -0,0 +1,39 @@
+import numpy as np
+
+from UQpy.distributions.collection import Uniform
+from UQpy.run_model.RunModel import RunModel
+from UQpy.run_model.model_execution.PythonModel import PythonModel
+from UQpy.sampling.AdaptivePolynomialChaosDesign import AdaptivePolynomialChaosDesign
+from UQpy.surrogates import *
+
+
+def test_d_optimal_design():
+    """
+    The rank-updated least squares fit agrees with a full refit of the PCE
+    """
+    marginal = Uniform(loc=0., scale=1.)
+    rmodel = RunModel(model=PythonModel(model_script='forrester.py', model_object_name="forrester_high"))
+    pce = PolynomialChaosExpansion(TotalDegreeBasis(marginal, 12), LeastSquareRegression())
+    design = AdaptivePolynomialChaosDesign(distributions=[marginal], runmodel_object=rmodel, surrogate=pce,
+                                           learning_nsamples=500, n_add=4, target_error=0, random_state=1)
+    design.run(nsamples=30, initial_nsamples=8)
+
+    assert design.samples.shape == (30, 1)
+    assert len(design.errors) == 7
+    coefficients, error = pce.coefficients, design.errors[-1]
+    pce.fit(design.samples, np.array(design.qoi))
+    assert np.allclose(coefficients, pce.coefficients)
+    assert np.isclose(error, pce.leaveoneout_error(), rtol=1e-4)
+    assert error < 1e-6
+
+
+def test_coherence_design_target_error():
+    marginal = Uniform(loc=0., scale=1.)
+    rmodel = RunModel(model=PythonModel(model_script='forrester.py', model_object_name="forrester_high"))
+    pce = PolynomialChaosExpansion(TotalDegreeBasis(marginal, 12), LeastSquareRegression())
+    design = AdaptivePolynomialChaosDesign(distributions=[marginal], runmodel_object=rmodel, surrogate=pce,
+                                           samples=np.linspace(0.01, 0.99, 15).reshape(-1, 1), nsamples=60,
+                                           criterion="coherence", n_add=5, target_error=1e-4, random_state=0)
+
+    assert design.errors[-1] <= 1e-4
+    assert design.samples.shape[0] < 60
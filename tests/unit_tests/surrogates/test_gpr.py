@@ -220,6 +220,187 @@ def test_hyperparameters_length():
         gpr5 = GaussianProcessRegression(regression_model=constant_reg, kernel=RBF(), hyperparameters=[2.852, 2.959],
                                          random_state=1, optimizer=optimizer3, bounds=[[0.1, 5], [0.1, 3]], noise=True)
         gpr5.fit(samples=samples, values=values)
+
+
+def test_update_block_cholesky():
+    """
+        Adding points with fixed hyperparameters gives the same surrogate as fitting all points at once.
+    """
+    full = GaussianProcessRegression(regression_model=linear_reg, kernel=RBF(), hyperparameters=[0.3, 2.0],
+                                     normalize=False)
+    full.fit(samples=samples, values=values)
+    updated = GaussianProcessRegression(regression_model=linear_reg, kernel=RBF(), hyperparameters=[0.3, 2.0],
+                                        normalize=False)
+    updated.fit(samples=samples[:12], values=values[:12])
+    updated.update(samples[12:15], values[12:15])
+    updated.update(samples[15:], values[15:])
+    assert np.allclose(updated.cc, full.cc)
+    assert np.allclose(updated.alpha_, full.alpha_)
+    assert np.allclose(updated.beta, full.beta)
+
+
+def test_update_reoptimization_interval():
+    gpr6 = GaussianProcessRegression(kernel=RBF(), hyperparameters=[2.852, 2.959], optimizer=optimizer,
+                                     reoptimization_interval=3, random_state=1)
+    gpr6.fit(samples=samples[:10], values=values[:10])
+    hyperparameters = gpr6.hyperparameters.copy()
+    gpr6.update(samples[10:12], values[10:12])
+    assert np.array_equal(gpr6.hyperparameters, hyperparameters)
+    assert gpr6.samples.shape[0] == 12
+    gpr6.update(samples[12:13], values[12:13])
+    assert gpr6._points_since_optimization == 0
+    assert gpr6.samples.shape[0] == 13
+    gpr6.update(samples[13:17], values[13:17], reoptimize=False)
+    assert gpr6.samples.shape[0] == 17
+    assert gpr6._points_since_optimization == 4
+
+
+def test_predict_cached_factorization():
+    points = np.array([[0.3], [1.7], [4.1]])
+    mean, std = gpr2.predict(points, True)
+    k = gpr2.kernel.c(points, samples, gpr2.hyperparameters)
+    k_inv = np.linalg.inv(gpr2.K + 1e-10 * np.eye(samples.shape[0]))
+    variance = np.diag(gpr2.kernel.c(points, points, gpr2.hyperparameters) - k @ k_inv @ k.T)
+    assert np.allclose(mean, (k @ k_inv @ values).flatten())
+    assert np.allclose(std, np.sqrt(variance))
+
+    other_mean = gpr2.predict(points, False, hyperparameters=np.array([1., 1.]))
+    assert not np.allclose(other_mean, mean)
+    assert np.array_equal(gpr2.predict(points, True)[0], mean)
+
+
+def test_kernel_blocks():
+    x = np.random.RandomState(0).uniform(size=(50, 3))
+    s = np.random.RandomState(1).uniform(size=(40, 3))
+    params = np.array([0.5, 1., 2., 1.5])
+    for kernel, blocked in [(RBF(), RBF(memory_budget=2000, n_threads=3)),
+                            (Matern(nu=1.5), Matern(nu=1.5, memory_budget=2000, n_threads=3))]:
+        k = kernel.c(x, s, params)
+        assert np.allclose(blocked.c(x, s, params), k)
+        blocked.single_precision = True
+        assert np.allclose(blocked.c(x, s, params), k, atol=1e-5)
+
+
+def test_log_likelihood_gradient():
+    s = np.random.RandomState(0).uniform(size=(25, 2))
+    y = np.sin(3 * s[:, :1]) + s[:, 1:] ** 2
+    fx = linear_reg.r(s)
+    for kernel, noise in [(RBF(), False), (Matern(nu=0.5), True), (Matern(nu=1.5), False), (Matern(nu=2.5), True)]:
+        p0 = np.log10([0.1, 0.15, 1.2, 0.05]) if noise else np.log10([0.1, 0.15, 1.2])
+        value, gradient = GaussianProcessRegression.log_likelihood_and_gradient(p0, kernel, s, y, noise, fx)
+        assert np.isclose(value, GaussianProcessRegression.log_likelihood(p0, kernel, s, y, noise, fx))
+        step = 1e-6
+        finite_difference = [(GaussianProcessRegression.log_likelihood(p0 + step * e, kernel, s, y, noise, fx) -
+                              GaussianProcessRegression.log_likelihood(p0 - step * e, kernel, s, y, noise, fx)) /
+                             (2 * step) for e in np.eye(p0.shape[0])]
+        assert np.allclose(gradient, finite_difference, rtol=1e-5, atol=1e-5)
+
+
+def test_parallel_optimizations():
+    np.random.seed(3)
+    serial = GaussianProcessRegression(kernel=Matern(nu=1.5), hyperparameters=[10, 4], optimizer=optimizer1,
+                                       bounds=[[0.01, 100], [0.1, 10]], optimizations_number=4)
+    serial.fit(samples=samples, values=values)
+    np.random.seed(3)
+    parallel = GaussianProcessRegression(kernel=Matern(nu=1.5), hyperparameters=[10, 4], optimizer=optimizer1,
+                                         bounds=[[0.01, 100], [0.1, 10]], optimizations_number=4, ntasks=2)
+    parallel.fit(samples=samples, values=values)
+    assert np.allclose(serial.hyperparameters, parallel.hyperparameters)
+
+
+def test_leave_one_out():
+    """
+        The closed-form leave-one-out predictions match refitting the surrogate without each point.
+    """
+    rs = np.random.RandomState(0)
+    s = rs.uniform(0, 5, size=(15, 1))
+    y = np.cos(s) + 0.05 * rs.normal(size=(15, 1))
+    gpr7 = GaussianProcessRegression(kernel=RBF(), hyperparameters=[0.8, 1., 0.1], noise=True, normalize=False)
+    gpr7.fit(samples=s, values=y)
+    mean, variance, q2 = gpr7.leave_one_out()
+    for i in range(s.shape[0]):
+        rest = np.delete(np.arange(s.shape[0]), i)
+        refit = GaussianProcessRegression(kernel=RBF(), hyperparameters=[0.8, 1., 0.1], noise=True, normalize=False)
+        refit.fit(samples=s[rest], values=y[rest])
+        refit_mean, refit_std = refit.predict(s[i:i + 1], True)
+        assert np.isclose(mean[i, 0], refit_mean[0])
+        assert np.isclose(variance[i, 0], refit_std[0] ** 2 + 0.1 ** 2)
+    assert np.isclose(q2[0], 1 - np.sum((y - mean) ** 2) / np.sum((y - np.mean(y)) ** 2))
+
+
+def test_cross_validation():
+    gpr8 = GaussianProcessRegression(kernel=RBF(), regression_model=linear_reg, hyperparameters=[1.5, 1.])
+    gpr8.fit(samples=samples, values=values)
+    loo_mean, loo_variance, loo_q2 = gpr8.leave_one_out()
+    mean, variance, q2 = gpr8.cross_validation(samples.shape[0], random_state=1)
+    assert np.allclose(mean, loo_mean) and np.allclose(variance, loo_variance) and np.allclose(q2, loo_q2)
+
+    mean, _, q2 = gpr8.cross_validation(4, random_state=1)
+    folds = np.array_split(np.random.RandomState(1).permutation(samples.shape[0]), 4)
+    rest = np.setdiff1d(np.arange(samples.shape[0]), folds[0])
+    refit = GaussianProcessRegression(kernel=RBF(), regression_model=linear_reg, hyperparameters=[1.5, 1.],
+                                      normalize=False)
+    refit.fit(samples=samples[rest], values=values[rest])
+    assert np.allclose(mean[folds[0], 0], refit.predict(samples[folds[0]]), atol=1e-6)
+    assert q2[0] > 0.99
+
+
+def test_leave_one_out_objective():
+    gpr9 = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1., 1.],
+                                     optimizer=MinimizeOptimizer(method="L-BFGS-B", bounds=[[0.1, 5], [0.1, 3]]),
+                                     optimization_objective="leave_one_out", random_state=1)
+    gpr9.fit(samples=samples, values=values)
+    assert gpr9.leave_one_out()[2][0] > 0.99
+    with pytest.raises(ValueError):
+        GaussianProcessRegression(kernel=RBF(), hyperparameters=[1., 1.], optimization_objective="cv")
+
+
+def test_multiple_outputs():
+    """
+        Outputs sharing the kernel are fitted to the summed log-likelihood and predicted from one factorization.
+    """
+    s = np.random.RandomState(0).uniform(size=(20, 2))
+    y = np.hstack([np.sin(3 * s[:, :1]), s[:, 1:] ** 2, np.ones((20, 1))])
+    p0 = np.log10([0.3, 0.4, 1.2])
+    fx = linear_reg.r(s)
+    summed = sum(GaussianProcessRegression.log_likelihood(p0, RBF(), s, y[:, i:i + 1], False, fx) for i in range(3))
+    value, gradient = GaussianProcessRegression.log_likelihood_and_gradient(p0, RBF(), s, y, False, fx)
+    assert np.isclose(GaussianProcessRegression.log_likelihood(p0, RBF(), s, y, False, fx), summed)
+    assert np.isclose(value, summed)
+    step = 1e-6
+    finite_difference = [(GaussianProcessRegression.log_likelihood(p0 + step * e, RBF(), s, y, False, fx) -
+                          GaussianProcessRegression.log_likelihood(p0 - step * e, RBF(), s, y, False, fx)) /
+                         (2 * step) for e in np.eye(3)]
+    assert np.allclose(gradient, finite_difference, rtol=1e-5, atol=1e-5)
+
+    points = np.random.RandomState(1).uniform(size=(5, 2))
+    gpr10 = GaussianProcessRegression(kernel=RBF(), hyperparameters=[0.3, 0.4, 1.2], regression_model=linear_reg)
+    gpr10.fit(samples=s, values=y)
+    mean, std = gpr10.predict(points, True)
+    assert mean.shape == (5, 3) and std.shape == (5, 3)
+    for i in range(2):
+        single = GaussianProcessRegression(kernel=RBF(), hyperparameters=[0.3, 0.4, 1.2], regression_model=linear_reg)
+        single.fit(samples=s, values=y[:, i])
+        single_mean, single_std = single.predict(points, True)
+        assert np.allclose(mean[:, i], single_mean.flatten())
+        assert np.allclose(std[:, i], single_std)
+    assert np.allclose(mean[:, 2], 1)
+
+
+def test_save_load(tmp_path):
+    gpr11 = GaussianProcessRegression(kernel=Matern(nu=2.5), hyperparameters=[0.8, 1.5], regression_model=linear_reg)
+    gpr11.fit(samples=samples, values=values)
+    gpr11.save(tmp_path / "gpr")
+    loaded = GaussianProcessRegression.load(tmp_path / "gpr.npz")
+    assert loaded.values is None and loaded.optimizer is None
+    assert isinstance(loaded.kernel, Matern) and loaded.kernel.nu == 2.5
+    points = np.linspace(0.1, 4.9, 7).reshape(-1, 1)
+    mean, std = gpr11.predict(points, True)
+    loaded_mean, loaded_std = loaded.predict(points, True)
+    assert np.array_equal(mean, loaded_mean) and np.array_equal(std, loaded_std)
+    assert np.array_equal(GaussianProcessRegression.load(tmp_path / "gpr.npz", mmap_mode=None).predict(points), mean)
+    with pytest.raises(RuntimeError):
+        loaded.predict(points, hyperparameters=[1., 1.])
 #
 #
 # def test_jacobian():
@@ -426,4 +607,22 @@ def test_hyperparameters_length():
 #     # Put a legend to the right of the current axis
 #     ax.legend(loc='center left', bbox_to_anchor=(1, 0.5))
 #     plt.grid()
-#     plt.show()
\ No newline at end of file
+#     plt.show()
+
+
+@pytest.mark.parametrize("kernel", [RBF(), Matern(nu=2.5), Matern(nu=0.5)])
+def test_single_precision_predict(kernel):
+    s = np.random.RandomState(0).uniform(size=(40, 2)) + 100
+    y = np.sin(3 * s[:, :1]) + s[:, 1:] ** 2
+    gpr = GaussianProcessRegression(kernel=kernel, hyperparameters=[0.3, 0.5, 1.], normalize=True,
+                                    regression_model=linear_reg)
+    gpr.fit(s, y)
+    points = np.vstack([s[:5], np.random.RandomState(1).uniform(size=(100, 2)) + 100])
+    mean, std = gpr.predict(points, True)
+    mean32, std32 = gpr.predict(points, True, dtype=np.float32)
+    assert mean32.dtype == np.float32 and std32.dtype == np.float32
+    assert np.allclose(mean32, mean, rtol=1e-4, atol=1e-4 * np.max(np.abs(mean)))
+    assert np.all(np.isfinite(std32))
+    assert np.allclose(std32, std, atol=1e-3 * np.max(std))
+    assert np.allclose(kernel.c(points, s, gpr.hyperparameters, dtype=np.float32),
+                       kernel.c(points, s, gpr.hyperparameters), atol=1e-5)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from UQpy.utilities.MinimizeOptimizer import MinimizeOptimizer
+from UQpy.surrogates.gaussian_process import GaussianProcessRegression, GradientEnhancedGaussianProcessRegression
+from UQpy.surrogates.gaussian_process.kernels import RBF, Matern
+from UQpy.surrogates.gaussian_process.regression_models import LinearRegression
+
+
+def function(x):
+    return np.sin(2 * x[:, 0]) + x[:, 1] ** 2 + np.cos(x[:, 2]) * x[:, 0]
+
+
+def gradient(x):
+    return np.stack([2 * np.cos(2 * x[:, 0]) + np.cos(x[:, 2]), 2 * x[:, 1], -np.sin(x[:, 2]) * x[:, 0]], axis=1)
+
+
+random_state = np.random.RandomState(0)
+samples = random_state.uniform(-1, 1, size=(15, 3))
+points = random_state.uniform(-1, 1, size=(200, 3))
+hyperparameters = [0.7, 0.8, 0.9, 1.3]
+
+
+@pytest.mark.parametrize("kernel", [RBF(), Matern(nu=2.5)])
+def test_input_derivatives(kernel):
+    params = np.array(hyperparameters)
+    x, s = samples[:4], samples[4:7]
+    k, g, h = kernel.c_with_input_derivatives(x, s, params)
+    assert np.allclose(k, kernel.c(x, s, params))
+    step = 1e-5
+    shift = step * np.eye(3)
+    # d k / d s_j = G D_j and d2 k / d x_i d s_j = G delta_ij / l_i^2 - H D_i D_j
+    for i, j in [(0, 0), (0, 2), (1, 2)]:
+        d_i = (x[:, i:i + 1] - s[:, i]) / params[i] ** 2
+        d_j = (x[:, j:j + 1] - s[:, j]) / params[j] ** 2
+        first = (kernel.c(x, s + shift[j], params) - kernel.c(x, s - shift[j], params)) / (2 * step)
+        assert np.allclose(first, g * d_j, atol=1e-6)
+        second = (kernel.c(x + shift[i], s + shift[j], params) - kernel.c(x + shift[i], s - shift[j], params) -
+                  kernel.c(x - shift[i], s + shift[j], params) + kernel.c(x - shift[i], s - shift[j], params)) \
+            / (4 * step ** 2)
+        assert np.allclose(second, g * (i == j) / params[i] ** 2 - h * d_i * d_j, atol=1e-4)
+
+
+def test_interpolates_values_and_gradients():
+    gegpr = GradientEnhancedGaussianProcessRegression(kernel=RBF(), hyperparameters=hyperparameters)
+    gegpr.fit(samples, function(samples), gradient(samples))
+    assert np.allclose(gegpr.predict(samples).flatten(), function(samples), atol=1e-6)
+    step = 1e-5
+    finite_difference = np.stack([(gegpr.predict(samples + step * e) - gegpr.predict(samples - step * e)).flatten()
+                                  / (2 * step) for e in np.eye(3)], axis=1)
+    assert np.allclose(finite_difference, gradient(samples), atol=1e-5)
+
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=hyperparameters, normalize=False)
+    gpr.fit(samples, function(samples))
+    error = np.sqrt(np.mean((gegpr.predict(points).flatten() - function(points)) ** 2))
+    assert error < 0.5 * np.sqrt(np.mean((gpr.predict(points).flatten() - function(points)) ** 2))
+
+
+def test_conjugate_gradient():
+    direct = GradientEnhancedGaussianProcessRegression(kernel=Matern(nu=2.5), hyperparameters=hyperparameters,
+                                                       regression_model=LinearRegression(), normalize=True)
+    direct.fit(samples, function(samples), gradient(samples))
+    iterative = GradientEnhancedGaussianProcessRegression(kernel=Matern(nu=2.5), hyperparameters=hyperparameters,
+                                                          regression_model=LinearRegression(), normalize=True,
+                                                          solver="conjugate_gradient", tolerance=1e-10)
+    iterative.fit(samples, function(samples), gradient(samples))
+    assert iterative.cc is None
+    mean, std = direct.predict(points[:20], True)
+    iterative_mean, iterative_std = iterative.predict(points[:20], True)
+    assert np.allclose(mean, iterative_mean, atol=1e-6)
+    assert np.allclose(std, iterative_std, atol=1e-5)
+
+
+def test_optimization():
+    gegpr = GradientEnhancedGaussianProcessRegression(kernel=RBF(), hyperparameters=hyperparameters,
+                                                      optimizer=MinimizeOptimizer(), optimizations_number=3,
+                                                      random_state=0)
+    gegpr.fit(samples, function(samples), gradient(samples))
+    assert np.sqrt(np.mean((gegpr.predict(points).flatten() - function(points)) ** 2)) < 0.05
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        GradientEnhancedGaussianProcessRegression(kernel=Matern(nu=1.5), hyperparameters=hyperparameters)
+    with pytest.raises(ValueError):
+        GradientEnhancedGaussianProcessRegression(kernel=RBF(), hyperparameters=hyperparameters, solver="lu")
@@ -0,0 +1,101 @@
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+from UQpy.utilities.MinimizeOptimizer import MinimizeOptimizer
+from UQpy.surrogates.gaussian_process import GaussianProcessRegression, MultiFidelityGaussianProcessRegression
+from UQpy.surrogates.gaussian_process.kernels import RBF
+from UQpy.surrogates.gaussian_process.regression_models import LinearRegression
+
+
+# The Forrester functions are shared with the multi-fidelity tests of AdaptiveKriging
+spec = importlib.util.spec_from_file_location(
+    "forrester", os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sampling", "forrester.py"))
+forrester = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(forrester)
+high_fidelity, low_fidelity = forrester.forrester_high, forrester.forrester_low
+
+
+samples_low = np.linspace(0, 1, 11).reshape(-1, 1)
+samples_high = samples_low[[0, 4, 6, 10]]
+points = np.linspace(0, 1, 101).reshape(-1, 1)
+
+
+def level(regression_model=None, normalize=False):
+    optimizer = MinimizeOptimizer(method="L-BFGS-B", bounds=[[0.01, 1], [0.1, 100]])
+    return GaussianProcessRegression(kernel=RBF(), hyperparameters=[0.2, 5], optimizer=optimizer,
+                                     regression_model=regression_model, normalize=normalize, random_state=0)
+
+
+def test_forrester():
+    multi_fidelity = MultiFidelityGaussianProcessRegression(surrogates=[level(), level(LinearRegression())])
+    multi_fidelity.fit([samples_low, samples_high], [low_fidelity(samples_low), high_fidelity(samples_high)])
+    assert np.isclose(multi_fidelity.rho[0], 2, atol=1e-2)
+
+    mean, std = multi_fidelity.predict(samples_high, return_std=True)
+    assert np.allclose(mean, high_fidelity(samples_high), atol=1e-4)
+    assert np.all(std < 1e-2)
+
+    single_fidelity = level(LinearRegression())
+    single_fidelity.fit(samples_high, high_fidelity(samples_high))
+    error = np.sqrt(np.mean((multi_fidelity.predict(points) - high_fidelity(points)) ** 2))
+    single_fidelity_error = np.sqrt(np.mean((single_fidelity.predict(points) - high_fidelity(points)) ** 2))
+    assert error < 0.1 * single_fidelity_error
+
+
+def test_normalized_levels():
+    multi_fidelity = MultiFidelityGaussianProcessRegression(
+        surrogates=[level(normalize=True), level(LinearRegression(), normalize=True)])
+    multi_fidelity.fit([samples_low, samples_high], [low_fidelity(samples_low), high_fidelity(samples_high)])
+    assert np.isclose(multi_fidelity.rho[0], 2, atol=1e-2)
+    assert np.allclose(multi_fidelity.predict(samples_high), high_fidelity(samples_high), atol=1e-4)
+
+    with pytest.raises(ValueError):
+        MultiFidelityGaussianProcessRegression(surrogates=[level(), level(normalize=True)])
+
+
+def test_variance_decomposition():
+    samples_middle = samples_low[::2]
+    multi_fidelity = MultiFidelityGaussianProcessRegression(
+        surrogates=[level(), level(LinearRegression()), level(LinearRegression())])
+    multi_fidelity.fit([samples_low, samples_middle, samples_high],
+                       [low_fidelity(samples_low), 0.5 * (low_fidelity(samples_middle) + high_fidelity(samples_middle)),
+                        high_fidelity(samples_high)])
+    contributions = multi_fidelity.variance_decomposition(points)
+    mean, std = multi_fidelity.predict(points, return_std=True)
+    assert contributions.shape == (101, 3)
+    assert np.all(contributions >= 0)
+    assert np.allclose(np.sum(contributions, axis=1), std ** 2)
+
+    # The mean of the highest fidelity is predicted by the surrogate of the last level
+    assert np.allclose(mean, multi_fidelity.surrogates[2].predict(points))
+
+
+def test_surrogates_are_copied():
+    surrogates = [level(), level(LinearRegression())]
+    multi_fidelity = MultiFidelityGaussianProcessRegression(surrogates=surrogates)
+    multi_fidelity.fit([samples_low, samples_high], [low_fidelity(samples_low), high_fidelity(samples_high)])
+    assert isinstance(surrogates[1].regression_model, LinearRegression)
+    assert surrogates[0].samples is None and surrogates[1].samples is None
+
+
+def test_update_highest_fidelity():
+    # Without RunModel objects, the lower fidelity is unchanged and only the highest fidelity is updated
+    multi_fidelity = MultiFidelityGaussianProcessRegression(surrogates=[level(), level(LinearRegression())])
+    multi_fidelity.fit([samples_low, samples_high[:3]], [low_fidelity(samples_low), high_fidelity(samples_high[:3])])
+    hyperparameters = [surrogate.hyperparameters.copy() for surrogate in multi_fidelity.surrogates]
+    multi_fidelity.surrogates[1].reoptimization_interval = None
+    multi_fidelity.update(samples_high[3:], high_fidelity(samples_high[3:]))
+    assert np.array_equal(multi_fidelity.surrogates[0].hyperparameters, hyperparameters[0])
+    assert np.array_equal(multi_fidelity.surrogates[1].hyperparameters, hyperparameters[1])
+
+    # The block update equals a fit with the same hyperparameters
+    fitted = MultiFidelityGaussianProcessRegression(
+        surrogates=[GaussianProcessRegression(kernel=RBF(), hyperparameters=list(hyperparameters[0])),
+                    GaussianProcessRegression(kernel=RBF(), hyperparameters=list(hyperparameters[1]),
+                                              regression_model=LinearRegression())])
+    fitted.fit([samples_low, samples_high], [low_fidelity(samples_low), high_fidelity(samples_high)])
+    assert np.allclose(multi_fidelity.predict(points), fitted.predict(points))
+    assert np.isclose(multi_fidelity.rho[0], fitted.rho[0])
@@ -382,3 +382,345 @@ def test_21():
 
     assert all((np.argwhere(np.round(pce2_lar_sens.calculate_generalized_total_order_indices(), 3) > 0)
                 == [[0], [2], [3]]))
+
+
+def test_save_load(tmp_path):
+    """
+    A saved PCE is loaded as a predict-only object with identical predictions
+    """
+    joint = JointIndependent(marginals=[Uniform(loc=0, scale=10), Normal(loc=1, scale=2)])
+    x_2d = joint.rvs(30, random_state=1)
+    y_2d = np.stack([x_2d[:, 0] * np.sin(x_2d[:, 0]) / 10 + x_2d[:, 1] ** 2, x_2d[:, 0] * x_2d[:, 1]], axis=1)
+    pce_2d = PolynomialChaosExpansion(polynomial_basis=TotalDegreeBasis(joint, 3),
+                                      regression_method=LeastSquareRegression())
+    pce_2d.fit(x_2d, y_2d)
+    pce_2d.save(tmp_path / "pce.npz")
+    loaded = PolynomialChaosExpansion.load(tmp_path / "pce.npz")
+    assert loaded.experimental_design_input is None
+    x_new = joint.rvs(20, random_state=2)
+    assert np.array_equal(loaded.predict(x_new), pce_2d.predict(x_new))
+    assert np.allclose(loaded.get_moments(), pce_2d.get_moments())
+
+
+def test_single_precision_predict():
+    """
+    Single precision predictions agree with double precision predictions up to rounding
+    """
+    joint = JointIndependent(marginals=[Uniform(loc=0, scale=10), Normal(loc=1, scale=2)])
+    x_2d = joint.rvs(30, random_state=1)
+    y_2d = x_2d[:, 0] * np.sin(x_2d[:, 0]) / 10 + x_2d[:, 1] ** 2
+    pce_2d = PolynomialChaosExpansion(polynomial_basis=TotalDegreeBasis(joint, 3),
+                                      regression_method=LeastSquareRegression())
+    pce_2d.fit(x_2d, y_2d)
+    x_new = joint.rvs(50, random_state=2)
+    prediction = pce_2d.predict(x_new, dtype=np.float32)
+    assert prediction.dtype == np.float32
+    assert np.allclose(prediction, pce_2d.predict(x_new), rtol=1e-5, atol=1e-5)
+
+
+def test_tensorized_design_matrix():
+    """
+    The design matrix assembled from the univariate recurrence tables equals the product of the chaos polynomials
+    """
+    joint = JointIndependent(marginals=[Uniform(loc=0, scale=10), Normal(loc=1, scale=2), Uniform(loc=-1, scale=2)])
+    basis = TotalDegreeBasis(joint, 7)
+    x_3d = joint.rvs(40, random_state=1)
+    expected = np.stack([polynomial.evaluate(x_3d) for polynomial in basis.polynomials], axis=1)
+    basis.memory_budget = 2000
+    design_matrix = basis.evaluate_basis(x_3d)
+    assert np.allclose(design_matrix, expected, rtol=1e-10, atol=1e-10)
+    assert np.allclose(basis.evaluate_basis(x_3d, dtype=np.float32), expected, rtol=1e-5, atol=1e-4)
+
+    basis.multi_index_set = basis.multi_index_set[::3]
+    basis.polynomials_number = len(basis.multi_index_set)
+    assert np.allclose(basis.evaluate_basis(x_3d), expected[:, ::3], rtol=1e-10, atol=1e-10)
+    assert len(basis.polynomials) == basis.polynomials_number
+
+
+def test_provided_polynomials_design_matrix():
+    """
+    Polynomials provided to the basis are evaluated as given, rather than gathered from the recurrence tables
+    """
+    from UQpy.surrogates.polynomial_chaos.polynomials.PolynomialsND import PolynomialsND
+    from UQpy.surrogates.polynomial_chaos.polynomials.baseclass.PolynomialBasis import PolynomialBasis
+    joint = JointIndependent(marginals=[Uniform(loc=0, scale=10), Normal(loc=1, scale=2)])
+    multi_index_set = np.array([[0, 0], [1, 0], [0, 1]])
+    # Scaled polynomials, which are not the chaos polynomials of the multi-index set
+    polynomials = [PolynomialsND(joint, multi_index) for multi_index in multi_index_set]
+    evaluate = polynomials[1].evaluate
+    polynomials[1].evaluate = lambda x, dtype=np.float64: 2 * evaluate(x, dtype=dtype)
+    basis = PolynomialBasis(2, 3, multi_index_set, polynomials, joint)
+    x_2d = joint.rvs(20, random_state=1)
+    expected = np.stack([polynomial.evaluate(x_2d) for polynomial in polynomials], axis=1)
+    assert np.allclose(basis.evaluate_basis(x_2d), expected)
+
+
+def test_fit_streaming(tmp_path):
+    """
+    Streaming fit from chunks of memory-mapped arrays agrees with the fit on the whole experimental design
+    """
+    joint = JointIndependent(marginals=[Uniform(loc=0, scale=10), Normal(loc=1, scale=2)])
+    x_2d = joint.rvs(200, random_state=1)
+    y_2d = np.stack([x_2d[:, 0] * np.sin(x_2d[:, 0]) / 10 + x_2d[:, 1] ** 2, x_2d[:, 0] * x_2d[:, 1]], axis=1)
+    np.save(tmp_path / "x.npy", x_2d)
+    np.save(tmp_path / "y.npy", y_2d)
+    x_map, y_map = np.load(tmp_path / "x.npy", mmap_mode="r"), np.load(tmp_path / "y.npy", mmap_mode="r")
+
+    def chunks():
+        return ((x_map[i:i + 64], y_map[i:i + 64]) for i in range(0, x_map.shape[0], 64))
+
+    pce_2d = PolynomialChaosExpansion(polynomial_basis=TotalDegreeBasis(joint, 4),
+                                      regression_method=LeastSquareRegression())
+    pce_2d.fit(x_2d, y_2d)
+    streaming = PolynomialChaosExpansion(polynomial_basis=TotalDegreeBasis(joint, 4),
+                                         regression_method=LeastSquareRegression())
+    streaming.fit_streaming(chunks())
+    assert streaming.design_matrix is None
+    assert streaming.outputs_number == 2
+    assert np.allclose(streaming.coefficients, pce_2d.coefficients, rtol=1e-8, atol=1e-8)
+    assert np.allclose(streaming.leaveoneout_error(chunks()), pce_2d.leaveoneout_error(), atol=1e-6)
+
+    # The closed-form ridge solution agrees with the gradient descent of RidgeRegression.run, which fits an
+    # unpenalized bias
+    ridge = PolynomialChaosExpansion(polynomial_basis=TotalDegreeBasis(joint, 2),
+                                     regression_method=RidgeRegression(penalty=0.5))
+    ridge.fit_streaming(chunks())
+    ridge_fit = PolynomialChaosExpansion(polynomial_basis=TotalDegreeBasis(joint, 2),
+                                         regression_method=RidgeRegression(penalty=0.5, iterations=100000))
+    ridge_fit.fit(x_2d, y_2d)
+    assert np.allclose(ridge.coefficients[0], 0)
+    assert np.allclose(ridge.coefficients[1:], ridge_fit.coefficients[1:], atol=1e-4)
+    # The gradient descent converges slowly in the direction of the constant polynomial and the bias
+    assert np.allclose(ridge.predict(x_2d), ridge_fit.predict(x_2d), atol=1e-3)
+    assert np.allclose(ridge.get_moments()[0], ridge_fit.get_moments()[0], atol=1e-3)
+
+    with pytest.raises(TypeError):
+        PolynomialChaosExpansion(polynomial_basis=TotalDegreeBasis(joint, 4),
+                                 regression_method=LassoRegression()).fit_streaming(chunks())
+
+
+def test_lasso_path_regression():
+    """
+    Coordinate descent along the regularization path agrees with the LASSO solution of scikit-learn
+    """
+    from sklearn.linear_model import Lasso
+
+    joint = JointIndependent(marginals=[Uniform(loc=-1, scale=2) for _ in range(3)])
+    random_state = np.random.RandomState(1)
+    x_3d, x_val = random_state.uniform(-1, 1, (200, 3)), random_state.uniform(-1, 1, (500, 3))
+
+    def model(x_):
+        return np.stack([np.sin(np.pi * x_[:, 0]) + 0.5 * x_[:, 1] ** 3, x_[:, 0] * x_[:, 2]], axis=1)
+
+    y_3d = model(x_3d)
+    for criterion in ["loo", 4]:
+        lasso_path = LassoPathRegression(criterion=criterion, tolerance=1e-10)
+        pce_3d = PolynomialChaosExpansion(polynomial_basis=TotalDegreeBasis(joint, 5), regression_method=lasso_path)
+        pce_3d.fit(x_3d, y_3d)
+        assert pce_3d.coefficients.shape == (56, 2) and pce_3d.bias.shape == (1, 2)
+        assert lasso_path.errors.shape == (50, 2)
+        for output in range(2):
+            reference = Lasso(alpha=lasso_path.penalty[output], tol=1e-12, max_iter=100000)
+            reference.fit(pce_3d.design_matrix, y_3d[:, output])
+            assert np.allclose(pce_3d.coefficients[:, output], reference.coef_, atol=1e-6)
+            assert np.isclose(pce_3d.bias[0, output], reference.intercept_, atol=1e-6)
+        assert np.max(pce_3d.validation_error(x_val, model(x_val))) < 1e-2
+
+
+def test_hybrid_least_squares_leaveoneout():
+    """
+    Leave-one-out errors updated by QR column insertion agree with the errors of the refitted PCE
+    """
+    from UQpy.surrogates.polynomial_chaos.regressions.LeastAngleRegression import _HybridLeastSquares
+
+    hybrid = _HybridLeastSquares(pce_2.design_matrix, y_2)
+    for size, removed in [(1, None), (5, None), (12, None), (12, 3)]:
+        mask = np.zeros(pce_2.polynomials_number, dtype=bool)
+        mask[:size] = True
+        if removed is not None:
+            mask[removed] = False
+        hybrid.update(mask)
+        pce = PolynomialChaosExpansion(polynomial_basis=TotalDegreeBasis(joint, 6),
+                                       regression_method=LeastSquareRegression())
+        pce.polynomial_basis.multi_index_set = pce.multi_index_set = pce_2.multi_index_set[mask]
+        pce.polynomial_basis.polynomials_number = int(np.sum(mask))
+        pce.fit(x_2, y_2)
+        assert np.isclose(hybrid.leaveoneout_error(), pce.leaveoneout_error(), atol=2e-7)
+
+
+def test_higher_moments_quadrature():
+    """
+    Skewness and kurtosis from the linearization of the PCE agree with their tensor Gauss quadrature
+    """
+    joint = JointIndependent(marginals=[Uniform(loc=0, scale=1), Normal(loc=1, scale=2)])
+    basis = TotalDegreeBasis(joint, 3)
+    pce_2d = PolynomialChaosExpansion(polynomial_basis=basis, regression_method=LeastSquareRegression())
+    pce_2d.coefficients = np.random.RandomState(1).randn(basis.polynomials_number, 2)
+    pce_2d.coefficients[4] = 0
+    pce_2d.outputs_number = 2
+    mean, variance, skewness, kurtosis = pce_2d.get_moments(higher=True)
+
+    legendre_nodes, legendre_weights = np.polynomial.legendre.leggauss(10)
+    hermite_nodes, hermite_weights = np.polynomial.hermite_e.hermegauss(10)
+    nodes = np.stack(np.meshgrid((legendre_nodes + 1) / 2, 1 + 2 * hermite_nodes, indexing="ij"), axis=-1)
+    weights = np.outer(legendre_weights / 2, hermite_weights / np.sqrt(2 * np.pi)).reshape(-1, 1)
+    deviations = pce_2d.predict(nodes.reshape(-1, 2)) - mean
+    assert np.allclose(variance, np.sum(weights * deviations ** 2, axis=0))
+    assert np.allclose(skewness, np.sum(weights * deviations ** 3, axis=0) / variance ** 1.5)
+    assert np.allclose(kurtosis, np.sum(weights * deviations ** 4, axis=0) / variance ** 2)
+
+
+def test_adaptive_pce():
+    """
+    The adaptive basis recovers a sparse polynomial model with an interaction of degree 4
+    """
+    joint = JointIndependent(marginals=[Uniform(loc=-1, scale=2) for _ in range(5)])
+    rs = np.random.RandomState(2)
+    x, x_val = rs.uniform(-1, 1, (80, 5)), rs.uniform(-1, 1, (500, 5))
+    model = lambda x_: 1 + x_[:, 0] + 0.5 * x_[:, 1] ** 3 * x_[:, 2] - 0.2 * x_[:, 3] ** 2
+    pce_adaptive = AdaptivePolynomialChaosExpansion(joint, max_degree=6)
+    pce_adaptive.fit(x, model(x))
+    assert pce_adaptive.validation_error(x_val, model(x_val)) < 1e-8
+    assert pce_adaptive.polynomials_number < 20
+    assert max(degree for degree, q in pce_adaptive.bases) >= 4
+
+
+def test_orthonormal_polynomials():
+    """
+    Recurrence coefficients of arbitrary distributions agree with the classical families
+    """
+    from UQpy.distributions import Gamma, Beta, Lognormal
+    polynomials = Polynomials.get_polynomials_class(Gamma(a=3., loc=0., scale=2.))(6, Gamma(a=3., loc=0., scale=2.))
+    assert isinstance(polynomials, OrthonormalPolynomials)
+    assert Polynomials.get_polynomials_class(Uniform()) is Legendre
+
+    # Generalized Laguerre polynomials, a_k = 2k + alpha + 1, b_k = k (k + alpha), of the standardized variable
+    a, b = polynomials.recurrence_coefficients(15)
+    k, alpha = np.arange(15), 2
+    assert np.allclose(a * polynomials.std + polynomials.mean, 2 * (2 * k + alpha + 1))
+    assert np.allclose(b[1:] * polynomials.std ** 2, 4 * k[1:] * (k[1:] + alpha))
+
+    # Chebyshev polynomials of the first kind, with a singular density at both ends
+    arcsine = Beta(a=0.5, b=0.5, loc=-1., scale=2.)
+    a, b = OrthonormalPolynomials(10, arcsine).recurrence_coefficients(10)
+    assert np.allclose(a, 0) and np.allclose(b[2:] / 2, 0.25) and np.isclose(b[1] / 2, 0.5)
+
+    lognormal = Lognormal(s=0.4, loc=0., scale=1.)
+    nodes, weights = np.polynomial.hermite_e.hermegauss(60)
+    x = np.exp(0.4 * nodes)
+    table = OrthonormalPolynomials(4, lognormal).evaluate_table(x, 4)
+    assert np.allclose(table.T @ (weights[:, None] * table) / np.sqrt(2 * np.pi), np.eye(5))
+    assert np.allclose(OrthonormalPolynomials(4, lognormal).evaluate(x), table[:, -1])
+
+
+def test_orthonormal_polynomials_pce():
+    from UQpy.distributions import Gamma, Beta
+    joint = JointIndependent(marginals=[Gamma(a=2., loc=0., scale=1.), Beta(a=2., b=5., loc=0., scale=1.)])
+    rs = np.random.RandomState(3)
+    x = np.column_stack([rs.gamma(2., size=60), rs.beta(2., 5., size=60)])
+    model = lambda x_: 1 + x_[:, 0] ** 2 * x_[:, 1] - 3 * x_[:, 1] ** 3
+    pce_arbitrary = PolynomialChaosExpansion(TotalDegreeBasis(joint, 3), LeastSquareRegression())
+    pce_arbitrary.fit(x, model(x))
+    mean, variance = pce_arbitrary.get_moments()
+
+    samples = np.column_stack([rs.gamma(2., size=400000), rs.beta(2., 5., size=400000)])
+    assert pce_arbitrary.validation_error(samples[:1000], model(samples[:1000])) < 1e-12
+    assert np.isclose(mean, np.mean(model(samples)), rtol=5e-3)
+    assert np.isclose(variance, np.var(model(samples)), rtol=2e-2)
+
+
+def test_pod_pce(tmp_path):
+    """
+    The POD-PCE of a field with a low-rank structure matches the PCE of all nodes
+    """
+    joint = JointIndependent(marginals=[Uniform(loc=-1, scale=2) for _ in range(3)])
+    rs = np.random.RandomState(4)
+    nodes = np.linspace(0, 1, 2000)
+    model = lambda x_: (1 + x_[:, [0]] * np.sin(np.pi * nodes) + x_[:, [1]] ** 2 * np.cos(3 * nodes)
+                        + x_[:, [0]] * x_[:, [2]] * nodes ** 2)
+    x, x_val = rs.uniform(-1, 1, (40, 3)), rs.uniform(-1, 1, (20, 3))
+    pce_full = PolynomialChaosExpansion(TotalDegreeBasis(joint, 2), LeastSquareRegression())
+    pce_full.fit(x, model(x))
+    full_mean, full_variance = pce_full.get_moments()
+    full_sensitivity = PceSensitivity(pce_full)
+    full_sensitivity.run()
+
+    for method in ["snapshot", "direct", "randomized"]:
+        pod_pce = PODPolynomialChaosExpansion(PolynomialChaosExpansion(TotalDegreeBasis(joint, 2),
+                                                                       LeastSquareRegression()),
+                                              reconstruction_percentage=99.99, method=method, random_state=1)
+        pod_pce.fit(x, model(x))
+        assert pod_pce.modes_number == 3
+        assert np.allclose(pod_pce.modes.T @ pod_pce.modes, np.eye(3))
+        assert np.allclose(pod_pce.predict(x_val), model(x_val))
+        assert np.allclose(pod_pce.predict(x_val, nodes=[5, 1500]), model(x_val)[:, [5, 1500]])
+        mean, variance = pod_pce.get_moments(nodes=slice(100, 200))
+        assert np.allclose(mean, full_mean[100:200]) and np.allclose(variance, full_variance[100:200])
+        assert np.allclose(pod_pce.calculate_first_order_indices(), full_sensitivity.first_order_indices)
+        assert np.allclose(pod_pce.calculate_total_order_indices(nodes=[7]),
+                           full_sensitivity.total_order_indices[:, [7]])
+
+    pod_pce.save(tmp_path / "pod_pce.npz")
+    loaded = Surrogate.load(tmp_path / "pod_pce.npz")
+    assert np.allclose(loaded.predict(x_val, nodes=np.arange(10)), pod_pce.predict(x_val, nodes=np.arange(10)))
+
+    # The settings of the decomposition and of the regression are restored, such that the loaded model can be refitted
+    assert (loaded.method, loaded.reconstruction_percentage_input) == ("randomized", 99.99)
+    loaded.fit(x_val, model(x_val))
+    pod_pce.fit(x_val, model(x_val))
+    assert loaded.modes_number == pod_pce.modes_number
+    assert np.allclose(loaded.predict(x), pod_pce.predict(x))
+
+
+def test_pce_sensitivity_interactions():
+    """
+    Second order and interaction indices of a polynomial model, and indices of a subset of the outputs
+    """
+    joint = JointIndependent(marginals=[Uniform(loc=-1, scale=2) for _ in range(4)])
+    rs = np.random.RandomState(5)
+    x = rs.uniform(-1, 1, (100, 4))
+    weights = np.array([1, 2, 3])
+    model = lambda x_: (x_[:, [0]] + x_[:, [0]] * x_[:, [1]] + x_[:, [1]] * x_[:, [2]] * x_[:, [3]]) * weights \
+        + x_[:, [3]] ** 2 * weights[::-1]
+    pce_interactions = PolynomialChaosExpansion(TotalDegreeBasis(joint, 3), LeastSquareRegression())
+    pce_interactions.fit(x, model(x))
+    sensitivity = PceSensitivity(pce_interactions)
+    sensitivity.run(estimate_second_order=True)
+
+    # Partial variances of the orthonormal Legendre polynomials, Var[x] = 1/3 and Var[x^2] = 4/45
+    variances = np.array([1 / 3 + 1 / 9 + 1 / 27, 1 / 3 + 1 / 9 + 1 / 27, 1 / 3 + 1 / 9 + 1 / 27]) * weights ** 2 \
+        + 4 / 45 * weights[::-1] ** 2
+    assert np.allclose(sensitivity.first_order_indices[0], weights ** 2 / 3 / variances)
+    assert np.allclose(sensitivity.first_order_indices[3], 4 / 45 * weights[::-1] ** 2 / variances)
+    assert np.allclose(sensitivity.second_order_indices[0], weights ** 2 / 9 / variances)
+    assert np.allclose(sensitivity.second_order_indices[1:], 0)
+    assert np.allclose(sensitivity.total_order_indices[1], (1 / 9 + 1 / 27) * weights ** 2 / variances)
+    terms, indices = sensitivity.calculate_interaction_indices(3)
+    assert np.array_equal(terms, [[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]])
+    assert np.allclose(indices[:3], 0) and np.allclose(indices[3], weights ** 2 / 27 / variances)
+    assert np.allclose(sensitivity.calculate_interaction_indices(2)[1][0], sensitivity.second_order_indices[0])
+
+    first_order, total_order = sensitivity.first_order_indices, sensitivity.total_order_indices
+    assert np.allclose(sensitivity.calculate_total_order_indices(outputs=[2]), total_order[:, [2]])
+    generalized = sensitivity.calculate_generalized_first_order_indices(outputs=slice(0, 2))
+    assert np.allclose(generalized, np.sum(first_order[:, :2] * variances[:2], axis=1) / np.sum(variances[:2]))
+
+
+def test_pod_pce_default_truncation():
+    """
+    Without a number of modes or reconstruction percentage, the modes of numerically vanishing singular values are
+    discarded and the retained modes are orthonormal
+    """
+    joint = JointIndependent(marginals=[Uniform(loc=-1, scale=2) for _ in range(3)])
+    rs = np.random.RandomState(0)
+    nodes = np.linspace(0, 1, 200)
+    x = rs.uniform(-1, 1, (300, 3))
+    y_field = 1 + x[:, [0]] * np.sin(np.pi * nodes) + x[:, [1]] ** 2 * np.cos(3 * nodes) + x[:, [2]] * nodes ** 2
+    for method in ["snapshot", "direct", "randomized"]:
+        pod_pce = PODPolynomialChaosExpansion(PolynomialChaosExpansion(TotalDegreeBasis(joint, 2),
+                                                                       LeastSquareRegression()),
+                                              method=method, random_state=1)
+        pod_pce.fit(x, y_field)
+        assert pod_pce.modes_number == 3
+        assert np.allclose(pod_pce.modes.T @ pod_pce.modes, np.eye(3), atol=1e-12)
+        assert np.isclose(pod_pce.reconstruction_percentage, 100)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from UQpy.utilities.MinimizeOptimizer import MinimizeOptimizer
+from UQpy.surrogates.gaussian_process import GaussianProcessRegression, SparseGaussianProcessRegression
+from UQpy.surrogates.gaussian_process.kernels import RBF, Matern
+from UQpy.surrogates.gaussian_process.regression_models import LinearRegression, ConstantRegression
+
+random_state = np.random.RandomState(0)
+samples = random_state.uniform(0, 5, size=(60, 1))
+values = np.cos(samples)
+points = np.linspace(0, 5, 9).reshape(-1, 1)
+
+
+def test_inducing_points_at_samples():
+    """
+        With the training points as inducing points, the VFE approximation coincides with the exact GP.
+    """
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1., 1., 0.1], noise=True,
+                                    regression_model=LinearRegression())
+    gpr.fit(samples, values)
+    sparse = SparseGaussianProcessRegression(kernel=RBF(), hyperparameters=[1., 1., 0.1], inducing_points=samples,
+                                             regression_model=LinearRegression())
+    sparse.fit(samples, values)
+    mean, std = gpr.predict(points, True)
+    sparse_mean, sparse_std = sparse.predict(points, True)
+    assert np.allclose(mean, sparse_mean, atol=1e-6)
+    assert np.allclose(std, sparse_std, atol=1e-6)
+
+
+def test_batches():
+    sparse = SparseGaussianProcessRegression(kernel=Matern(nu=1.5), hyperparameters=[1., 1., 0.1],
+                                             inducing_points_number=10, approximation="FITC", random_state=1)
+    sparse.fit(samples, values)
+    batched = SparseGaussianProcessRegression(kernel=Matern(nu=1.5), hyperparameters=[1., 1., 0.1],
+                                              inducing_points_number=10, approximation="FITC", batch_size=7,
+                                              random_state=1)
+    batched.fit(samples, values)
+    assert np.allclose(sparse.predict(points, True), batched.predict(points, True))
+
+
+def test_greedy_variance_optimization():
+    x = random_state.uniform(0, 1, size=(2000, 2))
+    y = np.sin(6 * x[:, 0]) * np.cos(4 * x[:, 1])
+    sparse = SparseGaussianProcessRegression(kernel=Matern(nu=2.5), hyperparameters=[0.3, 0.3, 1., 0.05],
+                                             inducing_points_number=40, inducing_method="greedy_variance",
+                                             regression_model=ConstantRegression(), optimizer=MinimizeOptimizer(),
+                                             optimization_samples_number=500, batch_size=500, random_state=2)
+    sparse.fit(x, y)
+    test_points = random_state.uniform(0, 1, size=(100, 2))
+    prediction, std = sparse.predict(test_points, True)
+    assert sparse.inducing_points.shape == (40, 2)
+    exact = np.sin(6 * test_points[:, 0]) * np.cos(4 * test_points[:, 1])
+    assert np.sqrt(np.mean((prediction.ravel() - exact) ** 2)) < 0.05
+    assert std.shape == (100, )
+
+
+def test_wrong_inducing_method():
+    with pytest.raises(ValueError):
+        SparseGaussianProcessRegression(kernel=RBF(), hyperparameters=[1., 1., 0.1], inducing_method="random")